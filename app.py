@@ -1,16 +1,53 @@
 # app.py
+# Se importa primero para medir el costo de las demás importaciones
+from app.services.startup import startup_report, warm_up
+
+import os
+
 from flask import Flask
 
-from app.controllers.api_controller import solve, explain_result, get_history_item
-from app.controllers.view_controller import index_view, history_view
+from app.controllers.api_controller import (solve, solve_stream, solve_batch, explain_result, get_history_item,
+                                            continue_history_item, list_history, get_plot, get_metrics, start_timing,
+                                            finish_timing, stop_timing, compress_response)
+from app.controllers.view_controller import index_view, history_view, history_manager
+from app.models.history import create_history_storage
+from app.services.metrics import metrics
+from app.services.pipeline import pipeline
+from app.services.plot_cache import plot_cache
+from app.services.result_cache import result_cache
+from app.services.solver import SOLVER_METHODS
+from app.services.supervisor import supervisor, batch_supervisor
+from app.services.serialization import AppJSONProvider
 from config import config
 
+startup_report.mark("imports")
+
 # Crear la aplicación Flask
 app = Flask(__name__, static_folder='static', template_folder='templates')
+app.json = AppJSONProvider(app)
 
 # Cargar configuración
 app_config = config['development']
 app.config.from_object(app_config)
+history_manager.configure(create_history_storage(app.config))
+plot_cache.configure(app.config['PLOT_CACHE_MAX_BYTES'], app.config['PLOT_CACHE_DIR'],
+                     app.config['PLOT_CACHE_DISK_MAX_BYTES'])
+result_cache.configure(app.config['RESULT_CACHE_MAX_ITEMS'], app.config['RESULT_CACHE_MAX_BYTES'],
+                       app.config['RESULT_CACHE_TTL'])
+metrics.configure(app.config['METRICS_WINDOW'], SOLVER_METHODS)
+supervisor.configure(app.config['SOLVE_WORKERS'])
+batch_supervisor.configure(app.config['BATCH_WORKERS'] or os.cpu_count())
+pipeline.configure(app.config['PIPELINE_THREADS'], app.config['PLOT_PRERENDER_WORKERS'],
+                   app.config['PLOT_PRERENDER_MAX_PENDING'])
+startup_report.mark("configure")
+
+# Medición de etapas por petición (cabecera Server-Timing y /api/metrics)
+app.before_request(start_timing)
+app.after_request(finish_timing)
+app.teardown_request(stop_timing)
+
+# Compresión de las respuestas (se registra después para que su tiempo entre en el total)
+app.after_request(compress_response)
 
 # Rutas de vista
 app.add_url_rule('/', view_func=index_view)
@@ -18,8 +55,21 @@ app.add_url_rule('/history', view_func=history_view)
 
 # Rutas de API
 app.add_url_rule('/api/solve', view_func=solve, methods=['POST'])
+app.add_url_rule('/api/solve/stream', view_func=solve_stream, methods=['POST'])
+app.add_url_rule('/api/solve/batch', view_func=solve_batch, methods=['POST'])
 app.add_url_rule('/api/explain', view_func=explain_result, methods=['POST'])
+app.add_url_rule('/api/history', view_func=list_history)
 app.add_url_rule('/api/history/<int:id>', view_func=get_history_item)
+app.add_url_rule('/api/history/<int:id>/continue', view_func=continue_history_item, methods=['POST'])
+app.add_url_rule('/api/plot/<calc_id>.png', view_func=get_plot)
+app.add_url_rule('/api/metrics', view_func=get_metrics)
+
+# Calentar el proceso antes de que atienda la primera petición. Los procesos de trabajo
+# (forkserver/spawn) vuelven a importar este módulo como __mp_main__: ahí no se calienta
+if __name__ != '__mp_main__':
+    if app.config['WARMUP']:
+        warm_up(workers=app.config['WARMUP_WORKERS'], timeout=app.config['WARMUP_TIMEOUT'])
+    app.logger.info(startup_report.summary())
 
 if __name__ == '__main__':
     app.run(debug=True)
\ No newline at end of file
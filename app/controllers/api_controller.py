@@ -1,106 +1,250 @@
 # controllers/api_controller.py
-from flask import request, jsonify
-import sympy as sp
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import request, jsonify, current_app, Response, stream_with_context, g
 
 from app.controllers.view_controller import history_manager
-from app.numerical_methods.bisection import bisection_method
-from app.numerical_methods.false_position import false_position_method
-from app.numerical_methods.fixed_point import fixed_point_method
-from app.numerical_methods.newton_raphson import newton_raphson_method
-from app.numerical_methods.secant import secant_method
+from app.models.history import new_calc_id
+from app.numerical_methods.utils import compile_cache_stats
 from app.services.explanation import generate_explanation
-from app.services.plotting import generate_plot, generate_plot_data
+from app.services.metrics import metrics, timed, start_request_timer, stop_request_timer
+from app.services.pipeline import pipeline
+from app.services.plot_cache import plot_cache
+from app.services.plotting import plot_cache_key, render_plot, SYSTEM_METHODS
+from app.services.result_cache import result_cache
+from app.services.solver import (cached_solve, supervised_solve, supervised_continue, supervised_stream,
+                                problem_key, plot_params, plot_points, solution_window, solution_payload,
+                                error_payload, response_sections)
+from app.services.startup import startup_report, HEAVY_MODULES
+from app.services.supervisor import supervisor, batch_supervisor, WorkerTimeout
+from app.services.transport import (packb, compress, content_encodings, is_compressible, MSGPACK_MIMETYPES)
 
 
 # Importamos el history_manager desde view_controller para compartir la instancia
 
 
+def plot_url(calc_id):
+    return f"/api/plot/{calc_id}.png"
+
+
+def respond(payload, status=200):
+    """Responde en JSON o, si el cliente lo pide (Accept o ?format=msgpack), en MessagePack"""
+    wants_msgpack = request.args.get('format') == 'msgpack' or (
+        request.accept_mimetypes.best_match(('application/json',) + MSGPACK_MIMETYPES) in MSGPACK_MIMETYPES)
+    if wants_msgpack:
+        body = packb(payload, float32=request.args.get('precision') == 'float32')
+        response = Response(body, status=status, mimetype=MSGPACK_MIMETYPES[0])
+    else:
+        response = jsonify(payload)
+        response.status_code = status
+    response.vary.add('Accept')
+    return response
+
+
+def plot_spec(method, func_str, parameters, root, results):
+    """Parámetros y clave de caché de la imagen de un cálculo (los mismos en /api/solve y en /api/plot)"""
+    params = plot_params(method, parameters)
+    params.update(window=solution_window(method, parameters, root, results), max_points=plot_points(parameters))
+    return params, plot_cache_key(func_str, method, root, **params)
+
+
+def prerender_plot(method, func_str, parameters, root, results):
+    """Encola el dibujo anticipado de la imagen de un cálculo (no bloquea)"""
+    if current_app.config.get('PLOT_PRERENDER', True) and method not in SYSTEM_METHODS:
+        params, key = plot_spec(method, func_str, parameters, root, results)
+        pipeline.prerender(key, func_str, method, root=root, **params)
+
+
+def list_option(data, name):
+    """Lee una opción de lista (fields, include) de la URL o del cuerpo: "a,b" o ["a", "b"]"""
+    value = request.args.get(name)
+    if value is None and isinstance(data, dict):
+        value = data.get(name)
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(',') if item.strip()]
+    return list(value)
+
+
+def solve_budget(data):
+    """Plazo (segundos) y presupuesto de evaluaciones: los pedidos, acotados por los de la configuración"""
+    timeout = current_app.config.get('SOLVE_TIMEOUT')
+    max_evaluations = current_app.config.get('SOLVE_MAX_EVALUATIONS')
+
+    if isinstance(data, dict):
+        if data.get('timeout') is not None:
+            requested = float(data['timeout'])
+            timeout = requested if timeout is None else min(timeout, requested)
+        if data.get('max_evaluations') is not None:
+            requested = int(data['max_evaluations'])
+            max_evaluations = requested if max_evaluations is None else min(max_evaluations, requested)
+    return timeout, max_evaluations
+
+
 def solve():
     data = request.json
-    method = data.get('method')
-    func_str = data.get('function')
 
     try:
-        # Parámetros comunes para todos los métodos
-        tol = float(data.get('tolerance', 1e-6))
-        max_iter = int(data.get('max_iterations', 100))
-
-        # Verificar si la función es válida
-        x = sp.Symbol('x')
-        sp.sympify(func_str)
-
-        result = {}
-        animation_data = []
-
-        if method == "bisection":
-            a = float(data.get('a'))
-            b = float(data.get('b'))
-            result = bisection_method(func_str, a, b, tol, max_iter)
-            plot_img = generate_plot(func_str, method, a=a, b=b, root=result.get('root'))
-            plot_data = generate_plot_data(func_str, method, a=a, b=b, root=result.get('root'),
-                                           iterations=result.get("results"))
-            animation_data = result.get("animation_points", [])
-
-        elif method == "false_position":
-            a = float(data.get('a'))
-            b = float(data.get('b'))
-            result = false_position_method(func_str, a, b, tol, max_iter)
-            plot_img = generate_plot(func_str, method, a=a, b=b, root=result.get('root'))
-            plot_data = generate_plot_data(func_str, method, a=a, b=b, root=result.get('root'),
-                                           iterations=result.get("results"))
-            animation_data = result.get("animation_points", [])
-
-        elif method == "fixed_point":
-            x0 = float(data.get('x0'))
-            g_func_str = data.get('g_function')
-            result = fixed_point_method(func_str, g_func_str, x0, tol, max_iter)
-            plot_img = generate_plot(func_str, method, x0=x0, root=result.get('root'), g_func_str=g_func_str)
-            plot_data = generate_plot_data(func_str, method, x0=x0, root=result.get('root'), g_func_str=g_func_str,
-                                           iterations=result.get("results"))
-            animation_data = result.get("animation_points", [])
-
-        elif method == "newton_raphson":
-            x0 = float(data.get('x0'))
-            result = newton_raphson_method(func_str, x0, tol, max_iter)
-            plot_img = generate_plot(func_str, method, x0=x0, root=result.get('root'))
-            plot_data = generate_plot_data(func_str, method, x0=x0, root=result.get('root'),
-                                           iterations=result.get("results"))
-            animation_data = result.get("animation_points", [])
-
-        elif method == "secant":
-            x0 = float(data.get('x0'))
-            x1 = float(data.get('x1'))
-            result = secant_method(func_str, x0, x1, tol, max_iter)
-            plot_img = generate_plot(func_str, method, x0=x0, x1=x1, root=result.get('root'))
-            plot_data = generate_plot_data(func_str, method, x0=x0, x1=x1, root=result.get('root'),
-                                           iterations=result.get("results"))
-            animation_data = result.get("animation_points", [])
+        fields = list_option(data, 'fields')
+        include = response_sections(fields, list_option(data, 'include'))
+        timeout, max_evaluations = solve_budget(data)
 
-        else:
-            return jsonify({"error": "Método no válido"})
+        # Los problemas idénticos ya resueltos se sirven desde la caché sin tocar sympy
+        solution, cache_hit = cached_solve(data, include_plot="plot_data" in include,
+                                           timeout=timeout, max_evaluations=max_evaluations)
+
+        if "error" in solution:
+            return respond(error_payload(solution, fields))
 
-        if "error" in result:
-            return jsonify({"error": result["error"]})
+        if not cache_hit:
+            metrics.record_evaluations(data.get('method'), solution["results"].last("evaluations"))
 
-        # Agregar al historial
-        calc_id = history_manager.add_calculation(
-            method, func_str, data, result.get("root"),
-            result.get("results"), plot_img, plot_data
+        # Etapas concurrentes: el historial se guarda en un hilo y la imagen se dibuja
+        # en el pool de procesos mientras aquí se serializa la respuesta
+        calc_id = new_calc_id()
+        stored = pipeline.submit(
+            history_manager.add_calculation, data.get('method'), data.get('function'), data,
+            solution["root"], solution["results"], None, solution["plot_data"], calc_id=calc_id
         )
+        prerender_plot(data.get('method'), data.get('function'), data, solution["root"], solution["results"])
+
+        with timed("serialize"):
+            payload = solution_payload(solution, fields, include)
+            response = respond({"calc_id": calc_id, "plot_url": plot_url(calc_id), **payload})
 
-        return jsonify({
-            "calc_id": calc_id,
-            "results": result.get("results", []),
-            "root": result.get("root"),
-            "plot_img": plot_img,
-            "plot_data": plot_data,
-            "animation_data": animation_data
-        })
+        # La respuesta sale cuando el cálculo ya está en el historial (plot_url debe funcionar)
+        with timed("history"):
+            stored.result()
+
+        response.headers['X-Cache'] = 'HIT' if cache_hit else 'MISS'
+        return response
 
     except Exception as e:
         return jsonify({"error": str(e)})
 
 
+def solve_stream():
+    data = request.json
+    timeout, max_evaluations = solve_budget(data)
+    use_sse = (request.args.get('format') == 'sse'
+               or request.accept_mimetypes.best == 'text/event-stream')
+
+    def encode(event):
+        payload = json.dumps(event)
+        if use_sse:
+            return f"event: {event['type']}\ndata: {payload}\n\n"
+        return payload + "\n"
+
+    def generate():
+        plot_data = None
+
+        try:
+            # Con plazo el método corre en un proceso supervisado que se termina al vencer
+            for event in supervised_stream(data, max_evaluations, timeout):
+                if event["type"] == "plot":
+                    plot_data = event["plot_data"]
+                elif event["type"] == "done":
+                    # Guardar en el historial el cálculo completo, como en /api/solve
+                    event = dict(event)
+                    trace = event.pop("trace")
+                    metrics.record_evaluations(data.get('method'), trace.last("evaluations"))
+                    if plot_data is not None and "error" not in plot_data:
+                        plot_data = dict(plot_data, root=event["root"])
+                    calc_id = history_manager.add_calculation(
+                        data.get('method'), data.get('function'), data, event["root"],
+                        trace, None, plot_data
+                    )
+                    prerender_plot(data.get('method'), data.get('function'), data, event["root"], trace)
+                    event.update(calc_id=calc_id, plot_url=plot_url(calc_id))
+
+                yield encode(event)
+        except Exception as e:
+            yield encode({"type": "error", "error": str(e)})
+
+    mimetype = 'text/event-stream' if use_sse else 'application/x-ndjson'
+    response = Response(stream_with_context(generate()), mimetype=mimetype)
+    response.headers['Cache-Control'] = 'no-cache'
+    # Evitar que proxies como nginx acumulen la respuesta antes de enviarla
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+
+def solve_batch():
+    data = request.json or {}
+    problems = data.get('problems')
+
+    if not isinstance(problems, list) or not problems:
+        return jsonify({"error": "Se requiere una lista de problemas no vacía"}), 400
+
+    max_problems = current_app.config.get('BATCH_MAX_PROBLEMS', 500)
+    if len(problems) > max_problems:
+        return jsonify({"error": f"El lote supera el máximo de {max_problems} problemas"}), 400
+
+    try:
+        fields = list_option(data, 'fields')
+        include = response_sections(fields, list_option(data, 'include'))
+        timeout, max_evaluations = solve_budget(data)
+    except (TypeError, ValueError) as e:
+        return jsonify({"error": str(e)}), 400
+
+    include_plot = bool(data.get('include_plot', True)) and "plot_data" in include
+    deadline = time.monotonic() + current_app.config.get('BATCH_TIMEOUT', 60)
+
+    # Repartir entre los procesos supervisados solo los problemas que no están en caché; cada
+    # uno respeta el presupuesto de evaluaciones y su proceso se termina al vencer su plazo
+    # (el de /api/solve) o el del lote, lo que llegue antes
+    keys = [problem_key(problem, include_plot) if isinstance(problem, dict) else None for problem in problems]
+    cached = [result_cache.get(key) if key else None for key in keys]
+
+    def run(problem):
+        remaining = max(0.0, deadline - time.monotonic())
+        return supervised_solve(problem, include_plot, remaining if timeout is None else min(timeout, remaining),
+                                max_evaluations, workers=batch_supervisor)
+
+    with ThreadPoolExecutor(max_workers=batch_supervisor.workers) as executor:
+        futures = [executor.submit(run, problem) if solution is None else None
+                   for problem, solution in zip(problems, cached)]
+
+        items = []
+        for index, (problem, future) in enumerate(zip(problems, futures)):
+            # Un problema que falla o tarda demasiado no invalida el resto del lote
+            try:
+                if future is None:
+                    solution = cached[index]
+                else:
+                    solution = future.result()
+                    if keys[index] and not solution.get("partial"):
+                        result_cache.put(keys[index], solution)
+                    if "error" not in solution:
+                        metrics.record_evaluations(problem.get('method'), solution["results"].last("evaluations"))
+            except Exception as e:
+                solution = {"error": str(e)}
+
+            if "error" not in solution:
+                try:
+                    payload = solution_payload(solution, fields, include)
+                except ValueError as e:
+                    solution = {"error": str(e)}
+
+            if "error" in solution:
+                try:
+                    items.append({"index": index, **error_payload(solution, fields)})
+                except ValueError as e:
+                    items.append({"index": index, "error": str(e)})
+                continue
+
+            calc_id = history_manager.add_calculation(
+                problem.get('method'), problem.get('function'), problem, solution["root"],
+                solution["results"], None, solution["plot_data"]
+            )
+            items.append({"index": index, "calc_id": calc_id, "plot_url": plot_url(calc_id), **payload})
+
+    return respond({"results": items})
+
+
 def explain_result():
     data = request.json
     calc_id = data.get('calc_id')
@@ -127,5 +271,172 @@ def explain_result():
 def get_history_item(id):
     item = history_manager.get_by_id(id)
     if item:
-        return jsonify(item)
-    return jsonify({"error": "Elemento de historial no encontrado"}), 404
\ No newline at end of file
+        return respond(item)
+    return jsonify({"error": "Elemento de historial no encontrado"}), 404
+
+
+def continue_history_item(id):
+    """Continúa un cálculo del historial (tolerance y/o max_iterations nuevos) sin repetir sus iteraciones.
+
+    Se guarda como un cálculo nuevo (continued_from) y la respuesta trae solo
+    las iteraciones nuevas; el resumen es el de la traza completa.
+    """
+    item = history_manager.get_by_id(id)
+    if not item:
+        return jsonify({"error": "Elemento de historial no encontrado"}), 404
+
+    data = request.get_json(silent=True) or {}
+    try:
+        fields = list_option(data, 'fields')
+        include = response_sections(fields, list_option(data, 'include'))
+        timeout, max_evaluations = solve_budget(data)
+
+        # Solo se calculan las iteraciones nuevas, en un proceso supervisado que se termina al vencer el plazo
+        solution = supervised_continue(item, data, include_plot="plot_data" in include, timeout=timeout,
+                                       max_evaluations=max_evaluations)
+        if "error" in solution:
+            return respond(error_payload(solution, fields))
+
+        method, func_str, parameters = item.get('method'), item.get('function'), solution["data"]
+        trace = solution["results"]
+        if len(trace) > solution["start"]:
+            metrics.record_evaluations(method, trace.last("evaluations") - trace[solution["start"] - 1]["evaluations"])
+
+        calc_id = new_calc_id()
+        stored = pipeline.submit(
+            history_manager.add_calculation, method, func_str, parameters, solution["root"], trace, None,
+            solution["plot_data"], calc_id=calc_id
+        )
+        prerender_plot(method, func_str, parameters, solution["root"], trace)
+
+        with timed("serialize"):
+            payload = solution_payload(solution, fields, include, start=solution["start"])
+            response = respond({"calc_id": calc_id, "plot_url": plot_url(calc_id), "continued_from": id,
+                                "new_iterations": len(trace) - solution["start"], **payload})
+
+        with timed("history"):
+            stored.result()
+        return response
+
+    except Exception as e:
+        return jsonify({"error": str(e)})
+
+
+def list_history():
+    page = request.args.get('page', 1, type=int)
+    per_page = request.args.get('per_page', 20, type=int)
+    method = request.args.get('method') or None
+    search = request.args.get('q') or None
+
+    return jsonify(history_manager.get_page(page, per_page, method=method, search=search))
+
+
+def get_plot(calc_id):
+    item = history_manager.get_by_calc_id(calc_id)
+    if not item:
+        return jsonify({"error": "Cálculo no encontrado"}), 404
+    if item.get('method') in SYSTEM_METHODS:
+        return jsonify({"error": "Los sistemas de ecuaciones no tienen gráfica"}), 404
+
+    try:
+        params, key = plot_spec(item.get('method'), item.get('function'), item.get('parameters'), item.get('root'),
+                                item.get('results'))
+
+        # El ETag depende solo de las entradas: si el cliente ya tiene la imagen no se dibuja nada
+        if key in request.if_none_match:
+            png = b''
+        else:
+            png = plot_cache.get(key)
+            if png is None:
+                # Si /api/solve ya la encoló, esperar ese dibujo en lugar de repetirlo
+                with timed("render_wait"):
+                    png = pipeline.rendered(key, current_app.config.get('PLOT_TIMEOUT'))
+            if png is None:
+                # Con PLOT_TIMEOUT la imagen se dibuja en un proceso supervisado que se termina al vencer el plazo
+                timeout = current_app.config.get('PLOT_TIMEOUT')
+                with timed("render"):
+                    if timeout is None:
+                        png = render_plot(item.get('function'), item.get('method'), root=item.get('root'), **params)
+                    else:
+                        png = supervisor.run(render_plot, item.get('function'), item.get('method'),
+                                             root=item.get('root'), timeout=timeout, **params)
+                plot_cache.put(key, png)
+
+        response = Response(png, mimetype='image/png')
+        response.set_etag(key)
+        response.cache_control.public = True
+        response.cache_control.max_age = current_app.config.get('PLOT_CACHE_MAX_AGE', 86400)
+        response.cache_control.immutable = True
+        return response.make_conditional(request)
+
+    except WorkerTimeout as e:
+        return jsonify({"error": f"Error al generar la gráfica: {str(e)}"}), 504
+    except Exception as e:
+        return jsonify({"error": f"Error al generar la gráfica: {str(e)}"}), 500
+
+
+def start_timing():
+    """Abre el temporizador de etapas de la petición (before_request)"""
+    g.request_timer, g.request_timer_token = start_request_timer()
+
+
+def finish_timing(response):
+    """Publica las etapas en Server-Timing y las agrega a las métricas (after_request)"""
+    timer = g.get('request_timer')
+    if timer is None or request.endpoint == 'static':
+        return response
+
+    total = timer.total()
+    if current_app.config.get('SERVER_TIMING', True):
+        response.headers['Server-Timing'] = timer.server_timing(total)
+
+    data = request.get_json(silent=True) if request.is_json else None
+    method = data.get('method') if isinstance(data, dict) else None
+    metrics.record_request(request.endpoint, method, response.status_code, timer, total)
+    return response
+
+
+def compress_response(response):
+    """Comprime con gzip (o brotli, si está instalado) las respuestas grandes que el cliente acepte comprimidas"""
+    min_size = current_app.config.get('COMPRESS_MIN_SIZE')
+    if (min_size is None or response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers or not is_compressible(response.mimetype or '')):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    encoding = request.accept_encodings.best_match(content_encodings())
+    if encoding is None or response.content_length is None or response.content_length < min_size:
+        return response
+
+    with timed("compress"):
+        response.set_data(compress(response.get_data(), encoding, current_app.config.get('COMPRESS_LEVEL', 6)))
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+
+def stop_timing(exc=None):
+    token = g.pop('request_timer_token', None)
+    if token is not None:
+        stop_request_timer(token)
+
+
+def get_metrics():
+    """Métricas en formato de texto de Prometheus"""
+    gauges = []
+    for cache, stats in (("result", result_cache.stats()), ("plot", plot_cache.stats()),
+                         ("compile", compile_cache_stats())):
+        gauges.extend(("numerical_cache_stat", (("cache", cache), ("stat", stat)), value)
+                      for stat, value in stats.items() if isinstance(value, (int, float)))
+    gauges.extend(("numerical_history_stat", (("stat", stat),), value)
+                  for stat, value in history_manager.stats().items() if isinstance(value, (int, float)))
+    gauges.extend(("numerical_supervisor_stat", (("stat", stat),), value)
+                  for stat, value in supervisor.stats().items())
+    gauges.extend(("numerical_pipeline_stat", (("stat", stat),), value)
+                  for stat, value in pipeline.stats().items())
+    gauges.extend(("numerical_startup_seconds", (("phase", phase),), seconds)
+                  for phase, seconds in startup_report.phases.items())
+    loaded = startup_report.heavy_modules()
+    gauges.extend(("numerical_startup_heavy_module_loaded", (("module", module),), int(module in loaded))
+                  for module in HEAVY_MODULES)
+
+    return Response(metrics.render(gauges), mimetype='text/plain; version=0.0.4')
@@ -11,5 +11,5 @@ def index_view():
     return render_template('index.html')
 
 def history_view():
-    """Renderiza la página de historial"""
-    return render_template('history.html', history=history_manager.get_all())
+    """Renderiza la página de historial (los elementos se cargan por páginas desde /api/history)"""
+    return render_template('history.html')
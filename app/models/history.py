@@ -2,34 +2,66 @@
 import uuid
 from datetime import datetime
 
+from app.models.storage import MemoryHistoryStorage, SQLiteHistoryStorage
+
+# Tamaño máximo de página al listar el historial
+MAX_PER_PAGE = 100
+
+
+def create_history_storage(config):
+    """Crea el backend de almacenamiento del historial según la configuración"""
+    if config.get('HISTORY_BACKEND') == 'sqlite':
+        return SQLiteHistoryStorage(config['HISTORY_DATABASE'], max_items=config.get('HISTORY_MAX_ITEMS'))
+    return MemoryHistoryStorage(max_items=config.get('HISTORY_MAX_ITEMS'),
+                                max_bytes=config.get('HISTORY_MAX_BYTES'))
+
+
+def new_calc_id():
+    return str(uuid.uuid4())
+
+
 class HistoryManager:
-    def __init__(self):
-        self.history = []
+    def __init__(self, storage=None):
+        self.storage = storage or MemoryHistoryStorage()
 
-    def add_calculation(self, method, func_str, parameters, root, results, plot_img, plot_data):
-        calc_id = str(uuid.uuid4())
+    def configure(self, storage):
+        """Cambia el backend de almacenamiento (memoria, SQLite...)"""
+        self.storage = storage
+
+    def add_calculation(self, method, func_str, parameters, root, results, plot_img, plot_data, calc_id=None):
+        """Guarda un cálculo y devuelve su calc_id (se puede generar antes con new_calc_id)"""
+        calc_id = calc_id or new_calc_id()
         history_item = {
-            "id": len(self.history),
             "calc_id": calc_id,
             "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "method": method,
             "function": func_str,
             "parameters": parameters,
             "root": root,
-            "results": results,
-            "plot_img": plot_img,
-            "plot_data": plot_data
+            "results": results
         }
-        self.history.append(history_item)
+        self.storage.add(history_item, {"plot_img": plot_img, "plot_data": plot_data})
         return calc_id
 
-    def get_all(self):
-        return self.history
-
     def get_by_id(self, id):
-        if 0 <= id < len(self.history):
-            return self.history[id]
-        return None
+        return self.storage.get_by_id(id)
 
     def get_by_calc_id(self, calc_id):
-        return next((item for item in self.history if item.get('calc_id') == calc_id), None)
\ No newline at end of file
+        return self.storage.get_by_calc_id(calc_id)
+
+    def get_page(self, page=1, per_page=20, method=None, search=None):
+        """Devuelve una página del historial (del más reciente al más antiguo) sin los campos pesados"""
+        page = max(1, page)
+        per_page = min(max(1, per_page), MAX_PER_PAGE)
+
+        items, total = self.storage.list_items((page - 1) * per_page, per_page, method=method, search=search)
+        return {
+            "items": items,
+            "page": page,
+            "per_page": per_page,
+            "total": total,
+            "pages": (total + per_page - 1) // per_page
+        }
+
+    def stats(self):
+        return self.storage.stats()
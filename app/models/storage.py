@@ -0,0 +1,294 @@
+# models/storage.py
+import json
+import os
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+
+from app.numerical_methods.trace import Trace
+
+# Campos pesados que se guardan aparte y se descartan primero al liberar memoria
+HEAVY_FIELDS = ("plot_img", "plot_data")
+
+# Campos ligeros que se devuelven al listar el historial
+SUMMARY_FIELDS = ("id", "calc_id", "timestamp", "method", "function", "parameters", "root")
+
+
+def _dumps(value):
+    # Las trazas de iteraciones se guardan con el formato clásico de filas
+    return json.dumps(value.rows() if isinstance(value, Trace) else value)
+
+
+def _root_value(root):
+    # La solución de un sistema es un vector: se guarda como texto JSON en la columna root
+    return json.dumps(root) if isinstance(root, (list, tuple)) else root
+
+
+def _load_root(item):
+    if isinstance(item.get("root"), str):
+        item["root"] = json.loads(item["root"])
+    return item
+
+
+def approximate_size(obj):
+    """Estimación rápida (en bytes) de la memoria que ocupa un valor JSON"""
+    if isinstance(obj, Trace):
+        return obj.nbytes
+    if isinstance(obj, str):
+        return len(obj)
+    if isinstance(obj, dict):
+        return sum(len(str(k)) + approximate_size(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return sum(approximate_size(v) for v in obj)
+    return sys.getsizeof(obj) if obj is not None else 0
+
+
+class MemoryHistoryStorage:
+    """Historial en memoria del proceso, indexado y con expulsión LRU"""
+
+    def __init__(self, max_items=None, max_bytes=None):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+
+        # Metadatos ligeros (en orden de inserción) e índice por calc_id
+        self.items = {}
+        self.by_calc_id = {}
+        # Campos pesados por id, en orden de uso (el primero es el menos reciente)
+        self.heavy = OrderedDict()
+        # Orden de uso de los elementos completos
+        self.lru = OrderedDict()
+
+        self.sizes = {}
+        self.heavy_sizes = {}
+        self.total_bytes = 0
+        self.evictions = 0
+        self.next_id = 0
+        self.lock = threading.RLock()
+
+    def add(self, item, heavy):
+        with self.lock:
+            item_id = self.next_id
+            self.next_id += 1
+
+            item = dict(item, id=item_id)
+            self.items[item_id] = item
+            self.by_calc_id[item["calc_id"]] = item_id
+            self.lru[item_id] = None
+            self.heavy[item_id] = heavy
+
+            self.sizes[item_id] = approximate_size(item)
+            self.heavy_sizes[item_id] = approximate_size(heavy)
+            self.total_bytes += self.sizes[item_id] + self.heavy_sizes[item_id]
+
+            self._evict()
+        return item_id
+
+    def get_by_id(self, item_id):
+        with self.lock:
+            if item_id not in self.items:
+                return None
+            self._touch(item_id)
+            return self._merge(item_id)
+
+    def get_by_calc_id(self, calc_id):
+        with self.lock:
+            item_id = self.by_calc_id.get(calc_id)
+            if item_id is None:
+                return None
+            self._touch(item_id)
+            return self._merge(item_id)
+
+    def list_items(self, offset=0, limit=20, method=None, search=None):
+        with self.lock:
+            # Del más reciente al más antiguo, igual que el backend SQLite
+            matches = [
+                item for item in reversed(self.items.values())
+                if (method is None or item["method"] == method)
+                and (search is None or search.lower() in (item["function"] or "").lower())
+            ]
+            page = [self._summary(item) for item in matches[offset:offset + limit]]
+            return page, len(matches)
+
+    def stats(self):
+        with self.lock:
+            return {
+                "backend": "memory",
+                "items": len(self.items),
+                "items_with_plots": len(self.heavy),
+                "approx_bytes": self.total_bytes,
+                "evictions": self.evictions,
+                "max_items": self.max_items,
+                "max_bytes": self.max_bytes
+            }
+
+    def _summary(self, item):
+        return {field: item.get(field) for field in SUMMARY_FIELDS}
+
+    def _merge(self, item_id):
+        # Los campos pesados expulsados se devuelven como None
+        item = dict(self.items[item_id])
+        item.update(self.heavy.get(item_id) or dict.fromkeys(HEAVY_FIELDS))
+        return item
+
+    def _touch(self, item_id):
+        self.lru.move_to_end(item_id)
+        if item_id in self.heavy:
+            self.heavy.move_to_end(item_id)
+
+    def _drop_heavy(self, item_id):
+        self.heavy.pop(item_id, None)
+        self.total_bytes -= self.heavy_sizes.pop(item_id, 0)
+
+    def _drop_item(self, item_id):
+        self._drop_heavy(item_id)
+        item = self.items.pop(item_id)
+        self.by_calc_id.pop(item["calc_id"], None)
+        self.lru.pop(item_id, None)
+        self.total_bytes -= self.sizes.pop(item_id, 0)
+        self.evictions += 1
+
+    def _evict(self):
+        if self.max_items is not None:
+            while len(self.items) > self.max_items:
+                self._drop_item(next(iter(self.lru)))
+
+        if self.max_bytes is not None:
+            # Primero se liberan imágenes y datos de gráfica de los menos usados...
+            while self.total_bytes > self.max_bytes and self.heavy:
+                self._drop_heavy(next(iter(self.heavy)))
+            # ...y solo después se eliminan elementos completos
+            while self.total_bytes > self.max_bytes and self.items:
+                self._drop_item(next(iter(self.lru)))
+
+
+class SQLiteHistoryStorage:
+    """Historial persistente en SQLite, compartido por todos los procesos del servidor"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            calc_id TEXT NOT NULL UNIQUE,
+            timestamp TEXT NOT NULL,
+            method TEXT,
+            function TEXT,
+            parameters TEXT,
+            root REAL,
+            results TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_history_timestamp ON history (timestamp);
+        CREATE INDEX IF NOT EXISTS idx_history_method ON history (method, id);
+
+        -- Los campos pesados van en otra tabla para que los listados no los lean
+        CREATE TABLE IF NOT EXISTS history_plots (
+            id INTEGER PRIMARY KEY REFERENCES history (id) ON DELETE CASCADE,
+            plot_img TEXT,
+            plot_data TEXT
+        );
+    """
+
+    def __init__(self, path, max_items=None):
+        self.path = path
+        self.max_items = max_items
+        self.local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(self.SCHEMA)
+
+    def _connection(self):
+        # Una conexión por hilo (y por proceso: se recrea tras un fork)
+        conn = getattr(self.local, "conn", None)
+        if conn is None or self.local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self.local.conn = conn
+            self.local.pid = os.getpid()
+        return conn
+
+    def add(self, item, heavy):
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute(
+                "INSERT INTO history (calc_id, timestamp, method, function, parameters, root, results) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (item["calc_id"], item["timestamp"], item["method"], item["function"],
+                 _dumps(item["parameters"]), _root_value(item["root"]), _dumps(item["results"]))
+            )
+            item_id = cursor.lastrowid
+            conn.execute(
+                "INSERT INTO history_plots (id, plot_img, plot_data) VALUES (?, ?, ?)",
+                (item_id, heavy.get("plot_img"), _dumps(heavy.get("plot_data")))
+            )
+
+            if self.max_items is not None:
+                # Conservar solo los max_items elementos más recientes
+                conn.execute(
+                    "DELETE FROM history WHERE id <= "
+                    "(SELECT id FROM history ORDER BY id DESC LIMIT 1 OFFSET ?)",
+                    (self.max_items,)
+                )
+        return item_id
+
+    def get_by_id(self, item_id):
+        return self._get("h.id = ?", item_id)
+
+    def get_by_calc_id(self, calc_id):
+        return self._get("h.calc_id = ?", calc_id)
+
+    def list_items(self, offset=0, limit=20, method=None, search=None):
+        conditions = []
+        args = []
+        if method is not None:
+            conditions.append("h.method = ?")
+            args.append(method)
+        if search is not None:
+            # % y _ del texto buscado son literales, no comodines de LIKE
+            conditions.append("h.function LIKE ? ESCAPE '\\'")
+            escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            args.append(f"%{escaped}%")
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        conn = self._connection()
+        total = conn.execute(f"SELECT COUNT(*) FROM history h {where}", args).fetchone()[0]
+        rows = conn.execute(
+            f"SELECT h.id, h.calc_id, h.timestamp, h.method, h.function, h.parameters, h.root "
+            f"FROM history h {where} ORDER BY h.id DESC LIMIT ? OFFSET ?",
+            args + [limit, offset]
+        ).fetchall()
+
+        items = []
+        for row in rows:
+            item = _load_root(dict(row))
+            item["parameters"] = json.loads(item["parameters"])
+            items.append(item)
+        return items, total
+
+    def stats(self):
+        conn = self._connection()
+        return {
+            "backend": "sqlite",
+            "items": conn.execute("SELECT COUNT(*) FROM history").fetchone()[0],
+            "path": self.path,
+            "max_items": self.max_items
+        }
+
+    def _get(self, condition, value):
+        row = self._connection().execute(
+            "SELECT h.*, p.plot_img, p.plot_data "
+            f"FROM history h LEFT JOIN history_plots p ON p.id = h.id WHERE {condition}",
+            (value,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        item = _load_root(dict(row))
+        for field in ("parameters", "results", "plot_data"):
+            if item[field] is not None:
+                item[field] = json.loads(item[field])
+        return item
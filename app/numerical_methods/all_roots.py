@@ -0,0 +1,82 @@
+# numerical_methods/all_roots.py
+import numpy as np
+
+from .polynomial import (polynomial_coefficients, derivative_coefficients, companion_roots, polish_root,
+                         cluster_roots, REAL_ROOT_TOL, CLUSTER_TOL)
+from .trace import Trace, TraceLayout
+from .utils import compile_function, collect_results, MethodError, x_symbol
+
+# Una fila por raíz distinta: parte real, parte imaginaria, |f| en la raíz,
+# error del pulido, multiplicidad y evaluaciones acumuladas (a y b no aplican)
+LAYOUT = TraceLayout(
+    ("xr", "imag", "f(xr)", "error", "multiplicity", "evaluations"),
+    (("iteration", "iteration"), ("a", None), ("b", None), ("xr", "xr"), ("imag", "imag"), ("f(xr)", "f(xr)"),
+     ("error", "error"), ("multiplicity", "multiplicity"), ("evaluations", "evaluations")),
+    (("x", "xr"), ("f_x", "f(xr)"), ("imag", "imag"), ("multiplicity", "multiplicity")),
+    counters=("evaluations", "multiplicity")
+)
+
+
+def iter_all_roots(func_str, tol=1e-6, max_iter=100):
+    """Generador: produce una fila por raíz del polinomio y devuelve la raíz real de menor residuo.
+
+    Las raíces se estiman como valores propios de la matriz compañera y se
+    pulen con Newton: las reales con la función original (conserva la
+    precisión de las formas factorizadas) y las complejas con Horner.
+    """
+    f = compile_function(func_str)
+    coefficients = f.coefficients
+    if coefficients is None and not f.params:
+        coefficients = polynomial_coefficients(f.expr, x_symbol())
+    if coefficients is None:
+        raise MethodError("La función no es un polinomio con coeficientes reales: "
+                          "el método de todas las raíces solo aplica a polinomios")
+    if not any(coefficients[:-1]):
+        raise MethodError("El polinomio es constante: no tiene raíces")
+
+    p = np.poly1d(coefficients)
+    dp = np.poly1d(derivative_coefficients(coefficients))
+    evaluations = 0
+    polished = []
+    # tol es un error relativo porcentual, como en el resto de los métodos
+    polish_tol = tol / 100
+
+    for z in companion_roots(coefficients):
+        if abs(z.imag) <= REAL_ROOT_TOL * max(1.0, abs(z)):
+            x, step, iterations = polish_root(z.real, f.derivatives, polish_tol, max_iter)
+            z = complex(x)
+        else:
+            z, step, iterations = polish_root(z, lambda w: (p(w), dp(w)), polish_tol, max_iter)
+        evaluations += 2 * (iterations + 1)
+        polished.append((z, step))
+
+    trace = Trace(LAYOUT, capacity=len(polished))
+    root = None
+    best_residual = None
+
+    # Raíces reales primero (de izquierda a derecha) y luego los pares complejos
+    clusters = [(complex(z.real) if abs(z.imag) <= CLUSTER_TOL * max(1.0, abs(z)) else z, multiplicity)
+                for z, multiplicity in cluster_roots([z for z, _ in polished])]
+    clusters.sort(key=lambda item: (item[0].imag != 0, item[0].real, item[0].imag))
+    steps = {z: step for z, step in polished}
+
+    for z, multiplicity in clusters:
+        if z.imag == 0:
+            residual = abs(f(z.real))
+            if best_residual is None or residual < best_residual:
+                root, best_residual = z.real, residual
+        else:
+            residual = abs(p(z))
+        evaluations += 1
+
+        # Error relativo (%) del último paso de pulido del representante más cercano
+        step = steps[min(steps, key=lambda w: abs(w - z))]
+        error = step / abs(z) * 100 if z != 0 else step * 100
+
+        yield trace.append(z.real, z.imag, residual, error, multiplicity, evaluations)
+
+    return root
+
+
+def all_roots_method(func_str, tol=1e-6, max_iter=100):
+    return collect_results(iter_all_roots(func_str, tol, max_iter))
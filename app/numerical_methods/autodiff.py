@@ -0,0 +1,141 @@
+# numerical_methods/autodiff.py
+import math
+
+
+class Dual:
+    """Número dual de segundo orden: valor, primera y segunda derivada respecto a x.
+
+    Evaluar una expresión con x = Dual.variable(x0) da f(x0), f'(x0) y f''(x0)
+    en una sola pasada (diferenciación automática en modo directo).
+    """
+
+    __slots__ = ('v', 'd1', 'd2')
+
+    def __init__(self, v, d1=0.0, d2=0.0):
+        self.v = v
+        self.d1 = d1
+        self.d2 = d2
+
+    @classmethod
+    def variable(cls, x_val):
+        return cls(float(x_val), 1.0, 0.0)
+
+    def chain(self, g0, g1, g2):
+        """Aplica la regla de la cadena: g(u) con g(u) = g0, g'(u) = g1, g''(u) = g2"""
+        return Dual(g0, g1 * self.d1, g2 * self.d1 * self.d1 + g1 * self.d2)
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.v + other.v, self.d1 + other.d1, self.d2 + other.d2)
+        return Dual(self.v + other, self.d1, self.d2)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.v - other.v, self.d1 - other.d1, self.d2 - other.d2)
+        return Dual(self.v - other, self.d1, self.d2)
+
+    def __rsub__(self, other):
+        return Dual(other - self.v, -self.d1, -self.d2)
+
+    def __neg__(self):
+        return Dual(-self.v, -self.d1, -self.d2)
+
+    def __pos__(self):
+        return self
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.v * other.v,
+                        self.d1 * other.v + self.v * other.d1,
+                        self.d2 * other.v + 2 * self.d1 * other.d1 + self.v * other.d2)
+        return Dual(self.v * other, self.d1 * other, self.d2 * other)
+
+    __rmul__ = __mul__
+
+    def reciprocal(self):
+        r = 1.0 / self.v
+        return self.chain(r, -r * r, 2 * r * r * r)
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            return self * other.reciprocal()
+        return Dual(self.v / other, self.d1 / other, self.d2 / other)
+
+    def __rtruediv__(self, other):
+        return self.reciprocal() * other
+
+    def __pow__(self, other):
+        if isinstance(other, Dual):
+            # u**v = exp(v*log(u))
+            return exp(other * log(self))
+        if other == 0:
+            return Dual(1.0)
+        n = float(other)
+        second = n * (n - 1) * self.v ** (n - 2) if n != 1 else 0.0
+        return self.chain(self.v ** n, n * self.v ** (n - 1), second)
+
+    def __rpow__(self, other):
+        # c**u = exp(u*log(c))
+        value = other ** self.v
+        log_c = math.log(other)
+        return self.chain(value, value * log_c, value * log_c * log_c)
+
+    def __abs__(self):
+        sign = 1.0 if self.v > 0 else -1.0 if self.v < 0 else 0.0
+        return self.chain(abs(self.v), sign, 0.0)
+
+    def __float__(self):
+        return float(self.v)
+
+    # Comparaciones por valor (usadas por Piecewise, Max, Min...)
+    def __lt__(self, other):
+        return self.v < _value(other)
+
+    def __le__(self, other):
+        return self.v <= _value(other)
+
+    def __gt__(self, other):
+        return self.v > _value(other)
+
+    def __ge__(self, other):
+        return self.v >= _value(other)
+
+
+def _value(u):
+    return u.v if isinstance(u, Dual) else u
+
+
+def _elementary(func, first, second):
+    """Extiende una función de math a números duales a partir de sus dos primeras derivadas"""
+    def apply(u):
+        if not isinstance(u, Dual):
+            return func(u)
+        x = u.v
+        return u.chain(func(x), first(x), second(x))
+    apply.__name__ = func.__name__
+    return apply
+
+
+exp = _elementary(math.exp, math.exp, math.exp)
+log = _elementary(math.log, lambda x: 1 / x, lambda x: -1 / (x * x))
+sqrt = _elementary(math.sqrt, lambda x: 0.5 / math.sqrt(x), lambda x: -0.25 / (x * math.sqrt(x)))
+sin = _elementary(math.sin, math.cos, lambda x: -math.sin(x))
+cos = _elementary(math.cos, lambda x: -math.sin(x), lambda x: -math.cos(x))
+tan = _elementary(math.tan, lambda x: 1 + math.tan(x) ** 2, lambda x: 2 * math.tan(x) * (1 + math.tan(x) ** 2))
+asin = _elementary(math.asin, lambda x: 1 / math.sqrt(1 - x * x), lambda x: x / (1 - x * x) ** 1.5)
+acos = _elementary(math.acos, lambda x: -1 / math.sqrt(1 - x * x), lambda x: -x / (1 - x * x) ** 1.5)
+atan = _elementary(math.atan, lambda x: 1 / (1 + x * x), lambda x: -2 * x / (1 + x * x) ** 2)
+sinh = _elementary(math.sinh, math.cosh, math.sinh)
+cosh = _elementary(math.cosh, math.sinh, math.cosh)
+tanh = _elementary(math.tanh, lambda x: 1 - math.tanh(x) ** 2,
+                   lambda x: -2 * math.tanh(x) * (1 - math.tanh(x) ** 2))
+
+# Funciones que lambdify debe usar al evaluar con números duales
+DUAL_FUNCTIONS = {
+    "exp": exp, "log": log, "sqrt": sqrt,
+    "sin": sin, "cos": cos, "tan": tan,
+    "asin": asin, "acos": acos, "atan": atan,
+    "sinh": sinh, "cosh": cosh, "tanh": tanh
+}
@@ -1,47 +1,44 @@
 # numerical_methods/bisection.py
-from .utils import evaluate_function
+from .trace import Trace, TraceLayout
+from .utils import compile_function, collect_results, MethodError
 
-def bisection_method(func_str, a, b, tol=1e-6, max_iter=100):
-    results = []
+# Columnas de la traza y su vista como filas de resultados y puntos de animación
+LAYOUT = TraceLayout(
+    ("a", "b", "xr", "f(xr)", "error", "fa", "fb", "evaluations"),
+    (("iteration", "iteration"), ("a", "a"), ("b", "b"), ("xr", "xr"), ("f(xr)", "f(xr)"), ("error", "error"),
+     ("evaluations", "evaluations")),
+    (("a", "a"), ("b", "b"), ("c", "xr"), ("fa", "fa"), ("fb", "fb"), ("fc", "f(xr)"))
+)
+
+
+def iter_bisection(func_str, a, b, tol=1e-6, max_iter=100):
+    """Generador: produce la vista (TraceRecord) de cada iteración y devuelve la raíz"""
+    trace = Trace(LAYOUT, capacity=max_iter)
     iterations = 0
     error = 100
 
-    # Lista para almacenar puntos de animación
-    animation_points = []
+    # Compilar la función una sola vez para todas las iteraciones
+    f = compile_function(func_str)
 
-    fa = evaluate_function(func_str, a)
-    fb = evaluate_function(func_str, b)
+    fa = f(a)
+    fb = f(b)
+    evaluations = 2
 
     if fa * fb >= 0:
-        return {"error": "La función debe tener signos opuestos en los extremos del intervalo"}
+        raise MethodError("La función debe tener signos opuestos en los extremos del intervalo")
 
     while error > tol and iterations < max_iter:
         c = (a + b) / 2
-        fc = evaluate_function(func_str, c)
+        fc = f(c)
+        evaluations += 1
 
         if iterations > 0:
             error = abs((c - prev_c) / c) * 100 if c != 0 else abs(c - prev_c) * 100
         else:
             error = 100
 
-        # Guardar puntos para animación
-        animation_points.append({
-            "a": a,
-            "b": b,
-            "c": c,
-            "fa": fa,
-            "fb": fb,
-            "fc": fc
-        })
-
-        results.append({
-            "iteration": iterations,
-            "a": a,
-            "b": b,
-            "xr": c,
-            "f(xr)": fc,
-            "error": error
-        })
+        # Guardar la iteración (resultados y animación comparten las columnas)
+        yield trace.append(a, b, c, fc, error, fa, fb, evaluations)
 
         if fa * fc < 0:
             b = c
@@ -54,4 +51,8 @@ def bisection_method(func_str, a, b, tol=1e-6, max_iter=100):
         iterations += 1
 
     root = c
-    return {"results": results, "root": root, "animation_points": animation_points}
\ No newline at end of file
+    return root
+
+
+def bisection_method(func_str, a, b, tol=1e-6, max_iter=100, precision=None):
+    return collect_results(iter_bisection(func_str, a, b, tol, max_iter), func_str, precision)
@@ -0,0 +1,189 @@
+# numerical_methods/brackets.py
+"""Búsqueda automática de intervalos con cambio de signo para los métodos cerrados.
+
+Se evalúa f sobre una malla uniforme (vectorizada) del rango pedido o, si no
+se da uno, de [a, b] ampliándolo alrededor de su centro hasta encontrar algún
+cambio de signo. Cada cambio de signo se clasifica como raíz, polo o salto
+antes de resolverlo con el método elegido.
+"""
+import numpy as np
+
+from .trace import Trace, TraceLayout
+from .utils import compile_function, collect_iterations, MethodError
+
+# Modos de búsqueda: "auto" resuelve un intervalo si [a, b] no sirve, "all" resuelve todos
+SCAN_MODES = ("auto", "all")
+
+# Subintervalos de la malla de búsqueda
+SCAN_POINTS = 256
+
+# Ampliaciones de la ventana (cada una duplica su ancho) antes de rendirse
+SCAN_EXPANSIONS = 10
+
+# Bisecciones usadas para clasificar cada cambio de signo
+CLASSIFY_STEPS = 40
+
+# Cociente máximo entre |f| en los extremos finales e iniciales para considerar que hay una raíz
+ROOT_RATIO = 1e-3
+
+# Una fila por raíz encontrada: el intervalo de la malla que la contenía y su solución
+# (la animación reutiliza los puntos de la bisección: intervalo y punto medio)
+LAYOUT = TraceLayout(
+    ("a", "b", "xr", "f(xr)", "error", "fa", "fb", "iterations", "evaluations"),
+    (("iteration", "iteration"), ("a", "a"), ("b", "b"), ("xr", "xr"), ("f(xr)", "f(xr)"), ("error", "error"),
+     ("iterations", "iterations"), ("evaluations", "evaluations")),
+    (("a", "a"), ("b", "b"), ("c", "xr"), ("fa", "fa"), ("fb", "fb"), ("fc", "f(xr)")),
+    counters=("iterations", "evaluations")
+)
+
+
+def scan_grid(f, lo, hi, points=SCAN_POINTS):
+    """Evalúa f en la malla de [lo, hi] y devuelve (a, b, fa, fb, ceros exactos).
+
+    a y b son los extremos de los subintervalos donde f cambia de signo; los
+    puntos de la malla donde f vale exactamente cero se devuelven aparte.
+    """
+    x = np.linspace(lo, hi, points + 1)
+    y = f.vectorized(x)
+
+    with np.errstate(invalid='ignore'):
+        change = np.flatnonzero(y[:-1] * y[1:] < 0)
+    return x[change], x[change + 1], y[change], y[change + 1], x[y == 0]
+
+
+def find_brackets(f, a, b, scan_range=None, points=SCAN_POINTS):
+    """Busca cambios de signo en scan_range o, si es None, en [a, b] ampliado hasta encontrar alguno.
+
+    Devuelve (a, b, fa, fb, ceros exactos, evaluaciones, rango recorrido).
+    """
+    if scan_range is not None:
+        lo, hi = sorted(float(v) for v in scan_range)
+        expansions = 0
+    else:
+        lo, hi = min(a, b), max(a, b)
+        expansions = SCAN_EXPANSIONS
+    if not hi > lo:
+        raise MethodError("El rango de búsqueda debe tener ancho positivo")
+
+    evaluations = 0
+    for expansion in range(expansions + 1):
+        if expansion > 0:
+            center, half = (lo + hi) / 2, hi - lo
+            lo, hi = center - half, center + half
+        found = scan_grid(f, lo, hi, points)
+        evaluations += points + 1
+        if found[0].size or found[4].size:
+            break
+
+    return found + (evaluations, (lo, hi))
+
+
+def classify_brackets(f, a, b, fa, fb, steps=CLASSIFY_STEPS):
+    """Clasifica cada intervalo con cambio de signo como "root", "pole" o "jump".
+
+    Se biseca cada intervalo `steps` veces (todos a la vez): cerca de una raíz
+    |f| en los extremos tiende a cero, cerca de un polo crece y en un salto se
+    mantiene.
+    """
+    a, b, fa, fb = (np.array(v, dtype=float) for v in (a, b, fa, fb))
+    scale = np.maximum(np.abs(fa), np.abs(fb))
+
+    for _ in range(steps):
+        c = (a + b) / 2
+        fc = f.vectorized(c)
+        with np.errstate(invalid='ignore'):
+            left = fa * fc < 0
+        # NaN en el punto medio (fuera del dominio) se propaga y el intervalo queda como polo
+        b, fb = np.where(left, c, b), np.where(left, fc, fb)
+        a, fa = np.where(left, a, c), np.where(left, fa, fc)
+        # Un cero exacto en el punto medio cierra el intervalo sobre él
+        zero = fc == 0
+        b, fb = np.where(zero, c, b), np.where(zero, 0.0, fb)
+
+    end = np.maximum(np.abs(fa), np.abs(fb))
+    with np.errstate(invalid='ignore'):
+        return np.where(~np.isfinite(end) | (end > scale), "pole",
+                        np.where(end <= ROOT_RATIO * scale, "root", "jump"))
+
+
+def _root_brackets(f, a, b, scan_range):
+    # Intervalos que contienen raíces (sin polos ni saltos), ceros exactos y evaluaciones usadas
+    lo_b, hi_b, f_lo, f_hi, zeros, evaluations, searched = find_brackets(f, a, b, scan_range)
+    kinds = classify_brackets(f, lo_b, hi_b, f_lo, f_hi)
+    evaluations += CLASSIFY_STEPS * kinds.size
+
+    roots = kinds == "root"
+    if not roots.any() and not zeros.size:
+        lo, hi = searched
+        if kinds.size:
+            raise MethodError(f"Se encontraron {kinds.size} cambios de signo en [{lo:g}, {hi:g}], "
+                              "pero todos son polos o discontinuidades")
+        raise MethodError(f"No se encontró ningún cambio de signo en [{lo:g}, {hi:g}]")
+
+    return lo_b[roots], hi_b[roots], f_lo[roots], f_hi[roots], zeros, evaluations
+
+
+def iter_auto_bracket(func_str, steps, a, b, scan_range=None):
+    """Generador: resuelve con steps(a, b) y, si f no cambia de signo en [a, b], busca antes un intervalo que sirva.
+
+    Se elige el intervalo más cercano al centro de [a, b]. Si la malla cae
+    justo sobre una raíz se devuelve sin iterar, con una sola fila (en las
+    columnas de LAYOUT) que lleva las evaluaciones usadas en la búsqueda.
+    """
+    f = compile_function(func_str)
+    try:
+        has_change = f(a) * f(b) < 0
+    except ValueError:
+        # Un extremo fuera del dominio: también se busca otro intervalo
+        has_change = False
+    if has_change:
+        return (yield from steps(a, b))
+
+    lo_b, hi_b, _, _, zeros, evaluations = _root_brackets(f, a, b, scan_range)
+    center = (a + b) / 2
+    if lo_b.size:
+        nearest = np.argmin(np.abs((lo_b + hi_b) / 2 - center))
+        if not zeros.size or abs((lo_b[nearest] + hi_b[nearest]) / 2 - center) <= np.min(np.abs(zeros - center)):
+            return (yield from steps(float(lo_b[nearest]), float(hi_b[nearest])))
+
+    root = float(zeros[np.argmin(np.abs(zeros - center))])
+    # Las evaluaciones de la búsqueda (y de los extremos) cuentan para el resumen y el presupuesto
+    yield Trace(LAYOUT, capacity=1).append(root, root, root, 0.0, 0.0, 0.0, 0.0, 0, evaluations + 2)
+    return root
+
+
+def iter_all_brackets(func_str, steps, a, b, scan_range=None, sweep=None, tol=1e-6, max_iter=100):
+    """Generador: produce una fila por raíz encontrada en el rango y devuelve la más cercana al centro de [a, b].
+
+    Con sweep (ver sweep.py) todos los intervalos se resuelven a la vez con
+    operaciones vectorizadas; si no, uno por uno con steps(a, b).
+    """
+    f = compile_function(func_str)
+    lo_b, hi_b, f_lo, f_hi, zeros, evaluations = _root_brackets(f, a, b, scan_range)
+
+    rows = [(x, x, x, 0.0, 0.0, 0.0, 0.0, 0, 0) for x in zeros.tolist()]
+    if lo_b.size and sweep is not None:
+        solved = sweep(func_str, lo_b, hi_b, tol=tol, max_iter=max_iter)
+        for i in np.flatnonzero(~solved["failed"]):
+            iterations = int(solved["iterations"][i])
+            rows.append((lo_b[i], hi_b[i], solved["roots"][i], solved["residuals"][i], solved["errors"][i],
+                         f_lo[i], f_hi[i], iterations, iterations + 2))
+    else:
+        for i in range(lo_b.size):
+            result = collect_iterations(steps(float(lo_b[i]), float(hi_b[i])))
+            if "error" in result:
+                continue
+            trace = result["results"]
+            rows.append((lo_b[i], hi_b[i], result["root"], trace.last("f(xr)"), trace.last("error"),
+                         f_lo[i], f_hi[i], len(trace), trace.last("evaluations")))
+
+    if not rows:
+        raise MethodError("No se pudo resolver ninguno de los intervalos encontrados")
+
+    trace = Trace(LAYOUT, capacity=len(rows))
+    for row in sorted(rows, key=lambda row: row[2]):
+        evaluations += row[-1]
+        yield trace.append(*row[:-1], evaluations)
+
+    center = (a + b) / 2
+    return float(min((row[2] for row in rows), key=lambda x: abs(x - center)))
@@ -0,0 +1,100 @@
+# numerical_methods/brent.py
+from .trace import Trace, TraceLayout
+from .utils import compile_function, collect_results, MethodError
+
+# Columnas de la traza y su vista como filas de resultados y puntos de animación
+LAYOUT = TraceLayout(
+    ("a", "b", "xr", "f(xr)", "error", "fa", "fb", "evaluations"),
+    (("iteration", "iteration"), ("a", "a"), ("b", "b"), ("xr", "xr"), ("f(xr)", "f(xr)"), ("error", "error"),
+     ("evaluations", "evaluations")),
+    (("a", "a"), ("b", "b"), ("c", "xr"), ("fa", "fa"), ("fb", "fb"), ("fc", "f(xr)"))
+)
+
+# Precisión de la máquina: tamaño mínimo de paso relativo a |b|
+EPS = 2.220446049250313e-16
+
+
+def iter_brent(func_str, a, b, tol=1e-6, max_iter=100):
+    """Generador: produce la vista (TraceRecord) de cada iteración y devuelve la raíz.
+
+    Combina interpolación cuadrática inversa, secante y bisección: converge
+    casi tan rápido como la secante sin perder nunca el intervalo.
+    """
+    trace = Trace(LAYOUT, capacity=max_iter)
+    iterations = 0
+    error = 100
+
+    # Compilar la función una sola vez para todas las iteraciones
+    f = compile_function(func_str)
+
+    fa = f(a)
+    fb = f(b)
+    evaluations = 2
+
+    if fa * fb >= 0:
+        raise MethodError("La función debe tener signos opuestos en los extremos del intervalo")
+
+    # b es siempre la mejor aproximación y a el extremo opuesto del intervalo
+    if abs(fa) < abs(fb):
+        a, b, fa, fb = b, a, fb, fa
+
+    c, fc = a, fa
+    d = c
+    bisected = True
+    s = b
+
+    while error > tol and iterations < max_iter:
+        prev_s = s
+
+        if fa != fc and fb != fc:
+            # Interpolación cuadrática inversa
+            s = (a * fb * fc / ((fa - fb) * (fa - fc))
+                 + b * fa * fc / ((fb - fa) * (fb - fc))
+                 + c * fa * fb / ((fc - fa) * (fc - fb)))
+        else:
+            # Secante
+            s = b - fb * (b - a) / (fb - fa)
+
+        # Volver a la bisección si el paso interpolado no es confiable
+        delta = 2 * EPS * abs(b)
+        if (not min((3 * a + b) / 4, b) <= s <= max((3 * a + b) / 4, b)
+                or (bisected and abs(s - b) >= abs(b - c) / 2)
+                or (not bisected and abs(s - b) >= abs(c - d) / 2)
+                or (bisected and abs(b - c) < delta)
+                or (not bisected and abs(c - d) < delta)):
+            s = (a + b) / 2
+            bisected = True
+        else:
+            bisected = False
+
+        fs = f(s)
+        evaluations += 1
+
+        if iterations > 0:
+            error = abs((s - prev_s) / s) * 100 if s != 0 else abs(s - prev_s) * 100
+        else:
+            error = 100
+
+        # Guardar la iteración con el intervalo ordenado (resultados y animación comparten las columnas)
+        low, high, f_low, f_high = (a, b, fa, fb) if a < b else (b, a, fb, fa)
+        yield trace.append(low, high, s, fs, error, f_low, f_high, evaluations)
+
+        d, c, fc = c, b, fb
+        if fa * fs < 0:
+            b, fb = s, fs
+        else:
+            a, fa = s, fs
+        if abs(fa) < abs(fb):
+            a, b, fa, fb = b, a, fb, fa
+
+        iterations += 1
+
+        if fb == 0:
+            break
+
+    root = b
+    return root
+
+
+def brent_method(func_str, a, b, tol=1e-6, max_iter=100, precision=None):
+    return collect_results(iter_brent(func_str, a, b, tol, max_iter), func_str, precision)
@@ -1,50 +1,46 @@
 # numerical_methods/false_position.py
-from .utils import evaluate_function
+from .trace import Trace, TraceLayout
+from .utils import compile_function, collect_results, MethodError
 
-def false_position_method(func_str, a, b, tol=1e-6, max_iter=100):
-    results = []
+# Columnas de la traza y su vista como filas de resultados y puntos de animación
+LAYOUT = TraceLayout(
+    ("a", "b", "xr", "f(xr)", "error", "fa", "fb", "secant_m", "evaluations"),
+    (("iteration", "iteration"), ("a", "a"), ("b", "b"), ("xr", "xr"), ("f(xr)", "f(xr)"), ("error", "error"),
+     ("evaluations", "evaluations")),
+    (("a", "a"), ("b", "b"), ("c", "xr"), ("fa", "fa"), ("fb", "fb"), ("fc", "f(xr)"), ("secant_m", "secant_m"))
+)
+
+
+def iter_false_position(func_str, a, b, tol=1e-6, max_iter=100):
+    """Generador: produce la vista (TraceRecord) de cada iteración y devuelve la raíz"""
+    trace = Trace(LAYOUT, capacity=max_iter)
     iterations = 0
     error = 100
 
-    # Lista para almacenar puntos de animación
-    animation_points = []
+    # Compilar la función una sola vez para todas las iteraciones
+    f = compile_function(func_str)
 
-    fa = evaluate_function(func_str, a)
-    fb = evaluate_function(func_str, b)
+    fa = f(a)
+    fb = f(b)
+    evaluations = 2
 
     if fa * fb >= 0:
-        return {"error": "La función debe tener signos opuestos en los extremos del intervalo"}
+        raise MethodError("La función debe tener signos opuestos en los extremos del intervalo")
 
     c = a  # Inicializar c
     while error > tol and iterations < max_iter:
         prev_c = c
         c = b - fb * (b - a) / (fb - fa)
-        fc = evaluate_function(func_str, c)
+        fc = f(c)
+        evaluations += 1
 
         if iterations > 0:
             error = abs((c - prev_c) / c) * 100 if c != 0 else abs(c - prev_c) * 100
         else:
             error = 100
 
-        # Guardar puntos para animación
-        animation_points.append({
-            "a": a,
-            "b": b,
-            "c": c,
-            "fa": fa,
-            "fb": fb,
-            "fc": fc,
-            "secant_m": (fb - fa) / (b - a)
-        })
-
-        results.append({
-            "iteration": iterations,
-            "a": a,
-            "b": b,
-            "xr": c,
-            "f(xr)": fc,
-            "error": error
-        })
+        # Guardar la iteración (resultados y animación comparten las columnas)
+        yield trace.append(a, b, c, fc, error, fa, fb, (fb - fa) / (b - a), evaluations)
 
         if fa * fc < 0:
             b = c
@@ -56,4 +52,8 @@ def false_position_method(func_str, a, b, tol=1e-6, max_iter=100):
         iterations += 1
 
     root = c
-    return {"results": results, "root": root, "animation_points": animation_points}
\ No newline at end of file
+    return root
+
+
+def false_position_method(func_str, a, b, tol=1e-6, max_iter=100, precision=None):
+    return collect_results(iter_false_position(func_str, a, b, tol, max_iter), func_str, precision)
@@ -1,44 +1,48 @@
 # numerical_methods/fixed_point.py
-from .utils import evaluate_function
-
-def fixed_point_method(func_str, g_func_str, x0, tol=1e-6, max_iter=100):
-    results = []
+from .trace import Trace, TraceLayout
+from .utils import compile_function, collect_results
+
+# Columnas de la traza y su vista como filas de resultados y puntos de animación
+# (a y b no aplican en punto fijo; g(x_prev) es el propio xr)
+LAYOUT = TraceLayout(
+    ("x_prev", "xr", "f(xr)", "error", "evaluations"),
+    (("iteration", "iteration"), ("a", None), ("b", None), ("xr", "xr"), ("f(xr)", "f(xr)"), ("error", "error"),
+     ("x_prev", "x_prev"), ("g_x_prev", "xr"), ("evaluations", "evaluations")),
+    (("x", "x_prev"), ("g_x", "xr"), ("f_g_x", "f(xr)"))
+)
+
+
+def iter_fixed_point(func_str, g_func_str, x0, tol=1e-6, max_iter=100):
+    """Generador: produce la vista (TraceRecord) de cada iteración y devuelve la raíz"""
+    trace = Trace(LAYOUT, capacity=max_iter)
     iterations = 0
     error = 100
+    evaluations = 0
     x = x0
 
-    # Lista para almacenar los puntos de la animación
-    animation_points = []
+    # Compilar f y g una sola vez para todas las iteraciones
+    f = compile_function(func_str)
+    g = compile_function(g_func_str)
 
     while error > tol and iterations < max_iter:
-        x_new = evaluate_function(g_func_str, x)
-        f_x_new = evaluate_function(func_str, x_new)
+        x_new = g(x)
+        f_x_new = f(x_new)
+        evaluations += 2
 
         if iterations > 0:
             error = abs((x_new - x) / x_new) * 100 if x_new != 0 else abs(x_new - x) * 100
         else:
             error = 100
 
-        # Almacenar puntos para la animación
-        animation_points.append({
-            "x": x,
-            "g_x": x_new,
-            "f_g_x": f_x_new
-        })
-
-        results.append({
-            "iteration": iterations,
-            "a": None,  # No applicable for fixed point
-            "b": None,  # No applicable for fixed point
-            "xr": x_new,
-            "f(xr)": f_x_new,
-            "error": error,
-            "x_prev": x,  # Para la animación
-            "g_x_prev": evaluate_function(g_func_str, x)  # Para la animación
-        })
+        # Guardar la iteración (resultados y animación comparten las columnas)
+        yield trace.append(x, x_new, f_x_new, error, evaluations)
 
         x = x_new
         iterations += 1
 
     root = x
-    return {"results": results, "root": root, "animation_points": animation_points}
\ No newline at end of file
+    return root
+
+
+def fixed_point_method(func_str, g_func_str, x0, tol=1e-6, max_iter=100, precision=None):
+    return collect_results(iter_fixed_point(func_str, g_func_str, x0, tol, max_iter), func_str, precision)
@@ -0,0 +1,58 @@
+# numerical_methods/halley.py
+from .trace import Trace, TraceLayout
+from .utils import compile_function, collect_results, MethodError
+
+# Columnas de la traza y su vista como filas de resultados y puntos de animación
+# (a y b no aplican; la animación reutiliza la de Newton-Raphson)
+LAYOUT = TraceLayout(
+    ("xr", "f(xr)", "error", "f_prime_x", "f_second_x", "tangent_b", "x_next", "evaluations"),
+    (("iteration", "iteration"), ("a", None), ("b", None), ("xr", "xr"), ("f(xr)", "f(xr)"), ("error", "error"),
+     ("f_prime_x", "f_prime_x"), ("f_second_x", "f_second_x"), ("tangent_b", "tangent_b"), ("x_next", "x_next"),
+     ("evaluations", "evaluations")),
+    (("x", "xr"), ("f_x", "f(xr)"), ("tangent_m", "f_prime_x"), ("tangent_b", "tangent_b"), ("x_new", "x_next"))
+)
+
+
+def iter_halley(func_str, x0, tol=1e-6, max_iter=100):
+    """Generador: produce la vista (TraceRecord) de cada iteración y devuelve la raíz"""
+    trace = Trace(LAYOUT, capacity=max_iter)
+    iterations = 0
+    error = 100
+    evaluations = 0
+    x = x0
+
+    # f, f' y f'' se evalúan juntas en una sola pasada (convergencia cúbica)
+    f = compile_function(func_str)
+
+    while error > tol and iterations < max_iter:
+        f_x, f_prime_x, f_second_x = f.derivatives(x, order=2)
+        evaluations += 3
+
+        if abs(f_prime_x) < 1e-10:  # Evitar división por cero
+            raise MethodError("Derivada muy cercana a cero. El método diverge.")
+
+        denominator = 2 * f_prime_x ** 2 - f_x * f_second_x
+        if abs(denominator) < 1e-10 * f_prime_x ** 2:
+            raise MethodError("Denominador muy cercano a cero. El método diverge.")
+
+        # Tangente en x para la visualización
+        tangent_b = f_x - f_prime_x * x
+        x_new = x - 2 * f_x * f_prime_x / denominator
+
+        if iterations > 0:
+            error = abs((x_new - x) / x_new) * 100 if x_new != 0 else abs(x_new - x) * 100
+        else:
+            error = 100
+
+        # Guardar la iteración (resultados y animación comparten las columnas)
+        yield trace.append(x, f_x, error, f_prime_x, f_second_x, tangent_b, x_new, evaluations)
+
+        x = x_new
+        iterations += 1
+
+    root = x
+    return root
+
+
+def halley_method(func_str, x0, tol=1e-6, max_iter=100, precision=None):
+    return collect_results(iter_halley(func_str, x0, tol, max_iter), func_str, precision)
@@ -0,0 +1,32 @@
+# numerical_methods/lazy.py
+import importlib
+import importlib.util
+import sys
+
+
+def lazy_import(name):
+    """Devuelve el módulo `name` sin ejecutarlo: se importa de verdad al usar su primer atributo.
+
+    Sirve para módulos pesados (sympy) que no hacen falta para atender las
+    rutas que no calculan; si ya está importado se devuelve tal cual.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        # Se deja que la importación normal produzca el error habitual
+        return importlib.import_module(name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def is_loaded(name):
+    """True si el módulo ya se importó y ejecutó (uno diferido con lazy_import cuenta recién al usarse)"""
+    module = sys.modules.get(name)
+    return module is not None and type(module).__name__ != '_LazyModule'
@@ -0,0 +1,91 @@
+# numerical_methods/modified_false_position.py
+from .false_position import LAYOUT  # Mismas columnas que la falsa posición
+from .trace import Trace
+from .utils import compile_function, collect_results, MethodError
+
+
+def illinois_weight(fc, f_replaced):
+    """Illinois: el extremo que se repite pierde la mitad de su peso"""
+    return 0.5
+
+
+def anderson_bjorck_weight(fc, f_replaced):
+    """Anderson-Björck: el peso depende de cuánto bajó f en el extremo que se movió"""
+    m = 1 - fc / f_replaced
+    return m if m > 0 else 0.5
+
+
+def iter_weighted_false_position(func_str, a, b, tol=1e-6, max_iter=100, weight=illinois_weight):
+    """Generador: falsa posición que reduce el valor de f en el extremo que se conserva dos veces seguidas.
+
+    La falsa posición clásica deja un extremo fijo en funciones convexas y
+    avanza cada vez más lento; al escalar f en ese extremo la convergencia
+    vuelve a ser superlineal con una sola evaluación por iteración.
+    """
+    trace = Trace(LAYOUT, capacity=max_iter)
+    iterations = 0
+    error = 100
+
+    # Compilar la función una sola vez para todas las iteraciones
+    f = compile_function(func_str)
+
+    fa = f(a)
+    fb = f(b)
+    evaluations = 2
+
+    if fa * fb >= 0:
+        raise MethodError("La función debe tener signos opuestos en los extremos del intervalo")
+
+    # Extremo conservado en la iteración anterior ("a", "b" o None)
+    kept = None
+    c = a  # Inicializar c
+    while error > tol and iterations < max_iter:
+        prev_c = c
+        c = b - fb * (b - a) / (fb - fa)
+        fc = f(c)
+        evaluations += 1
+
+        if iterations > 0:
+            error = abs((c - prev_c) / c) * 100 if c != 0 else abs(c - prev_c) * 100
+        else:
+            error = 100
+
+        # Guardar la iteración (resultados y animación comparten las columnas)
+        yield trace.append(a, b, c, fc, error, fa, fb, (fb - fa) / (b - a), evaluations)
+
+        if fc == 0:
+            break
+
+        if fa * fc < 0:
+            # Se conserva a
+            if kept == "a":
+                fa *= weight(fc, fb)
+            b, fb = c, fc
+            kept = "a"
+        else:
+            # Se conserva b
+            if kept == "b":
+                fb *= weight(fc, fa)
+            a, fa = c, fc
+            kept = "b"
+
+        iterations += 1
+
+    root = c
+    return root
+
+
+def iter_illinois(func_str, a, b, tol=1e-6, max_iter=100):
+    return iter_weighted_false_position(func_str, a, b, tol, max_iter, weight=illinois_weight)
+
+
+def iter_anderson_bjorck(func_str, a, b, tol=1e-6, max_iter=100):
+    return iter_weighted_false_position(func_str, a, b, tol, max_iter, weight=anderson_bjorck_weight)
+
+
+def illinois_method(func_str, a, b, tol=1e-6, max_iter=100, precision=None):
+    return collect_results(iter_illinois(func_str, a, b, tol, max_iter), func_str, precision)
+
+
+def anderson_bjorck_method(func_str, a, b, tol=1e-6, max_iter=100, precision=None):
+    return collect_results(iter_anderson_bjorck(func_str, a, b, tol, max_iter), func_str, precision)
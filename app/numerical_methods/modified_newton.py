@@ -0,0 +1,58 @@
+# numerical_methods/modified_newton.py
+from .halley import LAYOUT  # Mismas columnas que Halley (f, f' y f'' en cada iteración)
+from .trace import Trace
+from .utils import compile_function, collect_results, MethodError
+
+
+def iter_modified_newton(func_str, x0, tol=1e-6, max_iter=100):
+    """Generador: produce la vista (TraceRecord) de cada iteración y devuelve la raíz.
+
+    Newton aplicado a u(x) = f(x) / f'(x): conserva la convergencia cuadrática
+    en raíces múltiples, donde Newton-Raphson solo converge linealmente.
+    """
+    trace = Trace(LAYOUT, capacity=max_iter)
+    iterations = 0
+    error = 100
+    evaluations = 0
+    x = x0
+
+    # f, f' y f'' se evalúan juntas en una sola pasada
+    f = compile_function(func_str)
+
+    while error > tol and iterations < max_iter:
+        f_x, f_prime_x, f_second_x = f.derivatives(x, order=2)
+        evaluations += 3
+
+        if f_x == 0:
+            # Raíz exacta: en una raíz múltiple el denominador también se anula
+            x_new = x
+        else:
+            if abs(f_prime_x) < 1e-10 and abs(f_x) > 1e-10:
+                raise MethodError("Derivada nula en un punto que no es raíz. El método se estanca.")
+
+            # Cerca de una raíz múltiple f'² y f·f'' son ambos pequeños: se compara en forma relativa
+            denominator = f_prime_x ** 2 - f_x * f_second_x
+            if abs(denominator) < 1e-10 * max(f_prime_x ** 2, abs(f_x * f_second_x)):
+                raise MethodError("Denominador muy cercano a cero. El método diverge.")
+            x_new = x - f_x * f_prime_x / denominator
+
+        # Tangente en x para la visualización
+        tangent_b = f_x - f_prime_x * x
+
+        if iterations > 0:
+            error = abs((x_new - x) / x_new) * 100 if x_new != 0 else abs(x_new - x) * 100
+        else:
+            error = 100
+
+        # Guardar la iteración (resultados y animación comparten las columnas)
+        yield trace.append(x, f_x, error, f_prime_x, f_second_x, tangent_b, x_new, evaluations)
+
+        x = x_new
+        iterations += 1
+
+    root = x
+    return root
+
+
+def modified_newton_method(func_str, x0, tol=1e-6, max_iter=100, precision=None):
+    return collect_results(iter_modified_newton(func_str, x0, tol, max_iter), func_str, precision)
@@ -0,0 +1,320 @@
+# numerical_methods/newton_system.py
+"""Newton-Raphson para sistemas de ecuaciones no lineales F(x) = 0.
+
+Las ecuaciones se escriben en una sola cadena separadas por ';' (o por saltos
+de línea) y se compilan una sola vez junto con su jacobiano, del que solo se
+guardan las entradas no nulas. Cada paso resuelve J(x) dx = -F(x) con NumPy
+(o con scipy.sparse si el sistema es grande y su jacobiano poco denso) y se
+acorta con búsqueda lineal hasta que ||F|| baje lo suficiente. Con
+jacobian="broyden" el jacobiano exacto se evalúa solo al comienzo (o cuando la
+aproximación deja de dar una dirección de descenso) y en cada paso se
+actualiza con el método de Broyden en la variante de Schubert, que conserva
+las entradas nulas.
+
+La traza usa las columnas de la tabla de resultados: xr es ||x|| y f(xr) es
+||F(x)|| (norma 2); además cada componente de x (hasta TRACE_COMPONENTS) va
+en una columna con el nombre de su variable.
+"""
+import re
+import warnings
+from functools import lru_cache
+
+import numpy as np
+
+from .lazy import lazy_import
+from .trace import Trace, TraceLayout
+from .utils import normalize_function, collect_results, MethodError, COMPILE_CACHE_SIZE, IMAG_TOL
+
+sp = lazy_import('sympy')
+
+# Modos del jacobiano: exacto en cada iteración o actualizado con Broyden
+JACOBIAN_MODES = ("exact", "broyden")
+
+# Con sparse=None se usan matrices dispersas desde este tamaño y hasta esta densidad del jacobiano
+SPARSE_MIN_SIZE = 50
+SPARSE_MAX_DENSITY = 0.1
+
+# Búsqueda lineal: constante de la condición de Armijo y máximo de reducciones del paso
+ARMIJO = 1e-4
+MAX_BACKTRACKS = 30
+
+# Paso (relativo a ||x||) por debajo del cual ||F|| ya no puede bajar en float64
+STEP_FLOOR = 1e-13
+
+# Componentes de x que se guardan como columnas de la traza
+TRACE_COMPONENTS = 20
+
+# Columnas de la traza y claves de las filas: no pueden usarse como nombres de variables
+RESERVED_NAMES = ("iteration", "a", "b", "xr", "error", "step", "evaluations", "jacobian_evaluations",
+                  "x_norm", "residual")
+
+
+def _sparse():
+    # scipy es opcional: sin él los sistemas se resuelven siempre con matrices densas
+    try:
+        from scipy import sparse
+        from scipy.sparse.linalg import spsolve
+    except ImportError:
+        return None
+    return sparse, spsolve
+
+
+def split_equations(func_str):
+    """Ecuaciones de un sistema escrito en una cadena (separadas por ';' o saltos de línea)"""
+    return [part.strip() for part in re.split(r'[;\n]', func_str) if part.strip()]
+
+
+def parse_names(value):
+    """Nombres de variables: "x, y", ["x", "y"] o None (se deducen de las ecuaciones)"""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.replace(';', ',').split(',')
+    names = tuple(str(name).strip() for name in value if str(name).strip())
+    return names or None
+
+
+def parse_point(value, size):
+    """Punto inicial como arreglo de `size` componentes: "1, 2", [1, 2] o un número (para un sistema de 1)"""
+    if value is None:
+        raise ValueError("Se requiere el punto inicial x0")
+    if isinstance(value, str):
+        value = [v for v in value.replace(';', ',').split(',') if v.strip()]
+    point = np.array(value, dtype=float).reshape(-1)
+    if point.size != size:
+        raise ValueError(f"x0 debe tener {size} componentes, una por incógnita")
+    return point
+
+
+def _natural_key(name):
+    # x2 antes que x10
+    return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', name)]
+
+
+class CompiledSystem:
+    """Sistema F(x) = 0 interpretado una sola vez: F y las entradas no nulas de su jacobiano compiladas"""
+
+    def __init__(self, source, exprs, variables):
+        self.source = source
+        self.variables = tuple(variables)
+        self.size = len(self.variables)
+        symbols = [sp.Symbol(name) for name in self.variables]
+        index = {symbol: j for j, symbol in enumerate(symbols)}
+
+        # Solo se derivan las variables que aparecen en cada ecuación: O(entradas no nulas), no O(n²)
+        rows, cols, entries = [], [], []
+        for i, expr in enumerate(exprs):
+            for symbol in sorted(expr.free_symbols & index.keys(), key=index.get):
+                entry = sp.diff(expr, symbol)
+                if entry != 0:
+                    rows.append(i)
+                    cols.append(index[symbol])
+                    entries.append(entry)
+
+        self.rows = np.array(rows, dtype=np.intp)
+        self.cols = np.array(cols, dtype=np.intp)
+        self._F = sp.lambdify(symbols, list(exprs), modules='numpy', cse=True)
+        self._J = sp.lambdify(symbols, entries, modules='numpy', cse=True)
+
+        components = self.variables[:TRACE_COMPONENTS]
+        self.layout = TraceLayout(
+            ("x_norm", "residual", "error", "step", "jacobian_evaluations", "evaluations") + components,
+            (("iteration", "iteration"), ("a", None), ("b", None), ("xr", "x_norm"), ("f(xr)", "residual"),
+             ("error", "error"), ("step", "step"), ("jacobian_evaluations", "jacobian_evaluations"),
+             ("evaluations", "evaluations")) + tuple((name, name) for name in components),
+            (("x_norm", "x_norm"), ("residual", "residual"), ("step", "step")),
+            counters=("jacobian_evaluations", "evaluations")
+        )
+
+    @property
+    def density(self):
+        """Fracción de entradas no nulas del jacobiano"""
+        return self.rows.size / self.size ** 2
+
+    def __call__(self, x):
+        """F(x) como arreglo; NaN donde no es real"""
+        return self._real(self._F(*x), self.size)
+
+    def jacobian_values(self, x):
+        """Entradas no nulas del jacobiano en x, alineadas con rows y cols"""
+        return self._real(self._J(*x), self.rows.size)
+
+    def matrix(self, values, sparse=False):
+        """Jacobiano como matriz densa de NumPy o, con sparse, como CSC de scipy"""
+        if sparse:
+            return _sparse()[0].csc_matrix((values, (self.rows, self.cols)), shape=(self.size, self.size))
+        J = np.zeros((self.size, self.size))
+        J[self.rows, self.cols] = values
+        return J
+
+    @staticmethod
+    def _real(values, size):
+        with np.errstate(all='ignore'):
+            values = np.array(values).reshape(-1)
+        if np.iscomplexobj(values):
+            values = np.where(np.abs(values.imag) <= IMAG_TOL, values.real, np.nan)
+        # Las ecuaciones constantes devuelven un número en lugar de un arreglo
+        return np.broadcast_to(values.astype(float), (size,)) if values.size == 1 else values.astype(float)
+
+
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def _compile_system(func_str, variables):
+    equations = split_equations(func_str)
+    if not equations:
+        raise ValueError("El sistema no tiene ecuaciones")
+
+    try:
+        exprs = [sp.sympify(equation) for equation in equations]
+    except Exception as e:
+        raise ValueError(f"Error al evaluar el sistema '{func_str}': {str(e)}")
+
+    found = {str(symbol) for expr in exprs for symbol in expr.free_symbols}
+    if variables is None:
+        variables = tuple(sorted(found, key=_natural_key))
+    else:
+        unknown = found - set(variables)
+        if unknown:
+            names = ', '.join(sorted(unknown))
+            raise ValueError(f"Error al evaluar el sistema '{func_str}': símbolos no reconocidos ({names})")
+
+    if len(variables) != len(exprs):
+        raise ValueError(f"El sistema tiene {len(exprs)} ecuaciones y {len(variables)} incógnitas: "
+                         "deben ser tantas ecuaciones como incógnitas")
+    reserved = [name for name in variables if name in RESERVED_NAMES]
+    if reserved:
+        raise ValueError(f"'{reserved[0]}' no puede usarse como nombre de variable")
+
+    return CompiledSystem(func_str, exprs, variables)
+
+
+def compile_system(func_str, variables=None):
+    """Interpreta y compila un sistema una única vez (con caché LRU).
+
+    variables fija el orden de las incógnitas ("x, y" o una lista); por
+    omisión son los símbolos de las ecuaciones en orden natural (x2 antes
+    que x10).
+    """
+    return _compile_system(normalize_function(func_str), parse_names(variables))
+
+
+def use_sparse(system, sparse=None):
+    """Si el sistema se resuelve con matrices dispersas (sparse=None lo decide por tamaño y densidad)"""
+    if sparse is None:
+        sparse = system.size >= SPARSE_MIN_SIZE and system.density <= SPARSE_MAX_DENSITY
+    return bool(sparse) and _sparse() is not None
+
+
+def newton_step(J, F, sparse=False):
+    """Resuelve J dx = -F; MethodError si el jacobiano es singular"""
+    try:
+        with warnings.catch_warnings():
+            # spsolve avisa (y devuelve NaN) en lugar de fallar con una matriz singular
+            warnings.simplefilter('ignore')
+            step = _sparse()[1](J, -F) if sparse else np.linalg.solve(J, -F)
+    except (np.linalg.LinAlgError, RuntimeError):
+        step = None
+    if step is None or not np.all(np.isfinite(step)):
+        raise MethodError("Jacobiano singular. El método diverge.")
+    return step
+
+
+def line_search(system, x, F, step):
+    """Backtracking con la condición de Armijo sobre ||F||²/2.
+
+    Devuelve (t, x + t·step, F en ese punto, evaluaciones); t es None si
+    ninguna fracción del paso reduce lo suficiente ||F||.
+    """
+    f0 = F @ F
+    t = 1.0
+    for tries in range(1, MAX_BACKTRACKS + 1):
+        x_new = x + t * step
+        F_new = system(x_new)
+        if np.all(np.isfinite(F_new)) and F_new @ F_new <= (1 - 2 * ARMIJO * t) * f0:
+            return t, x_new, F_new, tries
+        t /= 2
+    return None, x, F, MAX_BACKTRACKS
+
+
+def schubert_update(values, rows, cols, s, y, size):
+    """Actualización de Broyden restringida a las entradas no nulas (Schubert).
+
+    Corrige cada fila del jacobiano para que cumpla J s = y; con el jacobiano
+    completo coincide con la actualización "buena" de Broyden.
+    """
+    s_cols = s[cols]
+    residual = y - np.bincount(rows, weights=values * s_cols, minlength=size)
+    norms = np.bincount(rows, weights=s_cols ** 2, minlength=size)
+    scale = np.divide(residual, norms, out=np.zeros(size), where=norms > 0)
+    return values + scale[rows] * s_cols
+
+
+def iter_newton_system(func_str, x0, tol=1e-6, max_iter=100, variables=None, jacobian="exact", sparse=None):
+    """Generador: produce la vista (TraceRecord) de cada iteración y devuelve la solución como lista"""
+    if jacobian not in JACOBIAN_MODES:
+        raise ValueError(f"Jacobiano no válido: {jacobian} (use {' o '.join(JACOBIAN_MODES)})")
+
+    # Compilar el sistema y su jacobiano una sola vez
+    system = compile_system(func_str, variables)
+    x = parse_point(x0, system.size)
+    sparse = use_sparse(system, sparse)
+
+    trace = Trace(system.layout, capacity=max_iter)
+    iterations = 0
+    error = 100
+
+    F = system(x)
+    evaluations = 1
+    jacobian_evaluations = 0
+    if not np.all(np.isfinite(F)):
+        raise MethodError("El sistema no está definido en el punto inicial")
+
+    # values es None cuando hay que evaluar el jacobiano exacto; exact indica si el actual lo es
+    values = None
+    exact = False
+
+    while error > tol and iterations < max_iter and np.any(F != 0):
+        if values is None:
+            values = system.jacobian_values(x)
+            jacobian_evaluations += 1
+            exact = True
+            if not np.all(np.isfinite(values)):
+                raise MethodError("El jacobiano no está definido en el punto actual")
+
+        step = newton_step(system.matrix(values, sparse), F, sparse)
+        t, x_new, F_new, tries = line_search(system, x, F, step)
+        evaluations += tries
+
+        if t is None:
+            if not exact:
+                # La aproximación de Broyden ya no da una dirección de descenso: se reevalúa el jacobiano
+                values = None
+                continue
+            if np.linalg.norm(step) <= STEP_FLOOR * max(1.0, np.linalg.norm(x)):
+                # ||F|| ya está al nivel del redondeo
+                break
+            raise MethodError("La búsqueda lineal no logra reducir ||F||. El método diverge.")
+
+        x_norm = np.linalg.norm(x_new)
+        if iterations > 0:
+            change = np.linalg.norm(x_new - x)
+            error = change / x_norm * 100 if x_norm != 0 else change * 100
+        else:
+            error = 100
+
+        yield trace.append(x_norm, np.linalg.norm(F_new), error, t, jacobian_evaluations, evaluations,
+                           *x_new[:TRACE_COMPONENTS])
+
+        if jacobian == "broyden":
+            values = schubert_update(values, system.rows, system.cols, x_new - x, F_new - F, system.size)
+            exact = False
+        else:
+            values = None
+
+        x, F = x_new, F_new
+        iterations += 1
+
+    return x.tolist()
+
+
+def newton_system_method(func_str, x0, tol=1e-6, max_iter=100, variables=None, jacobian="exact", sparse=None):
+    return collect_results(iter_newton_system(func_str, x0, tol, max_iter, variables, jacobian, sparse))
@@ -0,0 +1,154 @@
+# numerical_methods/polynomial.py
+"""Ruta rápida para funciones polinómicas.
+
+Si f(x) es un polinomio con coeficientes reales se extraen sus coeficientes
+una sola vez; con ellos f, f' y f'' se evalúan con el esquema de Horner
+(escalares o arreglos de NumPy) y todas las raíces se obtienen como valores
+propios de la matriz compañera.
+"""
+import math
+
+import numpy as np
+
+from .lazy import lazy_import
+
+sp = lazy_import('sympy')
+
+# Grado máximo para el que se usa la ruta polinómica
+MAX_DEGREE = 64
+
+# Raíces propias cuya parte imaginaria relativa es menor que esto se consideran reales
+REAL_ROOT_TOL = 1e-7
+
+# Distancia relativa para agrupar raíces repetidas (multiplicidad)
+CLUSTER_TOL = 1e-4
+
+
+def degree_bound(expr, x):
+    """Cota superior del grado en x de un polinomio, calculada sobre la expresión sin expandir.
+
+    Es exacta salvo cancelaciones entre términos; sirve para descartar los
+    polinomios de grado alto antes de que sympy los expanda.
+    """
+    if not expr.has(x):
+        return 0
+    if expr == x:
+        return 1
+    if expr.is_Add:
+        return max(degree_bound(arg, x) for arg in expr.args)
+    if expr.is_Mul:
+        return sum(degree_bound(arg, x) for arg in expr.args)
+    if expr.is_Pow and expr.exp.is_Integer and expr.exp >= 0:
+        return degree_bound(expr.base, x) * int(expr.exp)
+    return math.inf
+
+
+def polynomial_coefficients(expr, x):
+    """Coeficientes del polinomio (del mayor grado al término independiente) o None si expr no es un polinomio real"""
+    # Poly expande la expresión completa: (x + 1)**6000 tardaría segundos antes de descartarse por grado
+    if degree_bound(expr, x) > MAX_DEGREE or not expr.is_polynomial(x):
+        return None
+
+    try:
+        poly = sp.Poly(expr, x)
+    except sp.PolynomialError:
+        return None
+
+    if not (poly.domain.is_ZZ or poly.domain.is_QQ or poly.domain.is_RR) or poly.degree() > MAX_DEGREE:
+        return None
+
+    coefficients = tuple(float(c) for c in poly.all_coeffs())
+    if not all(math.isfinite(c) for c in coefficients):
+        return None
+    return coefficients
+
+
+def is_expanded(expr):
+    """True si la expresión ya está escrita como suma de monomios.
+
+    Los polinomios factorizados, como (x - 1)**3, conservan su evaluación
+    original: expandirlos pierde precisión cerca de las raíces múltiples.
+    """
+    return sp.expand(expr) == expr
+
+
+def derivative_coefficients(coefficients):
+    degree = len(coefficients) - 1
+    return tuple(c * (degree - i) for i, c in enumerate(coefficients[:-1])) or (0.0,)
+
+
+def _horner_source(coefficients):
+    # Expresión anidada ((c0*x + c1)*x + c2)...; sirve igual para floats, complejos y arreglos
+    source = repr(coefficients[0])
+    for c in coefficients[1:]:
+        source = f"({source})*x + {c!r}"
+    return source
+
+
+def horner_function(coefficients, order=0):
+    """Compila p(x) con el esquema de Horner; con order > 0 devuelve la tupla (p, p', ...)"""
+    sources = [_horner_source(coefficients)]
+    for _ in range(order):
+        coefficients = derivative_coefficients(coefficients)
+        sources.append(_horner_source(coefficients))
+
+    body = sources[0] if order == 0 else "(" + ", ".join(sources) + ",)"
+    # Solo contiene literales float generados aquí: se compila una sola vez
+    return eval(f"lambda x: {body}", {"__builtins__": {}})
+
+
+def companion_roots(coefficients):
+    """Todas las raíces (complejas) del polinomio como valores propios de su matriz compañera"""
+    coefficients = np.trim_zeros(np.asarray(coefficients, dtype=float), 'f')
+    trimmed = np.trim_zeros(coefficients, 'b')
+    # Los ceros finales son raíces exactas en x = 0
+    zeros = np.zeros(len(coefficients) - len(trimmed), dtype=complex)
+
+    degree = len(trimmed) - 1
+    if degree < 1:
+        return zeros
+
+    companion = np.zeros((degree, degree))
+    companion[0, :] = -trimmed[1:] / trimmed[0]
+    companion[1:, :-1] = np.eye(degree - 1)
+    return np.concatenate([np.linalg.eigvals(companion).astype(complex), zeros])
+
+
+def polish_root(z, value_and_derivative, tol=1e-12, max_iter=50):
+    """Pule una raíz aproximada con Newton.
+
+    Se detiene cuando el paso relativo baja de tol o el residuo deja de
+    disminuir (raíces múltiples). Devuelve (raíz, último paso, iteraciones).
+    """
+    value, derivative = value_and_derivative(z)
+    step = 0.0
+    iterations = 0
+
+    while iterations < max_iter and value != 0 and derivative != 0:
+        candidate = z - value / derivative
+        candidate_value, candidate_derivative = value_and_derivative(candidate)
+        iterations += 1
+        if not abs(candidate_value) < abs(value):
+            break
+
+        step = abs(candidate - z)
+        z, value, derivative = candidate, candidate_value, candidate_derivative
+        if step <= tol * max(1.0, abs(z)):
+            break
+
+    return z, step, iterations
+
+
+def cluster_roots(roots):
+    """Agrupa raíces repetidas: devuelve [(raíz promedio, multiplicidad)] ordenadas por parte real"""
+    clusters = []
+    for z in sorted(roots, key=lambda r: (r.real, r.imag)):
+        for cluster in clusters:
+            center = cluster[0] / cluster[1]
+            if abs(z - center) <= CLUSTER_TOL * max(1.0, abs(center)):
+                cluster[0] += z
+                cluster[1] += 1
+                break
+        else:
+            clusters.append([z, 1])
+    return [(total / count, count) for total, count in clusters]
@@ -0,0 +1,135 @@
+# numerical_methods/precision.py
+"""Precisión mixta: iteraciones en float64 y refinamiento final en precisión arbitraria.
+
+El método elegido itera en float64 hasta converger o estancarse (con float64
+no se pueden pedir errores por debajo de ~1e-15); luego unos pocos pasos de
+Newton modificado con mpmath, sobre la misma expresión compilada, llevan la
+raíz a los dígitos pedidos. Solo esos últimos pasos pagan la precisión extra.
+"""
+import math
+
+from .lazy import lazy_import
+from .utils import MethodError
+
+mpmath = lazy_import('mpmath')
+
+# Dígitos máximos que se pueden pedir
+MAX_DIGITS = 1000
+
+# Dígitos de guarda con los que se trabaja por encima de los pedidos
+GUARD_DIGITS = 10
+
+# Iteraciones seguidas sin mejorar el error para considerar estancado el método en float64
+STALL_ITERATIONS = 3
+
+# Error relativo porcentual por debajo del cual float64 ya no puede mejorar
+FLOAT_FLOOR = 1e-12
+
+# Pasos máximos de refinamiento (la convergencia es cuadrática: bastan unos pocos)
+MAX_REFINE_STEPS = 30
+
+
+def iter_mixed_precision(steps, f, digits, report):
+    """Generador: reenvía las iteraciones de steps hasta que convergen o se estancan y refina la raíz.
+
+    report (un diccionario) recibe el detalle del refinamiento (ver
+    refine_root) y "float_stage": "converged" o "stalled". Devuelve la raíz
+    refinada como float.
+    """
+    best = math.inf
+    stalled = 0
+    iterations = 0
+    x = None
+
+    try:
+        while True:
+            record = next(steps)
+            yield record
+
+            iterations += 1
+            x = record["xr"]
+            error = record["error"]
+            if error < best:
+                best, stalled = error, 0
+            else:
+                stalled += 1
+            if error <= FLOAT_FLOOR or stalled >= STALL_ITERATIONS:
+                steps.close()
+                report["float_stage"] = "stalled"
+                break
+    except StopIteration as stop:
+        x = stop.value
+        report["float_stage"] = "converged"
+
+    if x is None:
+        raise MethodError("El método no produjo una aproximación para refinar")
+
+    report["float_iterations"] = iterations
+    refined = refine_root(f, x, digits)
+    root = refined.pop("value")
+    report.update(refined)
+    return float(root)
+
+
+def refine_root(f, x0, digits):
+    """Refina x0 con Newton modificado (cuadrático también en raíces múltiples) a `digits` dígitos.
+
+    Devuelve un diccionario con la raíz como texto ("root") y como mpf
+    ("value"), los dígitos alcanzados (estimados por el tamaño del último
+    paso), el residuo |f(x)|, los pasos y las evaluaciones de f, f' y f''.
+    """
+    jet = f.mp_jet()
+
+    with mpmath.workdps(digits + GUARD_DIGITS):
+        x = mpmath.mpf(x0)
+        fx, d1, d2 = _real(jet(x))
+        evaluations = 3
+        achieved = 0
+        steps = 0
+
+        while steps < MAX_REFINE_STEPS:
+            if fx == 0:
+                achieved = digits
+                break
+
+            denominator = d1 * d1 - fx * d2
+            if denominator == 0:
+                break
+            dx = fx * d1 / denominator
+
+            x_new = x - dx
+            f_new, d1_new, d2_new = _real(jet(x_new))
+            evaluations += 3
+            steps += 1
+            if steps > 1 and abs(f_new) > abs(fx):
+                # El residuo dejó de bajar: la precisión de trabajo ya no da para más
+                break
+
+            x, fx, d1, d2 = x_new, f_new, d1_new, d2_new
+            scale = abs(x) if x != 0 else mpmath.mpf(1)
+            relative = abs(dx) / scale
+            achieved = digits if relative == 0 else min(digits, max(0, int(-mpmath.log10(relative))))
+            if achieved >= digits:
+                break
+
+        return {
+            "digits_requested": digits,
+            "digits": achieved,
+            "root": mpmath.nstr(x, max(achieved, 1)),
+            "value": x,
+            "residual": mpmath.nstr(abs(fx), 3),
+            "refine_steps": steps,
+            "refine_evaluations": evaluations
+        }
+
+
+def _real(values):
+    # mpmath devuelve complejos fuera del dominio real (log o raíces de negativos)
+    result = []
+    for value in values:
+        if isinstance(value, mpmath.mpc):
+            if value.imag != 0:
+                raise MethodError("La función no es real cerca de la raíz: no se puede refinar")
+            value = value.real
+        result.append(mpmath.mpf(value))
+    return result
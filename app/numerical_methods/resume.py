@@ -0,0 +1,101 @@
+# numerical_methods/resume.py
+"""Continuación de un cálculo guardado desde su última iteración.
+
+El estado de cada método se restaura a partir de la última fila de su traza:
+el intervalo en los métodos cerrados, los dos últimos puntos en la secante y
+el último iterado en Newton y en punto fijo. El método arranca de nuevo desde
+ese estado y sus iteraciones se agregan a una copia de la traza guardada.
+"""
+from . import bisection, brent, false_position, fixed_point, halley, newton_raphson, secant, steffensen
+from .trace import Trace, trace_from_rows
+from .utils import compile_function
+
+# Columnas de la traza de cada método que se puede continuar
+LAYOUTS = {
+    "bisection": bisection.LAYOUT,
+    "false_position": false_position.LAYOUT,
+    "illinois": false_position.LAYOUT,
+    "anderson_bjorck": false_position.LAYOUT,
+    "brent": brent.LAYOUT,
+    "newton_raphson": newton_raphson.LAYOUT,
+    "halley": halley.LAYOUT,
+    "modified_newton": halley.LAYOUT,
+    "secant": secant.LAYOUT,
+    "fixed_point": fixed_point.LAYOUT,
+    "steffensen": steffensen.LAYOUT
+}
+
+RESUMABLE_METHODS = tuple(LAYOUTS)
+
+# Métodos cuyo estado es el intervalo [a, b]
+BRACKETING = ("bisection", "false_position", "illinois", "anderson_bjorck", "brent")
+
+
+def estimate(row):
+    """Aproximación de la raíz tras una iteración (x_next en los métodos de tangente, xr en los demás)"""
+    value = row.get("x_next")
+    return row["xr"] if value is None else value
+
+
+def relative_error(new, old):
+    # Error relativo porcentual, como lo calculan los métodos
+    return abs((new - old) / new) * 100 if new != 0 else abs(new - old) * 100
+
+
+def stored_trace(method, results):
+    """Copia de la traza guardada (Trace en memoria o filas desde SQLite) a la que se pueden agregar iteraciones"""
+    if isinstance(results, Trace) and results.layout is LAYOUTS[method]:
+        return results.copy()
+    rows = results.rows() if isinstance(results, Trace) else list(results)
+    return trace_from_rows(LAYOUTS[method], rows)
+
+
+def resume_parameters(method, func_str, last):
+    """Parámetros de arranque que continúan el método desde su última iteración.
+
+    Devuelve (parámetros, evaluaciones usadas para restaurarlos) o (None, 0)
+    si la última aproximación ya es una raíz exacta. En los métodos cerrados
+    hace falta el signo de f en un extremo para saber qué mitad conservar.
+    """
+    if method == "secant":
+        return {"x0": last["b"], "x1": last["xr"]}, 0
+    if method not in BRACKETING:
+        return {"x0": estimate(last)}, 0
+
+    xr, fxr = last["xr"], last["f(xr)"]
+    if fxr == 0:
+        return None, 0
+    fa = compile_function(func_str)(last["a"])
+    return ({"a": last["a"], "b": xr} if fa * fxr < 0 else {"a": xr, "b": last["b"]}), 1
+
+
+def iter_continue(steps, trace, tol, extra_evaluations=0):
+    """Generador: agrega a trace (la copia de la guardada) las iteraciones de steps y devuelve la raíz.
+
+    Las iteraciones nuevas siguen la numeración y el conteo de evaluaciones
+    de la traza. steps arranca con error 100; el de su primera iteración se
+    recalcula respecto de la última guardada, así que si ya alcanza tol el
+    método se detiene ahí.
+    """
+    previous = estimate(trace[-1])
+    offset = trace.last("evaluations") + extra_evaluations
+    evaluations = trace.layout.positions["evaluations"]
+    error = trace.layout.positions["error"]
+    first = True
+
+    try:
+        while True:
+            record = next(steps)
+            values = record.trace.data[:, record.index].copy()
+            values[evaluations] += offset
+            if first:
+                values[error] = relative_error(estimate(record), previous)
+            current = trace.append(*values)
+            yield current
+
+            if first and current["error"] <= tol:
+                steps.close()
+                return estimate(current)
+            first = False
+    except StopIteration as stop:
+        return stop.value
@@ -1,21 +1,38 @@
 # numerical_methods/secant.py
-from .utils import evaluate_function
-
-def secant_method(func_str, x0, x1, tol=1e-6, max_iter=100):
-    results = []
+from .trace import Trace, TraceLayout
+from .utils import compile_function, collect_results, MethodError
+
+# Columnas de la traza y su vista como filas de resultados y puntos de animación
+LAYOUT = TraceLayout(
+    ("a", "b", "xr", "f(xr)", "error", "m_secant", "b_secant", "f_x0", "f_x1", "evaluations"),
+    (("iteration", "iteration"), ("a", "a"), ("b", "b"), ("xr", "xr"), ("f(xr)", "f(xr)"), ("error", "error"),
+     ("m_secant", "m_secant"), ("b_secant", "b_secant"),
+     ("evaluations", "evaluations")),
+    (("x0", "a"), ("x1", "b"), ("f_x0", "f_x0"), ("f_x1", "f_x1"), ("m_secant", "m_secant"), ("b_secant", "b_secant"),
+     ("x_new", "xr"))
+)
+
+
+def iter_secant(func_str, x0, x1, tol=1e-6, max_iter=100):
+    """Generador: produce la vista (TraceRecord) de cada iteración y devuelve la raíz"""
+    trace = Trace(LAYOUT, capacity=max_iter)
     iterations = 0
     error = 100
 
-    # Lista para almacenar los puntos de la animación
-    animation_points = []
+    # Compilar la función una sola vez para todas las iteraciones
+    f = compile_function(func_str)
 
-    f_x0 = evaluate_function(func_str, x0)
+    f_x0 = f(x0)
+    f_x1 = f(x1)
+    evaluations = 2
 
     while error > tol and iterations < max_iter:
-        f_x1 = evaluate_function(func_str, x1)
-
         if abs(f_x1 - f_x0) < 1e-10:  # Evitar división por cero
-            return {"error": "División por cero. El método diverge."}
+            if abs(f_x1) < 1e-10 and abs(x1 - x0) < tol:
+                # Ya en la raíz (al límite de float64): la secante no puede avanzar más. Con un paso
+                # grande un f pequeño no basta (funciones planas de escala chica)
+                break
+            raise MethodError("División por cero. El método diverge.")
 
         # Calcular la secante para la visualización
         m_secant = (f_x1 - f_x0) / (x1 - x0)
@@ -23,34 +40,23 @@ def secant_method(func_str, x0, x1, tol=1e-6, max_iter=100):
 
         x_new = x1 - f_x1 * (x1 - x0) / (f_x1 - f_x0)
 
-        # Almacenar puntos para la animación
-        animation_points.append({
-            "x0": x0,
-            "x1": x1,
-            "f_x0": f_x0,
-            "f_x1": f_x1,
-            "m_secant": m_secant,
-            "b_secant": b_secant,
-            "x_new": x_new
-        })
+        f_x_new = f(x_new)
+        evaluations += 1
 
         error = abs((x_new - x1) / x_new) * 100 if x_new != 0 else abs(x_new - x1) * 100
 
-        results.append({
-            "iteration": iterations,
-            "a": x0,
-            "b": x1,
-            "xr": x_new,
-            "f(xr)": evaluate_function(func_str, x_new),
-            "error": error,
-            "m_secant": m_secant,  # Para la animación
-            "b_secant": b_secant  # Para la animación
-        })
+        # Guardar la iteración (resultados y animación comparten las columnas)
+        yield trace.append(x0, x1, x_new, f_x_new, error, m_secant, b_secant, f_x0, f_x1, evaluations)
 
         x0 = x1
         f_x0 = f_x1
         x1 = x_new
+        f_x1 = f_x_new
         iterations += 1
 
     root = x1
-    return {"results": results, "root": root, "animation_points": animation_points}
\ No newline at end of file
+    return root
+
+
+def secant_method(func_str, x0, x1, tol=1e-6, max_iter=100, precision=None):
+    return collect_results(iter_secant(func_str, x0, x1, tol, max_iter), func_str, precision)
@@ -0,0 +1,66 @@
+# numerical_methods/steffensen.py
+from .trace import Trace, TraceLayout
+from .utils import compile_function, collect_results, MethodError
+
+# Columnas de la traza y su vista como filas de resultados y puntos de animación
+# (a y b no aplican; la animación reutiliza la de punto fijo)
+LAYOUT = TraceLayout(
+    ("x_prev", "g_x_prev", "g_g_x_prev", "xr", "f(xr)", "error", "evaluations"),
+    (("iteration", "iteration"), ("a", None), ("b", None), ("xr", "xr"), ("f(xr)", "f(xr)"), ("error", "error"),
+     ("x_prev", "x_prev"), ("g_x_prev", "g_x_prev"), ("g_g_x_prev", "g_g_x_prev"),
+     ("evaluations", "evaluations")),
+    (("x", "x_prev"), ("g_x", "g_x_prev"), ("f_g_x", "f(xr)"))
+)
+
+
+def iter_steffensen(func_str, g_func_str, x0, tol=1e-6, max_iter=100):
+    """Generador: produce la vista (TraceRecord) de cada iteración y devuelve la raíz.
+
+    Punto fijo acelerado con el Δ² de Aitken: a partir de x, g(x) y g(g(x))
+    extrapola el límite de la sucesión, con convergencia cuadrática.
+    """
+    trace = Trace(LAYOUT, capacity=max_iter)
+    iterations = 0
+    error = 100
+    evaluations = 0
+    x = x0
+
+    # Compilar f y g una sola vez para todas las iteraciones
+    f = compile_function(func_str)
+    g = compile_function(g_func_str)
+
+    while error > tol and iterations < max_iter:
+        g_x = g(x)
+        g_g_x = g(g_x)
+        evaluations += 2
+
+        denominator = g_g_x - 2 * g_x + x
+        if denominator == 0:
+            # La sucesión ya no avanza: g(x) es el punto fijo
+            x_new = g_g_x
+        else:
+            x_new = x - (g_x - x) ** 2 / denominator
+
+        if x_new != x_new or abs(x_new) == float('inf'):
+            raise MethodError("La extrapolación de Aitken no es un número finito. El método diverge.")
+
+        f_x_new = f(x_new)
+        evaluations += 1
+
+        if iterations > 0:
+            error = abs((x_new - x) / x_new) * 100 if x_new != 0 else abs(x_new - x) * 100
+        else:
+            error = 100
+
+        # Guardar la iteración (resultados y animación comparten las columnas)
+        yield trace.append(x, g_x, g_g_x, x_new, f_x_new, error, evaluations)
+
+        x = x_new
+        iterations += 1
+
+    root = x
+    return root
+
+
+def steffensen_method(func_str, g_func_str, x0, tol=1e-6, max_iter=100, precision=None):
+    return collect_results(iter_steffensen(func_str, g_func_str, x0, tol, max_iter), func_str, precision)
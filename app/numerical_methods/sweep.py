@@ -0,0 +1,217 @@
+# numerical_methods/sweep.py
+"""Barridos paramétricos: resuelven f(x; p) para arreglos de parámetros a la vez.
+
+Cada instancia (carril) itera con las mismas reglas y el mismo criterio de
+error que la versión escalar del método, pero todas avanzan juntas con
+operaciones vectorizadas de NumPy. Los carriles que convergen o fallan dejan
+de evaluarse. En lugar de la traza por iteración se devuelven arreglos
+compactos con la forma común (broadcast) de los argumentos:
+
+    roots, residuals, errors, iterations, converged, failed
+"""
+import numpy as np
+
+from .utils import compile_function
+
+
+def _prepare(func_str, params, *starts):
+    # Compila f con los parámetros y lleva todos los arreglos a una forma común
+    params = params or {}
+    names = tuple(params)
+    f = compile_function(func_str, names)
+
+    arrays = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in starts),
+                                 *(np.asarray(params[name], dtype=float) for name in names))
+    shape = arrays[0].shape if arrays else ()
+    flat = [np.array(arr, dtype=float).ravel() for arr in arrays]
+
+    return f, shape, flat[:len(starts)], flat[len(starts):]
+
+
+def _relative_error(new, old):
+    # Mismo criterio que los métodos escalares: error relativo porcentual
+    with np.errstate(all='ignore'):
+        return np.where(new != 0, np.abs((new - old) / new) * 100, np.abs(new - old) * 100)
+
+
+def _sweep_result(f, shape, p, roots, errors, iterations, failed, tol):
+    roots = np.where(failed, np.nan, roots)
+    return {
+        "roots": roots.reshape(shape),
+        "residuals": f.vectorized(roots, *p).reshape(shape),
+        "errors": errors.reshape(shape),
+        "iterations": iterations.reshape(shape),
+        "converged": (~failed & (errors <= tol)).reshape(shape),
+        "failed": failed.reshape(shape)
+    }
+
+
+def _bracketing_sweep(func_str, a, b, params, tol, max_iter, next_point):
+    f, shape, (a, b), p = _prepare(func_str, params, a, b)
+    n = a.size
+
+    fa = f.vectorized(a, *p)
+    fb = f.vectorized(b, *p)
+
+    roots = np.full(n, np.nan)
+    errors = np.full(n, 100.0)
+    iterations = np.zeros(n, dtype=int)
+
+    # Los carriles sin cambio de signo (o con valores indefinidos) fallan desde el inicio
+    with np.errstate(invalid='ignore'):
+        failed = ~(fa * fb < 0)
+    active = ~failed
+
+    iteration = 0
+    while iteration < max_iter and active.any():
+        idx = np.flatnonzero(active)
+        a_i, b_i, fa_i, fb_i = a[idx], b[idx], fa[idx], fb[idx]
+
+        with np.errstate(all='ignore'):
+            c = next_point(a_i, b_i, fa_i, fb_i)
+        fc = f.vectorized(c, *(q[idx] for q in p))
+
+        error = np.full(idx.size, 100.0) if iteration == 0 else _relative_error(c, roots[idx])
+
+        roots[idx] = c
+        errors[idx] = error
+        iterations[idx] += 1
+
+        # Conservar el subintervalo donde la función cambia de signo
+        left = fa_i * fc < 0
+        b[idx] = np.where(left, c, b_i)
+        fb[idx] = np.where(left, fc, fb_i)
+        a[idx] = np.where(left, a_i, c)
+        fa[idx] = np.where(left, fa_i, fc)
+
+        bad = ~np.isfinite(fc)
+        failed[idx[bad]] = True
+        active[idx] = ~bad & (error > tol)
+        iteration += 1
+
+    return _sweep_result(f, shape, p, roots, errors, iterations, failed, tol)
+
+
+def bisection_sweep(func_str, a, b, params=None, tol=1e-6, max_iter=100):
+    """Bisección vectorizada sobre arreglos de intervalos y/o parámetros"""
+    return _bracketing_sweep(func_str, a, b, params, tol, max_iter,
+                             lambda a, b, fa, fb: (a + b) / 2)
+
+
+def false_position_sweep(func_str, a, b, params=None, tol=1e-6, max_iter=100):
+    """Falsa posición vectorizada sobre arreglos de intervalos y/o parámetros"""
+    return _bracketing_sweep(func_str, a, b, params, tol, max_iter,
+                             lambda a, b, fa, fb: b - fb * (b - a) / (fb - fa))
+
+
+def newton_raphson_sweep(func_str, x0, params=None, tol=1e-6, max_iter=100):
+    """Newton-Raphson vectorizado sobre arreglos de puntos iniciales y/o parámetros"""
+    f, shape, (x,), p = _prepare(func_str, params, x0)
+    f_prime = f.derivative()
+    n = x.size
+
+    errors = np.full(n, 100.0)
+    iterations = np.zeros(n, dtype=int)
+    failed = np.zeros(n, dtype=bool)
+    active = np.ones(n, dtype=bool)
+
+    iteration = 0
+    while iteration < max_iter and active.any():
+        idx = np.flatnonzero(active)
+        x_i = x[idx]
+        p_i = [q[idx] for q in p]
+
+        f_x = f.vectorized(x_i, *p_i)
+        f_prime_x = f_prime.vectorized(x_i, *p_i)
+
+        # Derivada casi nula o valores indefinidos: el carril diverge
+        bad = ~np.isfinite(f_x) | ~np.isfinite(f_prime_x) | (np.abs(f_prime_x) < 1e-10)
+        with np.errstate(all='ignore'):
+            x_new = x_i - f_x / f_prime_x
+
+        error = np.full(idx.size, 100.0) if iteration == 0 else _relative_error(x_new, x_i)
+
+        ok = ~bad
+        x[idx[ok]] = x_new[ok]
+        errors[idx[ok]] = error[ok]
+        iterations[idx[ok]] += 1
+
+        failed[idx[bad]] = True
+        active[idx] = ok & (error > tol)
+        iteration += 1
+
+    return _sweep_result(f, shape, p, x, errors, iterations, failed, tol)
+
+
+def secant_sweep(func_str, x0, x1, params=None, tol=1e-6, max_iter=100):
+    """Secante vectorizada sobre arreglos de puntos iniciales y/o parámetros"""
+    f, shape, (x0, x1), p = _prepare(func_str, params, x0, x1)
+    n = x0.size
+
+    f_x0 = f.vectorized(x0, *p)
+    f_x1 = f.vectorized(x1, *p)
+
+    errors = np.full(n, 100.0)
+    iterations = np.zeros(n, dtype=int)
+    failed = np.zeros(n, dtype=bool)
+    active = np.ones(n, dtype=bool)
+
+    iteration = 0
+    while iteration < max_iter and active.any():
+        idx = np.flatnonzero(active)
+        x0_i, x1_i, f0_i, f1_i = x0[idx], x1[idx], f_x0[idx], f_x1[idx]
+
+        # Secante casi horizontal: el carril diverge
+        with np.errstate(invalid='ignore'):
+            bad = ~(np.abs(f1_i - f0_i) >= 1e-10)
+        with np.errstate(all='ignore'):
+            x_new = x1_i - f1_i * (x1_i - x0_i) / (f1_i - f0_i)
+        f_new = f.vectorized(x_new, *(q[idx] for q in p))
+        bad |= ~np.isfinite(f_new)
+
+        error = _relative_error(x_new, x1_i)
+
+        ok = ~bad
+        x0[idx[ok]] = x1_i[ok]
+        f_x0[idx[ok]] = f1_i[ok]
+        x1[idx[ok]] = x_new[ok]
+        f_x1[idx[ok]] = f_new[ok]
+        errors[idx[ok]] = error[ok]
+        iterations[idx[ok]] += 1
+
+        failed[idx[bad]] = True
+        active[idx] = ok & (error > tol)
+        iteration += 1
+
+    return _sweep_result(f, shape, p, x1, errors, iterations, failed, tol)
+
+
+def fixed_point_sweep(func_str, g_func_str, x0, params=None, tol=1e-6, max_iter=100):
+    """Punto fijo vectorizado sobre arreglos de puntos iniciales y/o parámetros"""
+    f, shape, (x,), p = _prepare(func_str, params, x0)
+    g = compile_function(g_func_str, f.params)
+    n = x.size
+
+    errors = np.full(n, 100.0)
+    iterations = np.zeros(n, dtype=int)
+    failed = np.zeros(n, dtype=bool)
+    active = np.ones(n, dtype=bool)
+
+    iteration = 0
+    while iteration < max_iter and active.any():
+        idx = np.flatnonzero(active)
+        x_i = x[idx]
+        x_new = g.vectorized(x_i, *(q[idx] for q in p))
+
+        error = np.full(idx.size, 100.0) if iteration == 0 else _relative_error(x_new, x_i)
+
+        ok = np.isfinite(x_new)
+        x[idx[ok]] = x_new[ok]
+        errors[idx[ok]] = error[ok]
+        iterations[idx[ok]] += 1
+
+        failed[idx[~ok]] = True
+        active[idx] = ok & (error > tol)
+        iteration += 1
+
+    return _sweep_result(f, shape, p, x, errors, iterations, failed, tol)
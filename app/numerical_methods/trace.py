@@ -0,0 +1,172 @@
+# numerical_methods/trace.py
+import numpy as np
+
+# Capacidad inicial máxima: las trazas crecen al doble si se llenan
+INITIAL_CAPACITY = 1024
+
+
+class TraceLayout:
+    """Describe las columnas de una traza y cómo se ven como filas de resultados y puntos de animación.
+
+    result_fields y animation_fields son tuplas (clave, columna). La columna
+    "iteration" es el número de iteración y None produce siempre None (por
+    ejemplo a y b en Newton-Raphson). Las columnas de counters (como
+    "evaluations") se devuelven como enteros.
+    """
+
+    def __init__(self, columns, result_fields, animation_fields, counters=("evaluations",)):
+        self.columns = tuple(columns)
+        self.counters = frozenset(counters)
+        self.positions = {name: i for i, name in enumerate(self.columns)}
+        self.result_fields = tuple(result_fields)
+        self.animation_fields = tuple(animation_fields)
+
+        # Todas las claves visibles (filas y animación) con su columna de origen
+        self.lookup = dict(self.animation_fields)
+        self.lookup.update(self.result_fields)
+
+
+class Trace:
+    """Traza de iteraciones en columnas: un arreglo float preasignado por columna"""
+
+    __slots__ = ('layout', 'data', 'size')
+
+    def __init__(self, layout, capacity=INITIAL_CAPACITY):
+        self.layout = layout
+        self.data = np.empty((len(layout.columns), max(1, min(capacity, INITIAL_CAPACITY))))
+        self.size = 0
+
+    def append(self, *values):
+        """Agrega una iteración (valores en el orden de layout.columns) y devuelve su vista"""
+        if self.size == self.data.shape[1]:
+            grown = np.empty((self.data.shape[0], self.size * 2))
+            grown[:, :self.size] = self.data
+            self.data = grown
+        self.data[:, self.size] = values
+        self.size += 1
+        return TraceRecord(self, self.size - 1)
+
+    def column(self, key):
+        """Valores de una clave (de resultados o de animación) como lista"""
+        source = self.layout.lookup[key]
+        if source == "iteration":
+            return list(range(self.size))
+        if source is None:
+            return [None] * self.size
+        values = self.data[self.layout.positions[source], :self.size]
+        if source in self.layout.counters:
+            values = values.astype(int)
+        return values.tolist()
+
+    def rows(self):
+        """Filas de resultados como diccionarios (formato clásico de la API)"""
+        return self._dicts(self.layout.result_fields)
+
+    def animation_points(self):
+        """Puntos de animación como diccionarios (formato clásico de la API)"""
+        return self._dicts(self.layout.animation_fields)
+
+    def to_columns(self, fields):
+        """Formato columnar compacto: {clave: [valores...]} solo con las claves pedidas"""
+        if not self.layout.columns:
+            return {field: [] for field in fields}
+        unknown = [field for field in fields if field not in self.layout.lookup]
+        if unknown:
+            raise KeyError(', '.join(unknown))
+        return {field: self.column(field) for field in fields}
+
+    def copy(self):
+        """Copia independiente (para seguir agregando iteraciones sin tocar la original)"""
+        trace = Trace(self.layout, capacity=1)
+        trace.data = self.data[:, :max(self.size, 1)].copy()
+        trace.size = self.size
+        return trace
+
+    def last(self, key, default=None):
+        return self[-1][key] if self.size else default
+
+    @property
+    def nbytes(self):
+        return self.size * len(self.layout.columns) * self.data.itemsize
+
+    def _dicts(self, fields):
+        keys = [key for key, _ in fields]
+        columns = [self.column(key) for key in keys]
+        return [dict(zip(keys, values)) for values in zip(*columns)]
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("Índice de iteración fuera de rango")
+        return TraceRecord(self, index)
+
+    def __iter__(self):
+        return (TraceRecord(self, i) for i in range(self.size))
+
+
+class TraceRecord:
+    """Vista de una iteración de la traza que se comporta como la fila de resultados (dict)"""
+
+    __slots__ = ('trace', 'index')
+
+    def __init__(self, trace, index):
+        self.trace = trace
+        self.index = index
+
+    def __getitem__(self, key):
+        source = self.trace.layout.lookup[key]
+        if source == "iteration":
+            return self.index
+        if source is None:
+            return None
+        value = self.trace.data[self.trace.layout.positions[source], self.index]
+        return int(value) if source in self.trace.layout.counters else float(value)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        return key in self.trace.layout.lookup
+
+    def keys(self):
+        return [key for key, _ in self.trace.layout.result_fields]
+
+    def row(self):
+        """La iteración como fila de resultados (dict)"""
+        return {key: self[key] for key, _ in self.trace.layout.result_fields}
+
+    def point(self):
+        """La iteración como punto de animación (dict)"""
+        return {key: self[key] for key, _ in self.trace.layout.animation_fields}
+
+
+# Traza vacía (sin iteraciones) para los métodos que no llegan a iterar
+EMPTY_LAYOUT = TraceLayout((), (), ())
+
+
+def empty_trace():
+    return Trace(EMPTY_LAYOUT, capacity=1)
+
+
+def trace_from_rows(layout, rows):
+    """Rearma una traza desde filas de resultados (como las devuelve el historial en SQLite).
+
+    Las columnas que no aparecen en las filas (solo de animación) quedan en NaN.
+    """
+    sources = {column: key for key, column in layout.result_fields if column not in (None, "iteration")}
+    trace = Trace(layout, capacity=max(len(rows), 1))
+    for row in rows:
+        trace.append(*(_float(row.get(sources[column])) if column in sources else np.nan
+                       for column in layout.columns))
+    return trace
+
+
+def _float(value):
+    return np.nan if value is None else value
@@ -1,20 +1,298 @@
 # numerical_methods/utils.py
-import sympy as sp
+import math
+import time
+from functools import lru_cache
+
+import numpy as np
+
+from .autodiff import Dual, DUAL_FUNCTIONS
+from .lazy import lazy_import
+from .polynomial import polynomial_coefficients, is_expanded, horner_function
+from .trace import empty_trace
+
+# sympy tarda casi medio segundo en importarse: se carga con la primera función compilada
+sp = lazy_import('sympy')
+
+# Número máximo de expresiones compiladas que se conservan en memoria
+COMPILE_CACHE_SIZE = 256
+
+# Módulos usados por lambdify para la evaluación escalar (en orden de prioridad)
+SCALAR_MODULES = ['math', 'mpmath', 'sympy']
+
+# Tamaño máximo (en operaciones) de una expresión para derivarla con sympy;
+# las más grandes se derivan con diferenciación automática (números duales)
+SYMBOLIC_DIFF_MAX_OPS = 200
+
+# Parte imaginaria máxima aceptada al convertir resultados complejos a reales
+IMAG_TOL = 1e-12
+
+
+class MethodError(Exception):
+    """Error propio del método numérico (divergencia, intervalo inválido...)"""
+
+
+def normalize_function(func_str):
+    """Normaliza la cadena de una función para que sympy pueda interpretarla"""
+    # Pre-procesar la expresión para manejar exponenciales
+    func_str = func_str.replace('e^', 'exp')
+    func_str = func_str.replace('e**', 'exp')
+
+    # Reemplazar múltiples formas de exponencial
+    if '\\cdot' in func_str:
+        func_str = func_str.replace('\\cdot', '*')
+
+    return func_str.strip()
+
+
+def x_symbol():
+    """Símbolo de la variable independiente compartido por todas las funciones compiladas"""
+    return sp.Symbol('x')
+
+
+class CompiledFunction:
+    """Función de x (y de parámetros opcionales) interpretada una sola vez y compilada a un callable numérico"""
+
+    def __init__(self, source, expr, params=()):
+        self.source = source
+        self.expr = expr
+        self.params = tuple(params)
+        self.symbols = (x_symbol(),) + tuple(sp.Symbol(name) for name in self.params)
+        self._scalar = sp.lambdify(self.symbols, expr, modules=SCALAR_MODULES)
+        self._vector = None
+        self._derivative = None
+        self._jets = {}
+        self._dual = None
+        self._mp_jet = None
+        self.diff_mode = 'symbolic' if sp.count_ops(expr) <= SYMBOLIC_DIFF_MAX_OPS else 'autodiff'
+
+        # Polinomios en x: coeficientes para Horner y para el método de todas las raíces
+        self.coefficients = polynomial_coefficients(expr, x_symbol()) if not self.params else None
+        self._horner = None
+        if self.coefficients is not None and is_expanded(expr):
+            self._horner = horner_function(self.coefficients)
+
+    def __call__(self, x_val, *param_values):
+        if self._horner is not None:
+            value = self._horner(float(x_val))
+            if math.isfinite(value):
+                return value
+
+        try:
+            return float(self._scalar(x_val, *param_values))
+        except Exception:
+            # La ruta rápida falló (dominio, desbordamiento...): se evalúa con sympy
+            # para conservar exactamente el comportamiento de la evaluación simbólica
+            try:
+                return float(self.expr.subs(list(zip(self.symbols, (x_val,) + param_values))))
+            except Exception as e:
+                raise ValueError(f"Error al evaluar la función '{self.source}': {str(e)}")
+
+    def vectorized(self, x_values, *param_values):
+        """Evalúa la función sobre arreglos completos; los puntos fuera del dominio quedan como NaN"""
+        x_values = np.asarray(x_values, dtype=float)
+        param_values = tuple(np.asarray(p, dtype=float) for p in param_values)
+        shape = np.broadcast_shapes(x_values.shape, *(p.shape for p in param_values))
+
+        if self._horner is not None:
+            with np.errstate(all='ignore'):
+                values = np.broadcast_to(self._horner(x_values), shape).astype(float)
+            values[~np.isfinite(values)] = np.nan
+            return values
+
+        if self._vector is None:
+            self._vector = sp.lambdify(self.symbols, self.expr, modules='numpy')
+
+        try:
+            with np.errstate(all='ignore'):
+                values = np.asarray(self._vector(x_values, *param_values))
+
+            if np.iscomplexobj(values):
+                values = np.where(np.abs(values.imag) <= IMAG_TOL, values.real, np.nan)
+
+            values = np.broadcast_to(values.astype(float), shape).copy()
+        except Exception:
+            # La expresión usa funciones sin equivalente en NumPy: evaluar punto a punto
+            points = np.broadcast(x_values, *param_values)
+            values = np.array([self._safe_call(*point) for point in points], dtype=float).reshape(shape)
+
+        values[~np.isfinite(values)] = np.nan
+        return values
+
+    def _safe_call(self, x_val, *param_values):
+        try:
+            return self(x_val, *param_values)
+        except ValueError:
+            return np.nan
+
+    def derivatives(self, x_val, *param_values, order=1):
+        """Evalúa f y sus derivadas hasta el orden indicado (1 o 2) en una sola pasada.
+
+        Devuelve la tupla (f, f') o (f, f', f''). Las derivadas simbólicas se
+        compilan una sola vez junto con f (compartiendo subexpresiones); si no
+        aplican se usa diferenciación automática. Los polinomios usan Horner.
+        """
+        if self._horner is not None:
+            values = self._jet(order)(float(x_val))
+            if all(math.isfinite(v) for v in values):
+                return values
+
+        if self.diff_mode == 'symbolic':
+            try:
+                return tuple(float(v) for v in self._jet(order)(x_val, *param_values))
+            except Exception:
+                pass
+
+        try:
+            return self._dual_values(x_val, param_values, order)
+        except Exception:
+            # Último recurso: cada derivada por separado (con la evaluación simbólica de respaldo)
+            values = [self(x_val, *param_values)]
+            function = self
+            for _ in range(order):
+                function = function.derivative()
+                values.append(function(x_val, *param_values))
+            return tuple(values)
+
+    def _jet(self, order):
+        if order not in self._jets and self._horner is not None:
+            self._jets[order] = horner_function(self.coefficients, order)
+        elif order not in self._jets:
+            exprs = [self.expr]
+            function = self
+            for _ in range(order):
+                function = function.derivative()
+                exprs.append(function.expr)
+            self._jets[order] = sp.lambdify(self.symbols, exprs, modules=SCALAR_MODULES, cse=True)
+        return self._jets[order]
+
+    def _dual_values(self, x_val, param_values, order):
+        if self._dual is None:
+            self._dual = sp.lambdify(self.symbols, self.expr, modules=[DUAL_FUNCTIONS, 'math'])
+
+        value = self._dual(Dual.variable(x_val), *param_values)
+        if not isinstance(value, Dual):
+            # La expresión no depende de x
+            value = Dual(value)
+        return (float(value.v), float(value.d1), float(value.d2))[:order + 1]
+
+    def mp_jet(self):
+        """f, f' y f'' compiladas para mpmath (la precisión la fija mpmath.mp.dps).
+
+        Las constantes decimales se toman exactas (0.1 = 1/10) para que no
+        limiten la precisión a la de un float.
+        """
+        if self._mp_jet is None:
+            first = self.derivative()
+            exprs = [sp.nsimplify(expr, rational=True) for expr in (self.expr, first.expr, first.derivative().expr)]
+            self._mp_jet = sp.lambdify(self.symbols, exprs, modules='mpmath', cse=True)
+        return self._mp_jet
+
+    def derivative(self):
+        """Devuelve la derivada compilada, calculándola solo la primera vez"""
+        if self._derivative is None:
+            derivative_expr = sp.diff(self.expr, x_symbol())
+            self._derivative = CompiledFunction(str(derivative_expr), derivative_expr, self.params)
+        return self._derivative
+
+
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def _compile_normalized(func_str, params):
+    if 'x' in params:
+        raise ValueError("'x' es la variable independiente y no puede usarse como parámetro")
+
+    try:
+        expr = sp.sympify(func_str)
+    except Exception as e:
+        raise ValueError(f"Error al evaluar la función '{func_str}': {str(e)}")
+
+    unknown = expr.free_symbols - {x_symbol()} - {sp.Symbol(name) for name in params}
+    if unknown:
+        names = ', '.join(sorted(str(s) for s in unknown))
+        raise ValueError(f"Error al evaluar la función '{func_str}': símbolos no reconocidos ({names})")
+
+    return CompiledFunction(func_str, expr, params)
+
+
+def compile_function(func_str, params=()):
+    """Interpreta y compila una función una única vez (con caché LRU).
+
+    params es una secuencia opcional con los nombres de símbolos adicionales
+    que la función recibe después de x.
+    """
+    return _compile_normalized(normalize_function(func_str), tuple(params))
+
+
+def compile_cache_stats():
+    """Estadísticas de aciertos y fallos de la caché de funciones compiladas"""
+    info = _compile_normalized.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize
+    }
+
+
+def clear_compile_cache():
+    """Vacía la caché de funciones compiladas"""
+    _compile_normalized.cache_clear()
+
 
 def evaluate_function(func_str, x_val):
     """Evalúa una expresión matemática de forma segura"""
+    return compile_function(func_str)(x_val)
+
+
+def collect_iterations(steps, max_evaluations=None, deadline=None, on_record=None):
+    """Consume el generador de un método y arma el diccionario de resultados.
+
+    "results" es la traza columnar del método (ver trace.py): se comporta como
+    la lista de filas clásica y también da los puntos de animación.
+
+    Si el método supera max_evaluations evaluaciones de la función o llega el
+    instante deadline (time.monotonic()) se detiene y devuelve el error junto
+    con la traza parcial ("partial": True). on_record recibe cada iteración.
+    """
+    trace = None
+
     try:
-        # Pre-procesar la expresión para manejar exponenciales
-        func_str = func_str.replace('e^', 'exp')
-        func_str = func_str.replace('e**', 'exp')
+        while True:
+            record = next(steps)
+            trace = record.trace
+            if on_record is not None:
+                on_record(record)
 
-        # Reemplazar múltiples formas de exponencial
-        if '\\cdot' in func_str:
-            func_str = func_str.replace('\\cdot', '*')
+            if max_evaluations is not None and record.get("evaluations", 0) > max_evaluations:
+                error = f"Se agotó el presupuesto de {max_evaluations} evaluaciones de la función"
+                return {"error": error, "results": trace, "root": None, "partial": True}
+            if deadline is not None and time.monotonic() > deadline:
+                return {"error": "Tiempo de cálculo agotado", "results": trace, "root": None, "partial": True}
+    except StopIteration as stop:
+        root = stop.value
+    except MethodError as e:
+        return {"error": str(e)}
 
-        x = sp.Symbol('x')
-        expr = sp.sympify(func_str)
-        return float(expr.subs(x, x_val))
-    except Exception as e:
-        # Proporcionar un mensaje de error más descriptivo
-        raise ValueError(f"Error al evaluar la función '{func_str}': {str(e)}")
\ No newline at end of file
+    return {"results": trace if trace is not None else empty_trace(), "root": root}
+
+
+def collect_results(steps, func_str=None, precision=None):
+    """Resultado de las funciones *_method: como collect_iterations, con la forma clásica de la API.
+
+    "results" es la lista de filas (diccionarios) y "animation_points" la de
+    puntos de animación, serializables con json.dumps. Con precision (dígitos)
+    la raíz final de func_str se refina en precisión arbitraria (ver
+    precision.py) y el detalle queda en "precision".
+    """
+    report = {}
+    if precision is not None:
+        from .precision import iter_mixed_precision
+        steps = iter_mixed_precision(steps, compile_function(func_str), precision, report)
+
+    result = collect_iterations(steps)
+    if "results" in result:
+        trace = result["results"]
+        result["results"] = trace.rows()
+        result["animation_points"] = trace.animation_points()
+        if precision is not None:
+            result["precision"] = report
+    return result
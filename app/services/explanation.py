@@ -20,6 +20,25 @@ def generate_explanation(method, func_str, root, results):
 
         El error final fue de {results[-1]['error']:.6f}%, lo que indica una buena aproximación a la raíz real.
         """
+    elif method in ["illinois", "anderson_bjorck"]:
+        variant = "Illinois" if method == "illinois" else "Anderson-Björck"
+        explanation = f"""
+        La variante {variant} de la falsa posición encontró que {root:.6f} es una raíz de la función f(x) = {func_str}.
+
+        Cuando un extremo del intervalo se conserva dos veces seguidas, se reduce el valor de f en ese extremo para que la recta no se estanque.
+        El resultado se obtuvo en {len(results)} iteraciones y {results[-1]['evaluations']} evaluaciones de la función, con un error final de {results[-1]['error']:.6f}%.
+
+        Así conserva la seguridad del intervalo y converge mucho más rápido que la falsa posición clásica en funciones convexas.
+        """
+    elif method == "brent":
+        explanation = f"""
+        El método de Brent determinó que {root:.6f} es una raíz de la función f(x) = {func_str}.
+
+        En cada paso elige entre interpolación cuadrática inversa, secante y bisección, sin perder nunca el intervalo que contiene la raíz.
+        Necesitó {len(results)} iteraciones y {results[-1]['evaluations']} evaluaciones de la función, con un error final de {results[-1]['error']:.6f}%.
+
+        Combina la rapidez de los métodos abiertos con la garantía de convergencia de la bisección.
+        """
     elif method == "fixed_point":
         explanation = f"""
         El método de punto fijo determinó que {root:.6f} es una raíz de la función f(x) = {func_str}.
@@ -29,6 +48,15 @@ def generate_explanation(method, func_str, root, results):
 
         En términos prácticos, esto significa que cuando x = {root:.6f}, la función f(x) = {func_str} se anula.
         """
+    elif method == "steffensen":
+        explanation = f"""
+        El método de Steffensen determinó que {root:.6f} es una raíz de la función f(x) = {func_str}.
+
+        A partir de x, g(x) y g(g(x)) aplica la extrapolación Δ² de Aitken, que acelera la iteración de punto fijo hasta una convergencia cuadrática.
+        Después de {len(results)} iteraciones y {results[-1]['evaluations']} evaluaciones, {root:.6f} es un punto fijo de g(x) y, por lo tanto, una raíz de f(x).
+
+        El error final fue de {results[-1]['error']:.6f}%.
+        """
     elif method == "newton_raphson":
         explanation = f"""
         El método de Newton-Raphson calculó que {root:.6f} es una raíz de la función f(x) = {func_str}.
@@ -38,6 +66,24 @@ def generate_explanation(method, func_str, root, results):
 
         La característica de convergencia cuadrática de este método lo hace muy eficiente cuando se cuenta con un buen punto inicial.
         """
+    elif method == "halley":
+        explanation = f"""
+        El método de Halley calculó que {root:.6f} es una raíz de la función f(x) = {func_str}.
+
+        Además de la primera derivada, este método usa la segunda derivada para corregir la curvatura de la función.
+        La convergencia fue alcanzada en {len(results)} iteraciones con un error de {results[-1]['error']:.6f}%.
+
+        Su convergencia cúbica requiere menos iteraciones que Newton-Raphson cuando se parte cerca de la raíz.
+        """
+    elif method == "modified_newton":
+        explanation = f"""
+        El método de Newton modificado determinó que {root:.6f} es una raíz de la función f(x) = {func_str}.
+
+        Este método aplica Newton-Raphson a f(x)/f'(x), lo que mantiene la convergencia cuadrática en raíces múltiples.
+        El proceso converge después de {len(results)} iteraciones con un error final de {results[-1]['error']:.6f}%.
+
+        Es la opción adecuada cuando la función toca el eje X sin cruzarlo, como en f(x) = (x - r)².
+        """
     elif method == "secant":
         explanation = f"""
         Aplicando el método de la secante, se determinó que {root:.6f} es una raíz de la función f(x) = {func_str}.
@@ -47,6 +93,28 @@ def generate_explanation(method, func_str, root, results):
 
         Esta raíz representa un punto donde la función cruza el eje X, es decir, donde f({root:.6f}) ≈ 0.
         """
+    elif method == "all_roots":
+        real_roots = [row for row in results if row['imag'] == 0]
+        found = (f"La raíz real de menor residuo es {root:.6f}." if root is not None
+                 else "El polinomio no tiene raíces reales: todas sus raíces son complejas conjugadas.")
+        explanation = f"""
+        El método de todas las raíces encontró {len(results)} raíces distintas del polinomio f(x) = {func_str}, {len(real_roots)} de ellas reales.
+        {found}
+
+        Las raíces se obtienen a la vez como valores propios de la matriz compañera del polinomio y luego se pulen con unas pocas iteraciones de Newton.
+        Las raíces repetidas se agrupan y se informa su multiplicidad; en total se usaron {results[-1]['evaluations']} evaluaciones del polinomio.
+        """
+    elif method == "newton_system":
+        solution = ", ".join(f"{value:.6f}" for value in root)
+        jacobian = results[-1].get('jacobian_evaluations')
+        explanation = f"""
+        Utilizando el método de Newton-Raphson para sistemas, hemos encontrado la solución ({solution}) del sistema {func_str}.
+
+        En cada iteración se resolvió el sistema lineal J(x)·Δx = -F(x), donde J es la matriz jacobiana, y el paso se acortó cuando no reducía ||F||.
+        El proceso convergió después de {len(results)} iteraciones con un error final de {results[-1]['error']:.6f}%, evaluando el jacobiano {jacobian} veces.
+
+        En la tabla, xr es la norma de la aproximación y f(xr) la norma del residuo ||F(x)||, que al final vale {results[-1]['f(xr)']:.2e}.
+        """
     else:
         explanation = f"""
         Se ha encontrado que {root:.6f} es una raíz de la función f(x) = {func_str} utilizando el método de {method}.
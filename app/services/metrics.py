@@ -0,0 +1,197 @@
+# services/metrics.py
+import math
+import threading
+import time
+from collections import deque, OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Muestras recientes que se conservan por serie para calcular los percentiles
+DEFAULT_WINDOW = 1024
+
+# Percentiles publicados en /api/metrics
+QUANTILES = (0.5, 0.95, 0.99)
+
+# Etiqueta de los métodos que no están registrados (el nombre lo elige el cliente)
+OTHER_METHOD = "other"
+
+# Temporizador de la petición en curso (None fuera de una petición)
+_current_timer = ContextVar('request_timer', default=None)
+
+
+class RequestTimer:
+    """Duraciones por etapa de una petición, en el orden en que ocurrieron"""
+
+    __slots__ = ('start', 'stages')
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.stages = OrderedDict()
+
+    def add(self, stage, seconds):
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def total(self):
+        return time.perf_counter() - self.start
+
+    def server_timing(self, total=None):
+        """Valor de la cabecera Server-Timing (duraciones en milisegundos)"""
+        entries = [f"{stage};dur={seconds * 1000:.3f}" for stage, seconds in self.stages.items()]
+        if total is not None:
+            entries.append(f"total;dur={total * 1000:.3f}")
+        return ", ".join(entries)
+
+
+def start_request_timer():
+    """Activa un temporizador para la petición actual y devuelve el token para cerrarlo"""
+    timer = RequestTimer()
+    return timer, _current_timer.set(timer)
+
+
+def stop_request_timer(token):
+    _current_timer.reset(token)
+
+
+def add_stages(stages):
+    """Suma al temporizador de la petición etapas medidas en otro proceso"""
+    timer = _current_timer.get()
+    if timer is not None:
+        for stage, seconds in stages.items():
+            timer.add(stage, seconds)
+
+
+@contextmanager
+def timed(stage):
+    """Mide la duración de una etapa y la suma al temporizador de la petición (si hay uno)"""
+    timer = _current_timer.get()
+    if timer is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer.add(stage, time.perf_counter() - start)
+
+
+class MetricsRegistry:
+    """Contadores y resúmenes (percentiles sobre una ventana de muestras recientes) en formato Prometheus"""
+
+    def __init__(self, window=DEFAULT_WINDOW):
+        self.lock = threading.Lock()
+        self.window = window
+        self.counters = {}
+        self.summaries = {}
+        self.help = {}
+        self.methods = None
+
+    def configure(self, window=None, methods=None):
+        """methods es el conjunto de métodos válidos: los demás se agrupan como "other" (None los acepta todos)"""
+        with self.lock:
+            self.window = window or DEFAULT_WINDOW
+            self.methods = frozenset(methods) if methods is not None else None
+            self.summaries.clear()
+
+    def method_label(self, method):
+        """Etiqueta del método de una petición: los nombres desconocidos no crean series nuevas"""
+        if method is None:
+            return ""
+        if not isinstance(method, str) or (self.methods is not None and method not in self.methods):
+            return OTHER_METHOD
+        return method
+
+    def increment(self, name, labels=(), amount=1, help_text=None):
+        key = (name, tuple(labels))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+            if help_text:
+                self.help[name] = help_text
+
+    def observe(self, name, labels=(), value=0.0, help_text=None):
+        key = (name, tuple(labels))
+        with self.lock:
+            summary = self.summaries.get(key)
+            if summary is None:
+                summary = self.summaries[key] = {"samples": deque(maxlen=self.window), "sum": 0.0, "count": 0}
+            summary["samples"].append(value)
+            summary["sum"] += value
+            summary["count"] += 1
+            if help_text:
+                self.help[name] = help_text
+
+    def record_request(self, endpoint, method, status, timer, total):
+        """Agrega las etapas de una petición terminada a los resúmenes por endpoint, método y etapa"""
+        base = (("endpoint", endpoint or ""), ("method", self.method_label(method)))
+        for stage, seconds in list(timer.stages.items()) + [("total", total)]:
+            self.observe("numerical_stage_duration_seconds", base + (("stage", stage),), seconds,
+                         "Duración de cada etapa de las peticiones")
+        self.increment("numerical_requests_total", base + (("status", str(status)),),
+                       help_text="Peticiones atendidas")
+
+    def record_evaluations(self, method, evaluations):
+        if evaluations is not None:
+            self.observe("numerical_function_evaluations", (("method", self.method_label(method)),), evaluations,
+                         "Evaluaciones de la función por problema resuelto")
+
+    def render(self, gauges=()):
+        """Texto en formato de exposición de Prometheus.
+
+        gauges es una secuencia de (nombre, etiquetas, valor) con valores
+        instantáneos (tamaños de caché, elementos del historial...).
+        """
+        with self.lock:
+            counters = sorted(self.counters.items())
+            summaries = sorted((key, list(s["samples"]), s["sum"], s["count"]) for key, s in self.summaries.items())
+            help_texts = dict(self.help)
+
+        lines = []
+        declared = set()
+
+        def declare(name, kind):
+            if name not in declared:
+                declared.add(name)
+                if name in help_texts:
+                    lines.append(f"# HELP {name} {help_texts[name]}")
+                lines.append(f"# TYPE {name} {kind}")
+
+        for (name, labels), value in counters:
+            declare(name, "counter")
+            lines.append(f"{name}{_labels(labels)} {value}")
+
+        for (name, labels), samples, total, count in summaries:
+            declare(name, "summary")
+            samples.sort()
+            for q in QUANTILES:
+                lines.append(f"{name}{_labels(labels + (('quantile', str(q)),))} {_quantile(samples, q)}")
+            lines.append(f"{name}_sum{_labels(labels)} {total}")
+            lines.append(f"{name}_count{_labels(labels)} {count}")
+
+        for name, labels, value in gauges:
+            declare(name, "gauge")
+            lines.append(f"{name}{_labels(labels)} {value}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _quantile(samples, q):
+    # Percentil por rango más cercano sobre muestras ya ordenadas
+    if not samples:
+        return float('nan')
+    index = min(len(samples) - 1, max(0, math.ceil(q * len(samples)) - 1))
+    return samples[index]
+
+
+def _escape(value):
+    # Escapes del formato de exposición: barra invertida, comillas y saltos de línea
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+# Registro compartido por toda la aplicación
+metrics = MetricsRegistry()
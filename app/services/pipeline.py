@@ -0,0 +1,136 @@
+# services/pipeline.py
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from app.services.plot_cache import plot_cache
+from app.services.plotting import render_plot
+
+
+class Pipeline:
+    """Ejecutores compartidos por las etapas concurrentes de las peticiones.
+
+    Los hilos atienden las etapas de E/S (guardar en el historial) mientras la
+    petición serializa su respuesta; el pool de procesos dibuja por adelantado
+    las imágenes PNG (matplotlib no compite así con el GIL de la petición) y las
+    deja en plot_cache para cuando el navegador las pida.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.executor = None
+        self.render_pool = None
+        self.pending = {}
+        self.initializer = None
+        self.configure()
+
+    def configure(self, threads=4, render_workers=1, max_pending=16):
+        self.shutdown()
+        with self.lock:
+            self.threads = max(1, threads or 1)
+            self.render_workers = render_workers or 0
+            self.max_pending = max_pending
+
+    def submit(self, func, *args, **kwargs):
+        """Ejecuta func en un hilo compartido y devuelve su Future"""
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="pipeline")
+            executor = self.executor
+        return executor.submit(func, *args, **kwargs)
+
+    def prerender(self, key, func_str, method, root=None, **params):
+        """Encola el dibujo de una imagen que todavía no está en caché.
+
+        Devuelve False si el dibujo anticipado está desactivado o hay demasiados
+        pendientes (la imagen se dibujará bajo demanda).
+        """
+        if not self.render_workers or plot_cache.contains(key):
+            return False
+
+        with self.lock:
+            if key in self.pending:
+                return True
+            if len(self.pending) >= self.max_pending:
+                return False
+            if self.render_pool is None:
+                self.render_pool = self._new_render_pool()
+            try:
+                future = self.render_pool.submit(render_plot, func_str, method, root=root, **params)
+            except BrokenProcessPool:
+                self.render_pool = None
+                return False
+            self.pending[key] = future
+
+        future.add_done_callback(lambda done: self._finish(key, done))
+        return True
+
+    def prestart(self, initializer=None, timeout=None):
+        """Arranca el pool de dibujo anticipado antes de recibir trabajos.
+
+        initializer (opcional, serializable) se ejecuta en cada proceso del
+        pool, también en los que lo reemplacen. Devuelve False si el dibujo
+        anticipado está desactivado o el arranque falló.
+        """
+        if not self.render_workers:
+            return False
+
+        with self.lock:
+            self.initializer = initializer
+            if self.render_pool is None:
+                self.render_pool = self._new_render_pool()
+            render_pool = self.render_pool
+
+        # ProcessPoolExecutor crea sus procesos con el primer trabajo
+        try:
+            return render_pool.submit(_ready).result(timeout=timeout)
+        except Exception:
+            return False
+
+    def rendered(self, key, timeout=None):
+        """Espera (hasta timeout segundos) la imagen encolada con prerender; None si no hay o falló"""
+        with self.lock:
+            future = self.pending.get(key)
+        if future is None:
+            return None
+        try:
+            return future.result(timeout=timeout)
+        except Exception:
+            # Tiempo agotado, pool roto o error al dibujar: se dibujará bajo demanda
+            return None
+
+    def shutdown(self):
+        with self.lock:
+            executor, self.executor = self.executor, None
+            render_pool, self.render_pool = self.render_pool, None
+            self.pending = {}
+        if executor is not None:
+            executor.shutdown(wait=False)
+        if render_pool is not None:
+            render_pool.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self):
+        with self.lock:
+            return {"threads": self.threads, "render_workers": self.render_workers, "pending": len(self.pending)}
+
+    def _new_render_pool(self):
+        return ProcessPoolExecutor(max_workers=self.render_workers, initializer=self.initializer)
+
+    def _finish(self, key, future):
+        # Callback del pool de procesos: guardar la imagen y liberar el pendiente
+        try:
+            if not future.cancelled() and future.exception() is None:
+                plot_cache.put(key, future.result())
+        finally:
+            with self.lock:
+                if self.pending.get(key) is future:
+                    del self.pending[key]
+
+
+def _ready():
+    # Trabajo vacío para que el pool arranque (y caliente) sus procesos
+    return True
+
+
+# Ejecutores compartidos por toda la aplicación
+pipeline = Pipeline()
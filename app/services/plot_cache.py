@@ -0,0 +1,157 @@
+# services/plot_cache.py
+import os
+import threading
+from collections import OrderedDict
+
+# Al pasarse del límite de disco se expulsa hasta esta fracción: así el directorio
+# se recorre una vez cada tanto y no en cada escritura una vez lleno
+DISK_EVICT_TO = 0.9
+
+
+class PlotCache:
+    """Caché de imágenes PNG en dos niveles: memoria (LRU) y, opcionalmente, disco"""
+
+    def __init__(self, max_bytes=32 * 1024 * 1024, disk_dir=None, disk_max_bytes=256 * 1024 * 1024):
+        self.lock = threading.Lock()
+        self.memory = OrderedDict()
+        self.memory_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        # Total de bytes en disco llevado en memoria: el directorio solo se recorre al pasarse del límite
+        self.disk_lock = threading.Lock()
+        self.disk_bytes = 0
+        self.configure(max_bytes, disk_dir, disk_max_bytes)
+
+    def configure(self, max_bytes=None, disk_dir=None, disk_max_bytes=None):
+        """Ajusta los límites de ambos niveles; disk_dir=None desactiva el nivel de disco"""
+        with self.lock:
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            self.disk_dir = disk_dir
+            if disk_max_bytes is not None:
+                self.disk_max_bytes = disk_max_bytes
+            if disk_dir:
+                os.makedirs(disk_dir, exist_ok=True)
+            self._evict_memory()
+        if disk_dir:
+            self._evict_disk()
+
+    def get(self, key):
+        with self.lock:
+            png = self.memory.get(key)
+            if png is not None:
+                self.memory.move_to_end(key)
+                self.hits += 1
+                return png
+
+        png = self._read_disk(key)
+        with self.lock:
+            if png is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._store_memory(key, png)
+        return png
+
+    def contains(self, key):
+        """Indica si la imagen está en caché, sin contar un acierto ni un fallo"""
+        with self.lock:
+            if key in self.memory:
+                return True
+        return bool(self.disk_dir) and os.path.exists(self._disk_path(key))
+
+    def put(self, key, png):
+        with self.lock:
+            self._store_memory(key, png)
+        self._write_disk(key, png)
+
+    def stats(self):
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "memory_items": len(self.memory),
+                "memory_bytes": self.memory_bytes,
+                "max_bytes": self.max_bytes,
+                "disk_dir": self.disk_dir,
+                "disk_bytes": self.disk_bytes
+            }
+
+    def _store_memory(self, key, png):
+        if key in self.memory:
+            self.memory_bytes -= len(self.memory.pop(key))
+        self.memory[key] = png
+        self.memory_bytes += len(png)
+        self._evict_memory()
+
+    def _evict_memory(self):
+        while self.memory_bytes > self.max_bytes and self.memory:
+            _, png = self.memory.popitem(last=False)
+            self.memory_bytes -= len(png)
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, f"{key}.png")
+
+    def _read_disk(self, key):
+        if not self.disk_dir:
+            return None
+        try:
+            with open(self._disk_path(key), 'rb') as f:
+                png = f.read()
+            # Actualizar la fecha de acceso para la expulsión por antigüedad
+            os.utime(self._disk_path(key))
+            return png
+        except OSError:
+            return None
+
+    def _write_disk(self, key, png):
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(png)
+            try:
+                replaced = os.path.getsize(path)
+            except OSError:
+                replaced = 0
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+
+        with self.disk_lock:
+            self.disk_bytes += len(png) - replaced
+            over = self.disk_bytes > self.disk_max_bytes
+        if over:
+            self._evict_disk()
+
+    def _evict_disk(self):
+        # Expulsar los archivos usados hace más tiempo hasta quedar bajo el límite; el recorrido
+        # también corrige el total llevado en memoria (otros procesos pueden escribir en el directorio)
+        try:
+            entries = []
+            for entry in os.scandir(self.disk_dir):
+                if entry.name.endswith('.png'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            return
+
+        total = sum(size for _, size, _ in entries)
+        target = self.disk_max_bytes * DISK_EVICT_TO if total > self.disk_max_bytes else total
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+        with self.disk_lock:
+            self.disk_bytes = total
+
+
+# Instancia compartida por los controladores
+plot_cache = PlotCache()
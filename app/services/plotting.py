@@ -2,44 +2,237 @@
 import numpy as np
 import io
 import base64
-from matplotlib.figure import Figure
-import sympy as sp
+import hashlib
+import json
 
-from app.numerical_methods.utils import evaluate_function
+from app.numerical_methods.utils import compile_function
 
+# Muestreo adaptativo de las curvas: malla inicial uniforme, máximo de puntos
+# (el presupuesto se puede bajar o subir por petición hasta PLOT_POINTS_LIMIT)
+PLOT_INITIAL_POINTS = 65
+PLOT_MAX_POINTS = 400
+PLOT_POINTS_LIMIT = 4000
 
-def generate_plot_data(func_str, method, a=None, b=None, root=None, x0=None, x1=None, g_func_str=None, iterations=None):
+# Desviación (relativa a la escala de y) a partir de la cual se refina un tramo
+PLOT_TOLERANCE = 2e-3
+
+# Ancho mínimo de un tramo, relativo al ancho de la ventana
+PLOT_MIN_WIDTH = 1e-5
+
+# Salto (relativo a la escala de y) que se considera discontinuidad en un tramo mínimo
+PLOT_JUMP = 0.05
+
+# Cuántas veces debe superar la pendiente de un salto a la de sus vecinos para ser un escalón
+PLOT_STEP_RATIO = 10
+
+# Métodos agrupados según los parámetros que definen su gráfica
+BRACKETING_METHODS = ["bisection", "false_position", "illinois", "anderson_bjorck", "brent"]
+TANGENT_METHODS = ["newton_raphson", "halley", "modified_newton"]
+FIXED_POINT_METHODS = ["fixed_point", "steffensen"]
+
+# Métodos para sistemas de ecuaciones: su solución es un vector y no tienen gráfica
+SYSTEM_METHODS = ["newton_system"]
+
+
+def default_window(method, a=None, b=None, x0=None, x1=None):
+    """Ventana de la gráfica a partir de los parámetros iniciales del método"""
+    if method in BRACKETING_METHODS:
+        return min(a, b) - 1, max(a, b) + 1
+    elif method in TANGENT_METHODS + FIXED_POINT_METHODS:
+        return x0 - 5, x0 + 5
+    elif method == "secant":
+        return min(x0, x1) - 1, max(x0, x1) + 1
+    else:
+        return -10, 10
+
+
+def plot_window(method, a=None, b=None, x0=None, x1=None, g_func_str=None, root=None, iterates=None):
+    """Ventana de la gráfica ajustada a lo que recorrió el método.
+
+    Cubre los parámetros iniciales, la raíz y los iterados, con un margen del
+    20 %. Los iterados muy alejados de la ventana por omisión (divergencias
+    momentáneas) se ignoran. Sin raíz ni iterados se usa la ventana por
+    omisión. g_func_str se acepta para poder pasar plot_params tal cual.
+    """
+    lo, hi = default_window(method, a=a, b=b, x0=x0, x1=x1)
+    if root is None and not iterates:
+        return lo, hi
+
+    points = [value for value in (a, b, x0, x1, root, *(iterates or ())) if value is not None]
+    points = np.asarray(points, dtype=float)
+    center, half = (lo + hi) / 2, (hi - lo) / 2
+    points = points[np.isfinite(points) & (np.abs(points - center) <= 10 * half)]
+    if points.size == 0:
+        return lo, hi
+
+    p_lo, p_hi = float(points.min()), float(points.max())
+    span = p_hi - p_lo
+    if span <= 1e-9 * max(1.0, abs(p_lo)):
+        return lo, hi
+    return p_lo - 0.2 * span, p_hi + 0.2 * span
+
+
+def _robust_scale(values):
+    # Escala de y sin dejarse dominar por asíntotas: rango entre percentiles
+    finite = values[np.isfinite(values)]
+    if finite.size == 0:
+        return 1.0
+    low, high = np.percentile(finite, [5, 95])
+    with np.errstate(all='ignore'):
+        # Valores cercanos al máximo de float64: el rango puede desbordar a inf
+        return float(high - low) or float(np.abs(finite).max()) or 1.0
+
+
+def _refinement_scores(x, y, scale, min_width):
+    """Puntaje de cada tramo [x_i, x_i+1]: > 0 si conviene partirlo"""
+    scores = np.zeros(x.size - 1)
+
+    # Curvatura: desviación de cada punto interior respecto de la recta entre sus vecinos
+    if x.size > 2:
+        t = (x[1:-1] - x[:-2]) / (x[2:] - x[:-2])
+        with np.errstate(all='ignore'):
+            deviation = np.abs(y[1:-1] - (y[:-2] + t * (y[2:] - y[:-2]))) / scale
+        deviation = np.where(np.isfinite(deviation), deviation, 0.0)
+        curved = np.where(deviation > PLOT_TOLERANCE, deviation, 0.0)
+        scores[:-1] = np.maximum(scores[:-1], curved)
+        scores[1:] = np.maximum(scores[1:], curved)
+
+    # Cambios de signo (raíces o asíntotas) y bordes del dominio (NaN de un solo lado)
+    finite = np.isfinite(y)
+    with np.errstate(all='ignore'):
+        sign_change = finite[:-1] & finite[1:] & (np.sign(y[:-1]) != np.sign(y[1:]))
+    domain_edge = finite[:-1] != finite[1:]
+    scores[sign_change | domain_edge] = np.maximum(scores[sign_change | domain_edge], 1.0)
+
+    # Se refinan primero los tramos anchos: una asíntota no consume todo el presupuesto
+    widths = np.diff(x)
+    scores = np.minimum(scores, 1.0) * widths
+    scores[widths <= min_width] = 0.0
+    return scores
+
+
+def adaptive_sample(functions, lo, hi, max_points=PLOT_MAX_POINTS):
+    """Muestrea una o más funciones vectorizadas sobre [lo, hi] refinando donde hace falta.
+
+    Parte de una malla uniforme y en cada ronda evalúa (en un solo llamado por
+    función) el punto medio de los tramos con más curvatura, cambio de signo o
+    borde de dominio, hasta agotar max_points o no quedar tramos por refinar.
+    Los saltos que no desaparecen al refinar (asíntotas, discontinuidades) se
+    cortan con un NaN para no dibujar una línea vertical.
+
+    Devuelve la malla y la lista de valores (uno por función).
+    """
+    max_points = max(2, int(max_points))
+    x = np.linspace(lo, hi, min(PLOT_INITIAL_POINTS, max_points))
+    ys = [function(x) for function in functions]
+    min_width = (hi - lo) * PLOT_MIN_WIDTH
+
+    while x.size < max_points:
+        scores = np.zeros(x.size - 1)
+        for y in ys:
+            scores = np.maximum(scores, _refinement_scores(x, y, _robust_scale(y), min_width))
+
+        candidates = np.flatnonzero(scores)
+        if candidates.size == 0:
+            break
+        budget = max_points - x.size
+        if candidates.size > budget:
+            candidates = np.sort(candidates[np.argsort(scores[candidates])[-budget:]])
+
+        midpoints = (x[candidates] + x[candidates + 1]) / 2
+        ys = [np.insert(y, candidates + 1, function(midpoints)) for y, function in zip(ys, functions)]
+        x = np.insert(x, candidates + 1, midpoints)
+
+    return _break_jumps(x, ys, min_width)
+
+
+def _break_jumps(x, ys, min_width):
+    # Se corta con un NaN la curva en los tramos que no son continuos: un salto grande
+    # que sobrevive al tramo mínimo con una pendiente muy superior a la de sus vecinos
+    # (escalón), o un cambio de signo grande en sentido contrario a los tramos
+    # vecinos (polo, como en tan(x) o 1/x)
+    widths = np.diff(x)
+    jumps = np.zeros(widths.size, dtype=bool)
+    per_curve = []
+    for y in ys:
+        scale = _robust_scale(y)
+        # Con valores enormes (funciones muy empinadas) las diferencias y pendientes desbordan a inf
+        with np.errstate(all='ignore'):
+            dy = np.diff(y)
+            slopes = np.nan_to_num(np.abs(dy / widths))
+            neighbours = np.zeros_like(slopes)
+            neighbours[1:] = slopes[:-1]
+            neighbours[:-1] = np.maximum(neighbours[:-1], slopes[1:])
+            jump = ((widths <= 2 * min_width) & (np.abs(dy) > PLOT_JUMP * scale)
+                    & (slopes > PLOT_STEP_RATIO * neighbours))
+            pole = (np.sign(y[:-1]) != np.sign(y[1:])) & (np.abs(dy) > scale / 2)
+            pole[1:] &= np.sign(dy[:-1]) != np.sign(dy[1:])
+            pole[:-1] &= np.sign(dy[1:]) != np.sign(dy[:-1])
+        jump |= pole & np.isfinite(dy)
+        per_curve.append(jump)
+        jumps |= jump
+
+    positions = np.flatnonzero(jumps)
+    if positions.size == 0:
+        return x, ys
+
+    midpoints = (x[positions] + x[positions + 1]) / 2
+    broken = []
+    for y, jump in zip(ys, per_curve):
+        with np.errstate(all='ignore'):
+            values = np.where(jump[positions], np.nan, (y[positions] + y[positions + 1]) / 2)
+        broken.append(np.insert(y, positions + 1, values))
+    return np.insert(x, positions + 1, midpoints), broken
+
+
+def sample_curves(func_str, method, a=None, b=None, x0=None, x1=None, g_func_str=None, window=None,
+                  max_points=PLOT_MAX_POINTS):
+    """Muestrea f (y g en punto fijo) con el muestreo adaptativo, sobre una malla común.
+
+    window es el intervalo (lo, hi) a graficar (por omisión, el del método).
+    Los puntos fuera del dominio (NaN, infinitos o complejos) quedan como NaN.
+    El resultado se comparte entre render_plot y generate_plot_data.
+    """
+    if window is None:
+        window = default_window(method, a=a, b=b, x0=x0, x1=x1)
+
+    functions = [compile_function(func_str).vectorized]
+    with_g = method in FIXED_POINT_METHODS and g_func_str is not None
+    if with_g:
+        functions.append(compile_function(g_func_str).vectorized)
+
+    x_range, values = adaptive_sample(functions, float(window[0]), float(window[1]), max_points)
+    samples = {"x_range": x_range, "y_values": values[0]}
+    if with_g:
+        samples["g_values"] = values[1]
+
+    return samples
+
+
+def _to_json_list(values):
+    # JSON no admite NaN: los huecos se envían como null
+    return np.where(np.isfinite(values), values, None).tolist()
+
+
+def generate_plot_data(func_str, method, a=None, b=None, root=None, x0=None, x1=None, g_func_str=None, iterations=None,
+                       samples=None, window=None, max_points=PLOT_MAX_POINTS):
     try:
-        # Crear variables simbólicas
-        x_sym = sp.Symbol('x')
-        func_sym = sp.sympify(func_str)
-
-        # Determinar el rango para la gráfica
-        if method in ["bisection", "false_position"]:
-            x_range = np.linspace(min(a, b) - 1, max(a, b) + 1, 1000)
-        elif method in ["newton_raphson", "fixed_point"]:
-            x_range = np.linspace(x0 - 5, x0 + 5, 1000)
-        elif method == "secant":
-            x_range = np.linspace(min(x0, x1) - 1, max(x0, x1) + 1, 1000)
-        else:
-            x_range = np.linspace(-10, 10, 1000)
-
-        # Evaluar la función en los puntos
-        y_values = [evaluate_function(func_str, xi) for xi in x_range]
+        if samples is None:
+            samples = sample_curves(func_str, method, a=a, b=b, x0=x0, x1=x1, g_func_str=g_func_str,
+                                    window=window, max_points=max_points)
 
         # Datos para el frontend
         plot_data = {
-            "x_range": x_range.tolist(),
-            "y_values": y_values,
+            "x_range": samples["x_range"].tolist(),
+            "y_values": _to_json_list(samples["y_values"]),
             "method": method,
             "func_str": func_str,
             "root": root
         }
 
         # Datos específicos para cada método
-        if method == "fixed_point" and g_func_str is not None:
-            g_values = [evaluate_function(g_func_str, xi) for xi in x_range]
-            plot_data["g_values"] = g_values
+        if method in FIXED_POINT_METHODS and g_func_str is not None:
+            plot_data["g_values"] = _to_json_list(samples["g_values"])
             plot_data["g_func_str"] = g_func_str
 
         # Añadir datos de iteraciones para animación
@@ -51,59 +244,75 @@ def generate_plot_data(func_str, method, a=None, b=None, root=None, x0=None, x1=
     except Exception as e:
         return {"error": str(e)}
 
-def generate_plot(func_str, method, a=None, b=None, root=None, x0=None, x1=None, g_func_str=None):
+
+def plot_cache_key(func_str, method, root=None, **plot_params):
+    """Clave determinista de la imagen: mismas entradas producen el mismo PNG"""
+    payload = json.dumps([func_str, method, root, plot_params], sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+
+
+def new_figure(**kwargs):
+    """Figura de matplotlib con lienzo Agg.
+
+    matplotlib se importa recién con la primera imagen (o en el calentamiento,
+    ver services/startup.py): es la dependencia más lenta de importar.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(**kwargs)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def render_plot(func_str, method, a=None, b=None, root=None, x0=None, x1=None, g_func_str=None, samples=None,
+                window=None, max_points=PLOT_MAX_POINTS):
+    """Dibuja la gráfica estática y devuelve los bytes del PNG"""
+    if samples is None:
+        samples = sample_curves(func_str, method, a=a, b=b, x0=x0, x1=x1, g_func_str=g_func_str,
+                                window=window, max_points=max_points)
+
+    x_range = samples["x_range"]
+
+    # Crear la figura
+    fig = new_figure(figsize=(10, 6))
+    ax = fig.subplots()
+
+    # Gráfica de la función (los NaN se dibujan como huecos)
+    ax.plot(x_range, samples["y_values"], 'b-', label=f'f(x) = {func_str}')
+
+    # Agregar la línea y=0
+    ax.axhline(y=0, color='k', linestyle='-', alpha=0.3)
+
+    # Marcar la raíz
+    if root is not None:
+        ax.plot(root, 0, 'ro', markersize=8, label=f'Raíz: x = {root:.6f}')
+
+    # Si es un método de punto fijo, graficar g(x)
+    if method in FIXED_POINT_METHODS and g_func_str is not None:
+        ax.plot(x_range, samples["g_values"], 'g-', label=f'g(x) = {g_func_str}')
+        # Agregar la línea y=x
+        ax.plot(x_range, x_range, 'k--', alpha=0.5, label='y = x')
+
+    # Configurar la gráfica
+    ax.set_xlabel('x')
+    ax.set_ylabel('y')
+    ax.set_title(f'Método de {method.replace("_", " ").title()}')
+    ax.grid(True, alpha=0.3)
+    ax.legend()
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png')
+    return buf.getvalue()
+
+
+def generate_plot(func_str, method, a=None, b=None, root=None, x0=None, x1=None, g_func_str=None, samples=None,
+                  window=None, max_points=PLOT_MAX_POINTS):
     try:
-        # Crear variables simbólicas
-        x_sym = sp.Symbol('x')
-        func_sym = sp.sympify(func_str)
-
-        # Determinar el rango para la gráfica
-        if method in ["bisection", "false_position"]:
-            x_range = np.linspace(min(a, b) - 1, max(a, b) + 1, 1000)
-        elif method in ["newton_raphson", "fixed_point"]:
-            x_range = np.linspace(x0 - 5, x0 + 5, 1000)
-        elif method == "secant":
-            x_range = np.linspace(min(x0, x1) - 1, max(x0, x1) + 1, 1000)
-        else:
-            x_range = np.linspace(-10, 10, 1000)
-
-        # Evaluar la función en los puntos
-        y_values = [evaluate_function(func_str, xi) for xi in x_range]
-
-        # Crear la figura
-        fig = Figure(figsize=(10, 6))
-        ax = fig.subplots()
-
-        # Gráfica de la función
-        ax.plot(x_range, y_values, 'b-', label=f'f(x) = {func_str}')
-
-        # Agregar la línea y=0
-        ax.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-
-        # Marcar la raíz
-        if root is not None:
-            ax.plot(root, 0, 'ro', markersize=8, label=f'Raíz: x = {root:.6f}')
-
-        # Si es el método de punto fijo, graficar g(x)
-        if method == "fixed_point" and g_func_str is not None:
-            g_values = [evaluate_function(g_func_str, xi) for xi in x_range]
-            ax.plot(x_range, g_values, 'g-', label=f'g(x) = {g_func_str}')
-            # Agregar la línea y=x
-            ax.plot(x_range, x_range, 'k--', alpha=0.5, label='y = x')
-
-        # Configurar la gráfica
-        ax.set_xlabel('x')
-        ax.set_ylabel('y')
-        ax.set_title(f'Método de {method.replace("_", " ").title()}')
-        ax.grid(True, alpha=0.3)
-        ax.legend()
-
-        # Guardar la gráfica en formato base64 para enviarla al frontend
-        buf = io.BytesIO()
-        fig.savefig(buf, format='png')
-        buf.seek(0)
-        img_data = base64.b64encode(buf.getvalue()).decode('utf-8')
-
-        return img_data
+        png = render_plot(func_str, method, a=a, b=b, root=root, x0=x0, x1=x1, g_func_str=g_func_str,
+                          samples=samples, window=window, max_points=max_points)
+
+        # Codificar la gráfica en base64 para enviarla al frontend
+        return base64.b64encode(png).decode('utf-8')
     except Exception as e:
-        return str(e)
\ No newline at end of file
+        return str(e)
@@ -0,0 +1,90 @@
+# services/result_cache.py
+import threading
+import time
+from collections import OrderedDict
+
+from app.models.storage import approximate_size
+
+
+class ResultCache:
+    """Caché de soluciones con caducidad (TTL) y expulsión LRU por número de elementos y tamaño"""
+
+    def __init__(self, max_items=1024, max_bytes=64 * 1024 * 1024, ttl=3600):
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.configure(max_items, max_bytes, ttl)
+
+    def configure(self, max_items=None, max_bytes=None, ttl=None):
+        """Ajusta los límites; max_items=0 desactiva la caché"""
+        with self.lock:
+            self.max_items = max_items
+            self.max_bytes = max_bytes
+            self.ttl = ttl
+            self._evict()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] is not None and entry[0] < time.monotonic():
+                # Caducado: se descarta
+                self._drop(key)
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def put(self, key, value):
+        if self.max_items == 0:
+            return
+
+        size = approximate_size(value)
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        with self.lock:
+            if key in self.entries:
+                self._drop(key)
+            self.entries[key] = (expires_at, size, value)
+            self.total_bytes += size
+            self._evict()
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+
+    def stats(self):
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "items": len(self.entries),
+                "approx_bytes": self.total_bytes,
+                "max_items": self.max_items,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl
+            }
+
+    def _drop(self, key):
+        _, size, _ = self.entries.pop(key)
+        self.total_bytes -= size
+
+    def _evict(self):
+        while self.entries and (
+            (self.max_items is not None and len(self.entries) > self.max_items)
+            or (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+        ):
+            self._drop(next(iter(self.entries)))
+            self.evictions += 1
+
+
+# Instancia compartida por los controladores
+result_cache = ResultCache()
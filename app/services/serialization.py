@@ -0,0 +1,15 @@
+# services/serialization.py
+from flask.json.provider import DefaultJSONProvider
+
+from app.numerical_methods.trace import Trace
+
+
+class AppJSONProvider(DefaultJSONProvider):
+    """Proveedor JSON de Flask que además sabe serializar las trazas de iteraciones"""
+
+    @staticmethod
+    def default(obj):
+        # Las trazas se envían con el formato clásico de filas de resultados
+        if isinstance(obj, Trace):
+            return obj.rows()
+        return DefaultJSONProvider.default(obj)
@@ -0,0 +1,612 @@
+# services/solver.py
+import hashlib
+import json
+import time
+
+from app.numerical_methods.all_roots import iter_all_roots
+from app.numerical_methods.bisection import iter_bisection
+from app.numerical_methods.brackets import iter_auto_bracket, iter_all_brackets, SCAN_MODES
+from app.numerical_methods.brent import iter_brent
+from app.numerical_methods.false_position import iter_false_position
+from app.numerical_methods.fixed_point import iter_fixed_point
+from app.numerical_methods.halley import iter_halley
+from app.numerical_methods.modified_false_position import iter_illinois, iter_anderson_bjorck
+from app.numerical_methods.modified_newton import iter_modified_newton
+from app.numerical_methods.newton_raphson import iter_newton_raphson
+from app.numerical_methods.newton_system import iter_newton_system, compile_system, parse_names, JACOBIAN_MODES
+from app.numerical_methods.precision import iter_mixed_precision, MAX_DIGITS
+from app.numerical_methods.resume import (iter_continue, resume_parameters, stored_trace, estimate,
+                                          RESUMABLE_METHODS)
+from app.numerical_methods.secant import iter_secant
+from app.numerical_methods.steffensen import iter_steffensen
+from app.numerical_methods.sweep import bisection_sweep, false_position_sweep
+from app.numerical_methods.trace import Trace, empty_trace
+from app.numerical_methods.utils import compile_function, normalize_function, collect_iterations, MethodError
+from app.services.metrics import timed, add_stages, start_request_timer, stop_request_timer
+from app.services.plotting import (generate_plot_data, plot_window, BRACKETING_METHODS, TANGENT_METHODS,
+                                   FIXED_POINT_METHODS, SYSTEM_METHODS, PLOT_MAX_POINTS, PLOT_POINTS_LIMIT)
+from app.services.result_cache import result_cache
+from app.services.supervisor import supervisor, report_progress, WorkerTimeout
+
+# Secciones de la respuesta que se pueden pedir con include=
+RESPONSE_SECTIONS = ("results", "animation_data", "plot_data")
+
+# Todos los métodos que acepta el solver, en el orden del formulario
+SOLVER_METHODS = tuple(BRACKETING_METHODS + FIXED_POINT_METHODS + TANGENT_METHODS
+                       + ["secant", "all_roots"] + SYSTEM_METHODS)
+
+# Métodos cerrados con versión vectorizada: con scan="all" resuelven todos los intervalos a la vez
+BRACKETING_SWEEPS = {"bisection": bisection_sweep, "false_position": false_position_sweep}
+
+
+def plot_params(method, data):
+    """Extrae de los datos de un problema los parámetros que definen su gráfica"""
+    if method in BRACKETING_METHODS:
+        return {"a": float(data.get('a')), "b": float(data.get('b'))}
+    elif method in FIXED_POINT_METHODS:
+        return {"x0": float(data.get('x0')), "g_func_str": data.get('g_function')}
+    elif method in TANGENT_METHODS:
+        return {"x0": float(data.get('x0'))}
+    elif method == "secant":
+        return {"x0": float(data.get('x0')), "x1": float(data.get('x1'))}
+    elif method == "all_roots":
+        # Sin parámetros: la ventana se ajusta a las raíces encontradas
+        return {}
+    elif method in SYSTEM_METHODS:
+        # Los sistemas de ecuaciones no tienen gráfica
+        return {}
+    raise ValueError("Método no válido")
+
+
+def plot_points(data):
+    """Presupuesto de puntos de la gráfica pedido (plot_points), acotado a PLOT_POINTS_LIMIT"""
+    points = data.get('plot_points')
+    if points is None:
+        return PLOT_MAX_POINTS
+    return min(max(int(points), 16), PLOT_POINTS_LIMIT)
+
+
+def solution_window(method, data, root, results):
+    """Ventana de la gráfica de una solución: la misma en /api/solve y en /api/plot"""
+    rows = list(results or ())
+    iterates = [row.get('xr') for row in rows]
+    params = plot_params(method, data)
+    if data.get('scan') and rows:
+        # Con búsqueda de intervalos la ventana cubre también los intervalos encontrados fuera de [a, b]
+        params.update(a=min([params['a']] + [row['a'] for row in rows]),
+                      b=max([params['b']] + [row['b'] for row in rows]))
+    return plot_window(method, root=root, iterates=iterates, **params)
+
+
+def scan_options(method, data):
+    """Modo de búsqueda de intervalos (scan) y rango (scan_range) pedidos, o (None, None)"""
+    mode = data.get('scan') or None
+    if mode is None:
+        return None, None
+    if mode not in SCAN_MODES:
+        raise ValueError(f"Modo de búsqueda no válido: {mode} (use {' o '.join(SCAN_MODES)})")
+    if method not in BRACKETING_METHODS:
+        raise ValueError("La búsqueda de intervalos solo aplica a los métodos cerrados")
+
+    scan_range = data.get('scan_range')
+    if scan_range is not None:
+        scan_range = tuple(float(v) for v in scan_range)
+        if len(scan_range) != 2:
+            raise ValueError("scan_range debe ser [inicio, fin]")
+    return mode, scan_range
+
+
+def system_options(data):
+    """Opciones de un sistema de ecuaciones: (x0, variables, jacobian, sparse) normalizadas"""
+    x0 = data.get('x0')
+    if isinstance(x0, str):
+        x0 = [v for v in x0.replace(';', ',').split(',') if v.strip()]
+    x0 = tuple(float(v) for v in (x0 if isinstance(x0, (list, tuple)) else [x0]))
+
+    jacobian = data.get('jacobian') or "exact"
+    if jacobian not in JACOBIAN_MODES:
+        raise ValueError(f"Jacobiano no válido: {jacobian} (use {' o '.join(JACOBIAN_MODES)})")
+    sparse = data.get('sparse')
+    return x0, parse_names(data.get('variables')), jacobian, None if sparse is None else bool(sparse)
+
+
+def compile_problem(method, func_str, data):
+    """Verifica la función (o el sistema) de un problema y la deja compilada en caché"""
+    if method in SYSTEM_METHODS:
+        return compile_system(func_str, data.get('variables'))
+    return compile_function(func_str)
+
+
+def method_steps(method, func_str, data, tol, max_iter):
+    """Devuelve el generador de iteraciones del método indicado.
+
+    En los métodos cerrados, scan="auto" busca un intervalo con cambio de
+    signo si [a, b] no lo tiene y scan="all" resuelve todas las raíces del
+    rango (ver brackets.py).
+    """
+    mode, scan_range = scan_options(method, data)
+    if mode is not None:
+        def steps(a, b):
+            return method_steps(method, func_str, dict(data, a=a, b=b, scan=None), tol, max_iter)
+
+        a, b = float(data.get('a')), float(data.get('b'))
+        if mode == "auto":
+            return iter_auto_bracket(func_str, steps, a, b, scan_range)
+        return iter_all_brackets(func_str, steps, a, b, scan_range, BRACKETING_SWEEPS.get(method), tol, max_iter)
+
+    if method == "bisection":
+        return iter_bisection(func_str, float(data.get('a')), float(data.get('b')), tol, max_iter)
+    elif method == "false_position":
+        return iter_false_position(func_str, float(data.get('a')), float(data.get('b')), tol, max_iter)
+    elif method == "illinois":
+        return iter_illinois(func_str, float(data.get('a')), float(data.get('b')), tol, max_iter)
+    elif method == "anderson_bjorck":
+        return iter_anderson_bjorck(func_str, float(data.get('a')), float(data.get('b')), tol, max_iter)
+    elif method == "brent":
+        return iter_brent(func_str, float(data.get('a')), float(data.get('b')), tol, max_iter)
+    elif method == "fixed_point":
+        return iter_fixed_point(func_str, data.get('g_function'), float(data.get('x0')), tol, max_iter)
+    elif method == "steffensen":
+        return iter_steffensen(func_str, data.get('g_function'), float(data.get('x0')), tol, max_iter)
+    elif method == "newton_raphson":
+        return iter_newton_raphson(func_str, float(data.get('x0')), tol, max_iter)
+    elif method == "halley":
+        return iter_halley(func_str, float(data.get('x0')), tol, max_iter)
+    elif method == "modified_newton":
+        return iter_modified_newton(func_str, float(data.get('x0')), tol, max_iter)
+    elif method == "secant":
+        return iter_secant(func_str, float(data.get('x0')), float(data.get('x1')), tol, max_iter)
+    elif method == "all_roots":
+        return iter_all_roots(func_str, tol, max_iter)
+    elif method == "newton_system":
+        x0, variables, jacobian, sparse = system_options(data)
+        return iter_newton_system(func_str, x0, tol, max_iter, variables, jacobian, sparse)
+    raise MethodError("Método no válido")
+
+
+def precision_option(method, data):
+    """Dígitos pedidos para el refinamiento en precisión arbitraria (precision), o None"""
+    digits = data.get('precision')
+    if digits is None:
+        return None
+    digits = int(digits)
+    if not 1 <= digits <= MAX_DIGITS:
+        raise ValueError(f"La precisión debe estar entre 1 y {MAX_DIGITS} dígitos")
+    if method == "all_roots" or data.get('scan') == "all":
+        raise ValueError("La precisión extendida refina una sola raíz: no se combina con todas las raíces")
+    if method in SYSTEM_METHODS:
+        raise ValueError("La precisión extendida no está disponible para sistemas de ecuaciones")
+    return digits
+
+
+def solver_steps(method, func_str, data, tol, max_iter, precision_report):
+    """Igual que method_steps; con precision= la raíz final se refina en precisión arbitraria (ver precision.py)"""
+    steps = method_steps(method, func_str, data, tol, max_iter)
+    digits = precision_option(method, data)
+    if digits is None:
+        return steps
+    return iter_mixed_precision(steps, compile_function(func_str), digits, precision_report)
+
+
+def solve_problem(data, include_plot=True, max_evaluations=None, deadline=None, on_record=None):
+    """Resuelve un problema con el método indicado y genera (opcionalmente) los datos de su gráfica.
+
+    La imagen PNG no se genera aquí: se dibuja bajo demanda en /api/plot/<calc_id>.png.
+
+    Devuelve un diccionario con "error" si el método no es válido o no converge;
+    los parámetros inválidos producen una excepción. Si se agota el presupuesto
+    de evaluaciones o el plazo (deadline, en time.monotonic()) el error viene
+    con la traza parcial (ver collect_iterations).
+    """
+    method = data.get('method')
+    func_str = data.get('function')
+
+    # Parámetros comunes para todos los métodos
+    tol = float(data.get('tolerance', 1e-6))
+    max_iter = int(data.get('max_iterations', 100))
+
+    # Verificar si la función es válida (y dejarla compilada en caché)
+    with timed("compile"):
+        compile_problem(method, func_str, data)
+
+    precision = {}
+    try:
+        with timed("solve"):
+            result = collect_iterations(solver_steps(method, func_str, data, tol, max_iter, precision),
+                                        max_evaluations, deadline, on_record)
+    except MethodError as e:
+        return {"error": str(e)}
+
+    if "error" in result:
+        return result if result.get("partial") else {"error": result["error"]}
+
+    plot_data = None
+    if include_plot and method not in SYSTEM_METHODS:
+        params = plot_params(method, data)
+        window = solution_window(method, data, result.get('root'), result["results"])
+        with timed("plot_data"):
+            plot_data = generate_plot_data(func_str, method, root=result.get('root'), window=window,
+                                           max_points=plot_points(data), **params)
+
+    # La traza se guarda una sola vez: filas y animación se arman al serializar
+    return {
+        "results": result["results"],
+        "root": result.get("root"),
+        "plot_data": plot_data,
+        "precision": precision or None
+    }
+
+
+def continue_problem(item, changes, include_plot=True, max_evaluations=None, deadline=None, on_record=None):
+    """Continúa un cálculo del historial con la tolerancia y el máximo de iteraciones de changes.
+
+    El método arranca desde el estado de la última iteración guardada (ver
+    resume.py) y solo calcula las iteraciones nuevas; la traza devuelta es la
+    completa y "start" indica dónde empiezan las nuevas. Si la ventana de la
+    gráfica no cambia se reutilizan las curvas guardadas. max_evaluations
+    cuenta solo las evaluaciones nuevas. Devuelve además los parámetros
+    actualizados ("data"); los errores se informan como en solve_problem y
+    on_record recibe cada iteración nueva.
+    """
+    method = item.get('method')
+    func_str = item.get('function')
+    parameters = item.get('parameters') or {}
+    results = item.get('results')
+
+    if method not in RESUMABLE_METHODS or parameters.get('scan') == "all":
+        raise ValueError("Este cálculo no se puede continuar")
+    if parameters.get('precision') is not None:
+        raise ValueError("Un cálculo refinado en precisión extendida no se puede continuar")
+    if not results:
+        raise ValueError("El cálculo no tiene iteraciones para continuar")
+
+    data = dict(parameters, continued_from=item.get('id'))
+    data.update({key: changes[key] for key in ('tolerance', 'max_iterations') if changes.get(key) is not None})
+    tol = float(data.get('tolerance', 1e-6))
+    max_iter = int(data.get('max_iterations', 100))
+
+    trace = stored_trace(method, results)
+    start = len(trace)
+    if max_iter <= start and trace.last("error") > tol:
+        raise ValueError(f"max_iterations debe superar las {start} iteraciones ya hechas")
+
+    root = item.get('root')
+    if trace.last("error") > tol:
+        restored, extra = resume_parameters(method, func_str, trace[-1])
+        if restored is None:
+            root = estimate(trace[-1])
+        else:
+            steps = method_steps(method, func_str, dict(data, scan=None, **restored), tol, max_iter - start)
+            if max_evaluations is not None:
+                max_evaluations += trace.last("evaluations")
+            try:
+                with timed("solve"):
+                    result = collect_iterations(iter_continue(steps, trace, tol, extra), max_evaluations, deadline,
+                                                on_record)
+            except MethodError as e:
+                return {"error": str(e)}
+            if "error" in result:
+                return result if result.get("partial") else {"error": result["error"]}
+            root = result["root"]
+
+    plot_data = None
+    if include_plot:
+        window = solution_window(method, data, root, trace)
+        cached = item.get('plot_data')
+        if (cached and "error" not in cached and plot_points(data) == plot_points(parameters)
+                and window == solution_window(method, parameters, item.get('root'), results)):
+            plot_data = dict(cached, root=root)
+        else:
+            with timed("plot_data"):
+                plot_data = generate_plot_data(func_str, method, root=root, window=window,
+                                               max_points=plot_points(data), **plot_params(method, data))
+
+    return {"results": trace, "root": root, "plot_data": plot_data, "precision": None, "start": start, "data": data}
+
+
+def _report_records():
+    # Se usa en el proceso de trabajo: reporta cada iteración para poder devolver la traza
+    # parcial si el proceso se termina por tiempo. Con la primera se envían las columnas y
+    # las filas anteriores (las de un cálculo que se continúa).
+    started = False
+
+    def on_record(record):
+        nonlocal started
+        if not started:
+            started = True
+            report_progress(record.trace.layout)
+            for index in range(record.index):
+                report_progress(record.trace.data[:, index].tolist())
+        report_progress(record.trace.data[:, record.index].tolist())
+    return on_record
+
+
+def _supervised_job(data, include_plot, max_evaluations):
+    # Se ejecuta en el proceso de trabajo
+    timer, token = start_request_timer()
+    try:
+        solution = solve_problem(data, include_plot, max_evaluations, on_record=_report_records())
+    finally:
+        stop_request_timer(token)
+    return solution, dict(timer.stages)
+
+
+def _continue_job(item, changes, include_plot, max_evaluations, deadline):
+    # Se ejecuta en el proceso de trabajo
+    timer, token = start_request_timer()
+    try:
+        solution = continue_problem(item, changes, include_plot, max_evaluations, deadline,
+                                    on_record=_report_records())
+    finally:
+        stop_request_timer(token)
+    return solution, dict(timer.stages)
+
+
+def _stream_job(data, max_evaluations, deadline):
+    # Se ejecuta en el proceso de trabajo: cada evento sale enseguida como progreso
+    # y el evento "done" (que lleva la traza completa) es el resultado
+    for event in stream_solution(data, max_evaluations, deadline):
+        if event["type"] == "done":
+            return event
+        report_progress(event, flush=True)
+    return None
+
+
+def partial_trace(progress):
+    """Reconstruye la traza parcial a partir del progreso reportado por el proceso de trabajo"""
+    if not progress:
+        return empty_trace()
+    trace = Trace(progress[0], capacity=len(progress))
+    for values in progress[1:]:
+        trace.append(*values)
+    return trace
+
+
+def _timed_out(progress):
+    return {"error": "Tiempo de cálculo agotado", "results": partial_trace(progress), "root": None, "partial": True}
+
+
+def supervised_solve(data, include_plot=True, timeout=None, max_evaluations=None, workers=None):
+    """Igual que solve_problem, pero en un proceso supervisado que se termina si no acaba en `timeout` segundos.
+
+    Al vencer el plazo devuelve el error de tiempo agotado con la traza
+    parcial. workers es el supervisor a usar (por omisión el de /api/solve).
+    """
+    with timed("worker"):
+        try:
+            solution, stages = (workers or supervisor).run(_supervised_job, data, include_plot, max_evaluations,
+                                                           timeout=timeout)
+        except WorkerTimeout as e:
+            return _timed_out(e.progress)
+    add_stages(stages)
+    return solution
+
+
+def supervised_continue(item, changes, include_plot=True, timeout=None, max_evaluations=None):
+    """Igual que continue_problem con plazo, pero en un proceso supervisado que se termina al vencer `timeout`.
+
+    Sin timeout se continúa en este proceso. Al vencer el plazo la traza
+    parcial incluye las iteraciones guardadas.
+    """
+    if timeout is None:
+        return continue_problem(item, changes, include_plot, max_evaluations)
+
+    deadline = time.monotonic() + timeout
+    with timed("worker"):
+        try:
+            solution, stages = supervisor.run(_continue_job, item, changes, include_plot, max_evaluations, deadline,
+                                              timeout=timeout)
+        except WorkerTimeout as e:
+            return _timed_out(e.progress)
+    add_stages(stages)
+    return solution
+
+
+def supervised_stream(data, max_evaluations=None, timeout=None):
+    """Igual que stream_solution, pero en un proceso supervisado que se termina si no acaba en `timeout` segundos.
+
+    Los eventos llegan a medida que el proceso los reporta; al vencer el
+    plazo (también durante la compilación) se produce el error de tiempo
+    agotado. Sin timeout se resuelve en este proceso.
+    """
+    if timeout is None:
+        yield from stream_solution(data, max_evaluations)
+        return
+
+    deadline = time.monotonic() + timeout
+    try:
+        done = yield from supervisor.iterate(_stream_job, data, max_evaluations, deadline, timeout=timeout)
+    except WorkerTimeout:
+        yield {"type": "error", "error": "Tiempo de cálculo agotado", "partial": True}
+        return
+    if done is not None:
+        yield done
+
+
+def trace_summary(trace):
+    """Iteraciones, evaluaciones de la función y error final de una traza"""
+    return {
+        "iterations": len(trace),
+        "evaluations": trace.last("evaluations"),
+        "error": trace.last("error")
+    }
+
+
+def error_payload(solution, fields=None):
+    """Respuesta JSON de una solución fallida: el error y, si la hay, la traza parcial"""
+    payload = {"error": solution["error"]}
+    if solution.get("partial"):
+        trace = solution["results"]
+        payload.update(partial=True, summary=trace_summary(trace))
+        if fields:
+            try:
+                payload["trace"] = trace.to_columns(fields)
+            except KeyError as e:
+                raise ValueError(f"Campos desconocidos: {e.args[0]}")
+        else:
+            payload["results"] = trace.rows()
+    return payload
+
+
+def response_sections(fields=None, include=None):
+    """Secciones de la respuesta a incluir: todas por omisión, ninguna si se piden columnas"""
+    if include is None:
+        include = () if fields else RESPONSE_SECTIONS
+    unknown = [section for section in include if section not in RESPONSE_SECTIONS]
+    if unknown:
+        raise ValueError(f"Secciones desconocidas: {', '.join(unknown)}")
+    return tuple(include)
+
+
+def solution_payload(solution, fields=None, include=None, start=0):
+    """Arma la respuesta JSON de una solución.
+
+    Siempre incluye la raíz y un resumen (iteraciones, evaluaciones de la
+    función y error final), y el refinamiento si se pidió precision=. Con
+    fields= se agrega la traza en columnas ({columna: [valores...]}) solo con
+    esas columnas; include= elige las secciones clásicas (results,
+    animation_data, plot_data). start omite las primeras iteraciones de la
+    traza (las que el cliente ya tiene al continuar un cálculo); el resumen
+    sigue siendo el de la traza completa.
+    """
+    trace = solution["results"]
+    payload = {"root": solution["root"], "summary": trace_summary(trace)}
+    if solution.get("precision"):
+        payload["precision"] = solution["precision"]
+
+    if fields:
+        try:
+            payload["trace"] = {field: values[start:] for field, values in trace.to_columns(fields).items()}
+        except KeyError as e:
+            raise ValueError(f"Campos desconocidos: {e.args[0]}")
+
+    for section in response_sections(fields, include):
+        if section == "results":
+            payload["results"] = trace.rows()[start:]
+        elif section == "animation_data":
+            payload["animation_data"] = trace.animation_points()[start:]
+        else:
+            payload["plot_data"] = solution["plot_data"]
+    return payload
+
+
+def stream_solution(data, max_evaluations=None, deadline=None):
+    """Resuelve un problema produciendo eventos a medida que avanza el método.
+
+    Primero un evento "plot" con las curvas muestreadas (salvo en los
+    sistemas de ecuaciones, que no tienen gráfica), luego un evento
+    "iteration" por iteración y al final "done" (con la raíz y la traza
+    completa, que no se envía al cliente) o "error". La gráfica sale junto
+    con la primera iteración: si el método rechaza sus parámetros (intervalo
+    sin cambio de signo, punto inicial inválido) solo se envía el error,
+    como en /api/solve. El presupuesto de evaluaciones y el plazo se
+    comprueban después de cada iteración.
+    """
+    method = data.get('method')
+    func_str = data.get('function')
+    tol = float(data.get('tolerance', 1e-6))
+    max_iter = int(data.get('max_iterations', 100))
+
+    compile_problem(method, func_str, data)
+
+    precision = {}
+    try:
+        steps = solver_steps(method, func_str, data, tol, max_iter, precision)
+        params = plot_params(method, data)
+    except MethodError as e:
+        yield {"type": "error", "error": str(e)}
+        return
+
+    def plot_event():
+        # Las curvas no dependen del resultado, solo de los parámetros ya validados
+        if method not in SYSTEM_METHODS:
+            yield {"type": "plot",
+                   "plot_data": generate_plot_data(func_str, method, max_points=plot_points(data), **params)}
+
+    trace = None
+    try:
+        while True:
+            record = next(steps)
+            if trace is None:
+                yield from plot_event()
+            trace = record.trace
+            yield {"type": "iteration", "result": record.row(), "animation": record.point()}
+
+            if max_evaluations is not None and record["evaluations"] > max_evaluations:
+                error = f"Se agotó el presupuesto de {max_evaluations} evaluaciones de la función"
+                yield {"type": "error", "error": error, "partial": True}
+                return
+            if deadline is not None and time.monotonic() > deadline:
+                yield {"type": "error", "error": "Tiempo de cálculo agotado", "partial": True}
+                return
+    except StopIteration as stop:
+        if trace is None:
+            yield from plot_event()
+        done = {"type": "done", "root": stop.value, "trace": trace if trace is not None else empty_trace()}
+        if precision:
+            done["precision"] = precision
+        yield done
+    except MethodError as e:
+        yield {"type": "error", "error": str(e)}
+
+
+def problem_key(data, include_plot=True):
+    """Clave canónica (hash) de un problema, o None si sus datos no se pueden normalizar.
+
+    Dos peticiones que solo difieren en espacios, en la forma de escribir los
+    números o en el orden de los campos comparten la misma clave.
+    """
+    try:
+        method = data.get('method')
+        params = plot_params(method, data)
+        if params.get("g_func_str") is not None:
+            params["g_func_str"] = ''.join(normalize_function(params["g_func_str"]).split())
+
+        canonical = {
+            "method": method,
+            "function": ''.join(normalize_function(data.get('function')).split()),
+            "tolerance": float(data.get('tolerance', 1e-6)),
+            "max_iterations": int(data.get('max_iterations', 100)),
+            "params": params,
+            "scan": scan_options(method, data),
+            "precision": precision_option(method, data),
+            "system": system_options(data) if method in SYSTEM_METHODS else None,
+            "include_plot": bool(include_plot),
+            "plot_points": plot_points(data) if include_plot else None
+        }
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+    payload = json.dumps(canonical, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def cached_solve(data, include_plot=True, timeout=None, max_evaluations=None):
+    """Igual que solve_problem, pero reutiliza la solución de un problema idéntico ya resuelto.
+
+    Con timeout el problema se resuelve en un proceso supervisado (ver
+    supervised_solve). Las soluciones parciales (tiempo o evaluaciones
+    agotados) no se guardan en la caché.
+
+    Devuelve la solución y si provino de la caché.
+    """
+    with timed("cache"):
+        key = problem_key(data, include_plot)
+        solution = result_cache.get(key) if key is not None else None
+    if solution is not None and not _over_budget(solution, max_evaluations):
+        return solution, True
+
+    if timeout is not None:
+        solution = supervised_solve(data, include_plot, timeout, max_evaluations)
+    else:
+        solution = solve_problem(data, include_plot, max_evaluations)
+    if key is not None and not solution.get("partial"):
+        result_cache.put(key, solution)
+    return solution, False
+
+
+def _over_budget(solution, max_evaluations):
+    # Una solución guardada con más evaluaciones que el presupuesto actual no se reutiliza
+    if max_evaluations is None or "error" in solution:
+        return False
+    return (solution["results"].last("evaluations") or 0) > max_evaluations
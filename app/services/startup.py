@@ -0,0 +1,100 @@
+# services/startup.py
+"""Arranque del servidor: informe de tiempos y calentamiento.
+
+app.py importa este módulo antes que cualquier otro para medir el costo de
+las importaciones. Solo usa la biblioteca estándar al importarse; los
+módulos de la aplicación se importan dentro de warm_up.
+"""
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from app.numerical_methods.lazy import is_loaded
+
+# Módulos pesados que deberían cargarse recién al calentar o con la primera petición que los use
+HEAVY_MODULES = ("sympy", "mpmath", "matplotlib")
+
+# Función de muestra: pasa por el intérprete, lambdify (math, mpmath y NumPy) y las derivadas
+WARMUP_FUNCTION = "sin(x)*exp(-x/4) - x/10"
+
+# Problema de muestra (polinomio, con gráfica) para la traza, el muestreo y la ruta de Horner
+WARMUP_PROBLEM = {"method": "newton_raphson", "function": "x**3 - 2*x - 5", "x0": 2,
+                  "tolerance": 1e-6, "max_iterations": 20}
+
+
+class StartupReport:
+    """Duración de cada fase del arranque, en el orden en que ocurrieron"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.last = self.start
+        self.phases = OrderedDict()
+
+    def mark(self, phase):
+        """Cierra la fase `phase`, medida desde la marca anterior"""
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self.last
+        self.last = now
+
+    @contextmanager
+    def phase(self, name):
+        self.last = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.mark(name)
+
+    def total(self):
+        return self.last - self.start
+
+    def heavy_modules(self):
+        """Módulos pesados ya cargados (los diferidos con lazy_import cuentan recién al usarse)"""
+        return [name for name in HEAVY_MODULES if is_loaded(name)]
+
+    def as_dict(self):
+        return {"phases": dict(self.phases), "total": self.total(), "heavy_modules": self.heavy_modules()}
+
+    def summary(self):
+        phases = ", ".join(f"{name} {seconds:.3f} s" for name, seconds in self.phases.items())
+        return f"Arranque en {self.total():.3f} s ({phases})"
+
+
+def warm_up_process():
+    """Inicializa sympy, lambdify y matplotlib (Agg y caché de fuentes) en el proceso actual"""
+    import numpy as np
+
+    from app.numerical_methods.utils import compile_function
+    from app.services.plotting import render_plot, PLOT_INITIAL_POINTS
+    from app.services.solver import solve_problem
+
+    f = compile_function(WARMUP_FUNCTION)
+    f(1.0)
+    f.derivatives(1.0, order=2)
+    f.vectorized(np.linspace(-1.0, 1.0, 8))
+
+    solution = solve_problem(dict(WARMUP_PROBLEM))
+    render_plot(WARMUP_PROBLEM["function"], WARMUP_PROBLEM["method"], x0=WARMUP_PROBLEM["x0"],
+                root=solution.get("root"), max_points=PLOT_INITIAL_POINTS)
+    return True
+
+
+def warm_up(workers=True, timeout=None):
+    """Calienta el proceso (y opcionalmente sus procesos de trabajo) antes de aceptar tráfico.
+
+    Sin esto, la primera petición después de un despliegue o de reiniciar un
+    proceso paga la importación de sympy y matplotlib y su inicialización.
+    """
+    from app.services.pipeline import pipeline
+    from app.services.supervisor import supervisor
+
+    with startup_report.phase("warmup"):
+        warm_up_process()
+
+    if workers:
+        with startup_report.phase("warmup_workers"):
+            supervisor.prestart(warm_up_process, timeout=timeout)
+            pipeline.prestart(warm_up_process, timeout=timeout)
+
+
+# Informe del arranque de este proceso (empieza a medir al importarse este módulo)
+startup_report = StartupReport()
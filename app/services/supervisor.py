@@ -0,0 +1,257 @@
+# services/supervisor.py
+import multiprocessing
+import threading
+import time
+
+# Cada cuánto (segundos) envía el proceso de trabajo el progreso acumulado
+PROGRESS_INTERVAL = 0.05
+
+# Los procesos de trabajo no se crean con fork: el proceso de la aplicación ya tiene hilos
+# (servidor, pipeline) y un fork con un cerrojo tomado puede bloquear al hijo. forkserver los
+# crea desde un proceso aparte sin hilos; spawn (donde no existe) desde un intérprete nuevo
+START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+# Conexión con el proceso supervisor (solo definida dentro de un proceso de trabajo)
+_progress = None
+
+
+class WorkerTimeout(Exception):
+    """El trabajo no terminó a tiempo y su proceso fue terminado.
+
+    progress tiene lo que el trabajo alcanzó a reportar con report_progress.
+    """
+
+    def __init__(self, progress):
+        super().__init__("Tiempo de cálculo agotado")
+        self.progress = progress
+
+
+class WorkerCrashed(Exception):
+    """El proceso de trabajo terminó sin entregar un resultado"""
+
+
+class _ProgressChannel:
+    # Acumula el progreso y lo envía por lotes para no pagar un mensaje por iteración
+    def __init__(self, conn):
+        self.conn = conn
+        self.buffer = []
+        self.last_flush = time.monotonic()
+
+    def add(self, item):
+        self.buffer.append(item)
+        if time.monotonic() - self.last_flush >= PROGRESS_INTERVAL:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.conn.send(("progress", self.buffer))
+            self.buffer = []
+        self.last_flush = time.monotonic()
+
+
+def report_progress(item, flush=False):
+    """Reporta progreso parcial al supervisor (no hace nada fuera de un proceso de trabajo).
+
+    Con flush se envía enseguida junto con lo acumulado, sin esperar a PROGRESS_INTERVAL.
+    """
+    if _progress is not None:
+        _progress.add(item)
+        if flush:
+            _progress.flush()
+
+
+def _worker_main(conn):
+    global _progress
+    _progress = _ProgressChannel(conn)
+
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+
+        func, args, kwargs = job
+        _progress.buffer = []
+        try:
+            result = func(*args, **kwargs)
+            message = ("done", result)
+        except Exception as e:
+            message = ("error", e)
+
+        _progress.flush()
+        try:
+            conn.send(message)
+        except Exception as e:
+            # Resultado o excepción que no se pueden serializar
+            conn.send(("error", RuntimeError(str(e))))
+
+
+class _Worker:
+    def __init__(self, context):
+        self.conn, child = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child,), daemon=True)
+        self.process.start()
+        child.close()
+
+    def alive(self):
+        return self.process.is_alive()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(1)
+        if self.process.is_alive():
+            self.kill()
+
+
+class Supervisor:
+    """Ejecuta trabajos en procesos aparte que se pueden terminar al vencer su plazo.
+
+    Los procesos se reutilizan entre trabajos; uno que se termina por tiempo
+    se reemplaza por otro nuevo en el siguiente trabajo.
+    """
+
+    def __init__(self, workers=2, start_method=None):
+        self.lock = threading.Lock()
+        self.idle = []
+        self.configure(workers, start_method)
+
+    def configure(self, workers=2, start_method=None):
+        self.shutdown()
+        with self.lock:
+            self.workers = max(1, workers or 1)
+            self.context = multiprocessing.get_context(start_method or START_METHOD)
+            self.slots = threading.BoundedSemaphore(self.workers)
+
+    def run(self, func, *args, timeout=None, **kwargs):
+        """Ejecuta func(*args, **kwargs) en un proceso de trabajo y devuelve su resultado.
+
+        Lanza WorkerTimeout si no termina en `timeout` segundos (contando la
+        espera por un proceso libre) y vuelve a lanzar las excepciones del
+        trabajo. func y sus argumentos deben poder serializarse (pickle).
+        """
+        job = self.iterate(func, *args, timeout=timeout, **kwargs)
+        while True:
+            try:
+                next(job)
+            except StopIteration as stop:
+                return stop.value
+
+    def iterate(self, func, *args, timeout=None, **kwargs):
+        """Igual que run, pero como generador: produce cada elemento que el trabajo reporta con
+        report_progress en cuanto llega y devuelve el resultado del trabajo.
+
+        Si el generador se cierra antes de terminar (el cliente dejó de leer),
+        el proceso de trabajo se termina.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self.slots.acquire(timeout=timeout):
+            raise WorkerTimeout([])
+
+        worker = None
+        try:
+            worker = self._checkout()
+            worker.conn.send((func, args, kwargs))
+
+            progress = []
+            while True:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                if not worker.conn.poll(remaining):
+                    worker.kill()
+                    worker = None
+                    raise WorkerTimeout(progress)
+
+                try:
+                    kind, value = worker.conn.recv()
+                except EOFError:
+                    worker.kill()
+                    worker = None
+                    raise WorkerCrashed("El proceso de cálculo terminó inesperadamente")
+
+                if kind == "progress":
+                    progress.extend(value)
+                    yield from value
+                elif kind == "done":
+                    return value
+                else:
+                    raise value
+        except GeneratorExit:
+            # El trabajo sigue en curso: el proceso no se puede reutilizar
+            if worker is not None:
+                worker.kill()
+                worker = None
+            raise
+        finally:
+            if worker is not None:
+                with self.lock:
+                    self.idle.append(worker)
+            self.slots.release()
+
+    def prestart(self, initializer=None, timeout=None):
+        """Arranca los procesos de trabajo que falten antes de recibir trabajos.
+
+        initializer (opcional, serializable) se ejecuta en cada proceso nuevo,
+        todos a la vez; los que fallan o no terminan en `timeout` segundos se
+        descartan y se reemplazarán bajo demanda. Devuelve cuántos quedaron listos.
+        """
+        with self.lock:
+            missing = self.workers - len(self.idle)
+        started = [_Worker(self.context) for _ in range(max(0, missing))]
+
+        if initializer is not None:
+            for worker in started:
+                worker.conn.send((initializer, (), {}))
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        ready = []
+        for worker in started:
+            if initializer is not None:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    kind = "progress"
+                    while kind == "progress":
+                        if not worker.conn.poll(remaining):
+                            raise TimeoutError
+                        kind, _ = worker.conn.recv()
+                except (TimeoutError, EOFError):
+                    worker.kill()
+                    continue
+            ready.append(worker)
+
+        with self.lock:
+            self.idle.extend(ready)
+        return len(ready)
+
+    def shutdown(self):
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for worker in idle:
+            worker.stop()
+
+    def stats(self):
+        with self.lock:
+            return {"workers": self.workers, "idle": len(self.idle)}
+
+    def _checkout(self):
+        with self.lock:
+            while self.idle:
+                worker = self.idle.pop()
+                if worker.alive():
+                    return worker
+        return _Worker(self.context)
+
+
+# Supervisor compartido por toda la aplicación
+supervisor = Supervisor()
+
+# Procesos propios de /api/solve/batch: un lote no ocupa los de las peticiones individuales
+batch_supervisor = Supervisor()
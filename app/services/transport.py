@@ -0,0 +1,142 @@
+# services/transport.py
+import gzip
+import struct
+
+import numpy as np
+
+from app.numerical_methods.trace import Trace
+
+try:
+    import brotli
+except ImportError:  # brotli es opcional: sin él solo se ofrece gzip
+    brotli = None
+
+# Tipos MIME aceptados para la codificación binaria
+MSGPACK_MIMETYPES = ("application/msgpack", "application/x-msgpack")
+
+# Tipos de extensión MessagePack para arreglos numéricos empaquetados (little-endian);
+# static/js/msgpack.js los decodifica como Float64Array / Float32Array
+EXT_FLOAT64_ARRAY = 1
+EXT_FLOAT32_ARRAY = 2
+
+# Largo mínimo de una lista numérica para empaquetarla como arreglo
+PACK_MIN_LENGTH = 8
+
+# Tipos de contenido que vale la pena comprimir
+COMPRESSIBLE_MIMETYPES = ("application/json", "application/msgpack", "application/x-ndjson", "text/")
+
+
+def content_encodings():
+    """Codificaciones de compresión disponibles, en orden de preferencia"""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def compress(data, encoding, level=6):
+    if encoding == "br":
+        return brotli.compress(data, quality=min(level, 11))
+    return gzip.compress(data, compresslevel=level)
+
+
+def is_compressible(mimetype):
+    return any(mimetype.startswith(prefix) for prefix in COMPRESSIBLE_MIMETYPES)
+
+
+def packb(obj, float32=False):
+    """Codifica obj en MessagePack.
+
+    Las listas numéricas largas (valores del muestreo, columnas de la traza) y
+    los arreglos de NumPy se empaquetan como un bloque de float64 (o float32)
+    en una extensión; los None de esas listas viajan como NaN. Las trazas se
+    codifican como sus filas, igual que en JSON.
+    """
+    out = bytearray()
+    _pack(obj, out, float32)
+    return bytes(out)
+
+
+def _pack(obj, out, float32):
+    if obj is None:
+        out.append(0xc0)
+    elif isinstance(obj, (bool, np.bool_)):
+        out.append(0xc3 if obj else 0xc2)
+    elif isinstance(obj, (int, np.integer)):
+        _pack_int(int(obj), out)
+    elif isinstance(obj, (float, np.floating)):
+        out += struct.pack(">Bd", 0xcb, float(obj))
+    elif isinstance(obj, str):
+        _pack_str(obj, out)
+    elif isinstance(obj, (bytes, bytearray)):
+        _pack_header(len(obj), out, None, 0xc4, 0xc5, 0xc6)
+        out += obj
+    elif isinstance(obj, dict):
+        _pack_header(len(obj), out, 0x80, None, 0xde, 0xdf)
+        for key, value in obj.items():
+            _pack(key, out, float32)
+            _pack(value, out, float32)
+    elif isinstance(obj, np.ndarray) and obj.dtype.kind in "fiu":
+        _pack_array(obj, out, float32)
+    elif isinstance(obj, Trace):
+        _pack(obj.rows(), out, float32)
+    elif isinstance(obj, (list, tuple, np.ndarray)):
+        if len(obj) >= PACK_MIN_LENGTH and _is_numeric(obj):
+            _pack_array(np.array(obj, dtype=float), out, float32)
+            return
+        _pack_header(len(obj), out, 0x90, None, 0xdc, 0xdd)
+        for value in obj:
+            _pack(value, out, float32)
+    else:
+        raise TypeError(f"Tipo no serializable en MessagePack: {type(obj).__name__}")
+
+
+def _is_numeric(values):
+    # Solo números (al menos un float) o None: los enteros puros se dejan como lista
+    has_float = False
+    for value in values:
+        kind = type(value)
+        if kind is float:
+            has_float = True
+        elif value is not None and kind is not int:
+            return False
+    return has_float
+
+
+def _pack_array(values, out, float32):
+    dtype, code = ("<f4", EXT_FLOAT32_ARRAY) if float32 else ("<f8", EXT_FLOAT64_ARRAY)
+    data = np.ascontiguousarray(values, dtype=dtype).tobytes()
+    _pack_header(len(data), out, None, 0xc7, 0xc8, 0xc9)
+    out.append(code)
+    out += data
+
+
+def _pack_int(value, out):
+    if 0 <= value < 0x80:
+        out.append(value)
+    elif -32 <= value < 0:
+        out += struct.pack(">b", value)
+    elif -(1 << 63) <= value < (1 << 63):
+        out += struct.pack(">Bq", 0xd3, value)
+    elif 0 <= value < (1 << 64):
+        out += struct.pack(">BQ", 0xcf, value)
+    else:
+        out += struct.pack(">Bd", 0xcb, float(value))
+
+
+def _pack_str(value, out):
+    data = value.encode("utf-8")
+    if len(data) < 32:
+        out.append(0xa0 | len(data))
+    else:
+        _pack_header(len(data), out, None, 0xd9, 0xda, 0xdb)
+    out += data
+
+
+def _pack_header(length, out, fix, code8, code16, code32):
+    # Encabezado de largo: forma "fix" (si existe), 8, 16 o 32 bits
+    if fix is not None and length < 16:
+        out.append(fix | length)
+    elif code8 is not None and length < 0x100:
+        out += struct.pack(">BB", code8, length)
+    elif length < 0x10000:
+        out += struct.pack(">BH", code16, length)
+    else:
+        out += struct.pack(">BI", code32, length)
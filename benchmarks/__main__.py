@@ -0,0 +1,79 @@
+# benchmarks/__main__.py
+"""Suite de microbenchmarks de los métodos y de la generación de gráficas.
+
+Uso:
+    python -m benchmarks                          # tabla legible
+    python -m benchmarks --json -o base.json      # guardar una línea base
+    python -m benchmarks --compare base.json      # comparar (sale con 1 si hay regresiones)
+
+La carga concurrente contra el servidor está en python -m benchmarks.load.
+"""
+import argparse
+import json
+import sys
+
+from benchmarks.runner import run, compare, METHODS, DEFAULT_THRESHOLD
+
+
+def format_table(report):
+    lines = [f"{'medición':40} {'tiempo (ms)':>12} {'iter':>6} {'evals':>6} {'memoria (KiB)':>14}"]
+    for record in report["results"]:
+        if "error" in record:
+            lines.append(f"{record['name']:40} error: {record['error']}")
+            continue
+        lines.append(
+            f"{record['name']:40} {record['time_s'] * 1000:12.4f} "
+            f"{record.get('iterations', ''):>6} {record.get('evaluations', '') or '':>6} "
+            f"{record['peak_bytes'] / 1024:14.1f}"
+        )
+    return "\n".join(lines)
+
+
+def format_comparison(rows):
+    lines = [f"{'medición':40} {'razón':>8}  estado"]
+    for row in rows:
+        ratio = f"{row['ratio']:8.3f}" if "ratio" in row else f"{'-':>8}"
+        details = ''.join(f"  {key}: {row[key][0]} -> {row[key][1]}"
+                          for key in ("iterations", "evaluations") if key in row)
+        lines.append(f"{row['name']:40} {ratio}  {row['status']}{details}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="rondas por medición (se reporta la mediana)")
+    parser.add_argument("--method", action="append", choices=METHODS, help="limitar a estos métodos")
+    parser.add_argument("--case", action="append", help="limitar a estos casos del corpus")
+    parser.add_argument("--no-pipeline", action="store_true", help="omitir evaluación, gráficas y serialización")
+    parser.add_argument("--no-startup", action="store_true",
+                        help="omitir el arranque en frío (importaciones y calentamiento)")
+    parser.add_argument("--json", action="store_true", help="imprimir el informe en JSON")
+    parser.add_argument("-o", "--output", help="guardar el informe JSON en este archivo")
+    parser.add_argument("--compare", metavar="BASELINE", help="comparar con un informe JSON guardado")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="variación relativa de tiempo que cuenta como regresión (0.10 = 10%%)")
+    args = parser.parse_args(argv)
+
+    report = run(args.repeat, methods=args.method, cases=args.case, pipeline=not args.no_pipeline,
+                 startup=not args.no_startup)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        rows = compare(report, baseline, args.threshold)
+        if args.json:
+            print(json.dumps({"report": report, "comparison": rows}, indent=2))
+        else:
+            print(format_comparison(rows))
+        return 1 if any(row["status"] == "regression" for row in rows) else 0
+
+    print(json.dumps(report, indent=2) if args.json else format_table(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
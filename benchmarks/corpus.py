@@ -0,0 +1,65 @@
+# benchmarks/corpus.py
+
+# Corpus estándar de funciones de prueba. Cada caso trae los parámetros que
+# necesitan todas las familias de métodos: intervalo [a, b] para los cerrados,
+# x0 (y x1) para los abiertos y g(x) para los de punto fijo cuando existe una
+# función de iteración convergente.
+CASES = [
+    # Polinomios
+    {"name": "cubic", "category": "polinomio", "function": "x**3 - x - 2",
+     "a": 1, "b": 2, "x0": 1.5, "x1": 2, "g_function": "(x + 2)**(1/3)"},
+    {"name": "degree10", "category": "polinomio", "function": "x**10 - 1",
+     "a": 0, "b": 1.3, "x0": 1.2, "x1": 1.3},
+    {"name": "wilkinson5", "category": "polinomio", "function": "(x-1)*(x-2)*(x-3)*(x-4)*(x-5)",
+     "a": 2.5, "b": 3.4, "x0": 3.2, "x1": 3.4},
+
+    # Trascendentes
+    {"name": "cos_fixed", "category": "trascendente", "function": "cos(x) - x",
+     "a": 0, "b": 1, "x0": 1, "x1": 0.5, "g_function": "cos(x)"},
+    {"name": "exp_log", "category": "trascendente", "function": "exp(x) - 10",
+     "a": 0, "b": 4, "x0": 1, "x1": 2, "g_function": "log(10)"},
+    {"name": "x_sin", "category": "trascendente", "function": "x*sin(x) - 1",
+     "a": 0, "b": 2, "x0": 1, "x1": 1.5, "g_function": "1/sin(x)"},
+
+    # Raíces múltiples o casi múltiples
+    {"name": "triple", "category": "multiple", "function": "(x - 2)**3",
+     "a": 0, "b": 3.3, "x0": 3, "x1": 2.5},
+    {"name": "near_double", "category": "multiple", "function": "(x - 1)**2*(x - 1.001)",
+     "a": 1.0005, "b": 2, "x0": 2, "x1": 1.5},
+
+    # Convergencia lenta
+    {"name": "flat_tanh", "category": "lenta", "function": "tanh(x) - 0.999",
+     "a": 0, "b": 10, "x0": 3, "x1": 4},
+    {"name": "convex_exp", "category": "lenta", "function": "exp(5*x) - 2",
+     "a": -1, "b": 3, "x0": 0.5, "x1": 1, "g_function": "x - (exp(5*x) - 2)/50"},
+]
+
+
+def broyden_tridiagonal(n):
+    """Sistema tridiagonal de Broyden de n ecuaciones (jacobiano disperso)"""
+    equations = []
+    for i in range(1, n + 1):
+        equation = f"(3 - 2*x{i})*x{i} + 1"
+        if i > 1:
+            equation += f" - x{i - 1}"
+        if i < n:
+            equation += f" - 2*x{i + 1}"
+        equations.append(equation)
+    return "; ".join(equations)
+
+
+# Sistemas de ecuaciones (solo para newton_system): ecuaciones separadas por ';' y x0 vectorial
+CASES += [
+    {"name": "circle_hyperbola", "category": "sistema", "function": "x**2 + y**2 - 4; x*y - 1", "x0": [2, 0.5]},
+    {"name": "circle_hyperbola_broyden", "category": "sistema", "function": "x**2 + y**2 - 4; x*y - 1",
+     "x0": [2, 0.5], "jacobian": "broyden"},
+    {"name": "trig3", "category": "sistema",
+     "function": "3*x - cos(y*z) - 1/2; x**2 - 81*(y + 0.1)**2 + sin(z) + 1.06; exp(-x*y) + 20*z + (10*pi - 3)/3",
+     "x0": [0.1, 0.1, -0.1]},
+    {"name": "tridiagonal200", "category": "sistema", "function": broyden_tridiagonal(200), "x0": [-1] * 200},
+    {"name": "tridiagonal200_broyden", "category": "sistema", "function": broyden_tridiagonal(200),
+     "x0": [-1] * 200, "jacobian": "broyden"},
+]
+
+# Función y malla usadas para medir la evaluación y la gráfica
+PIPELINE_FUNCTION = "x*sin(x) - exp(-x/5)*cos(3*x)"
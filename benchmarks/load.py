@@ -0,0 +1,655 @@
+# benchmarks/load.py
+"""Generador de carga: reproduce tráfico de /api/solve, /api/explain y /api/history/<id>.
+
+Arranca la aplicación en un proceso aparte (o usa un servidor ya en marcha
+con --url), envía los problemas del corpus con la concurrencia y el ritmo
+pedidos e informa, por ruta y por método, rendimiento, percentiles de
+latencia, tasa de errores y crecimiento de la memoria del servidor (el
+proceso y sus hijos: procesos supervisados y de dibujo).
+
+Uso:
+    python -m benchmarks.load                                     # corpus estándar, 8 clientes, 30 s
+    python -m benchmarks.load --rate 20 --concurrency 16          # 20 solves/s en lazo abierto
+    python -m benchmarks.load --from-history instance/history.db  # tráfico registrado en el historial
+    python -m benchmarks.load --isolate --duration 10             # una fase por método (memoria por método)
+    python -m benchmarks.load --variant base --variant w4:SOLVE_WORKERS=4,PIPELINE_THREADS=8
+    python -m benchmarks.load --url http://127.0.0.1:5000 --pid 1234
+"""
+import argparse
+import json
+import os
+import queue
+import random
+import signal
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from contextlib import nullcontext
+from datetime import datetime
+
+import numpy as np
+import requests
+
+from benchmarks.corpus import CASES
+from benchmarks.runner import METHODS, problem_for
+
+# Carga por omisión
+DEFAULT_CONCURRENCY = 8
+DEFAULT_DURATION = 30  # segundos (por fase con --isolate)
+
+# Consultas que siguen a cada solve resuelto: su explicación y un elemento cualquiera del historial
+EXPLAIN_RATIO = 0.25
+HISTORY_RATIO = 0.5
+
+# Solves enviados sin medir antes de la carga: calientan el servidor y llenan el historial que se consulta
+SEED_REQUESTS = 20
+
+PERCENTILES = (50, 90, 95, 99)
+
+# Intervalo de muestreo de la memoria del servidor (segundos)
+MEMORY_INTERVAL = 0.5
+
+# Plazos (segundos): el arranque incluye el calentamiento del servidor
+SERVER_START_TIMEOUT = 120
+REQUEST_TIMEOUT = 60
+
+ENDPOINTS = {"solve": "/api/solve", "explain": "/api/explain", "history": "/api/history/<id>"}
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+# Servidor de prueba: aplica la configuración pedida antes de ejecutar app.py y atiende con werkzeug
+SERVER_SCRIPT = """
+import json, runpy, sys
+from werkzeug.serving import make_server
+from config import config
+overrides, port, threaded = json.loads(sys.argv[1]), int(sys.argv[2]), sys.argv[3] == "1"
+for key, value in overrides.items():
+    setattr(config['development'], key, value)
+app = runpy.run_path("app.py", run_name="load_server")["app"]
+make_server("127.0.0.1", port, app, threaded=threaded).serve_forever()
+"""
+
+
+def standard_corpus():
+    """Un problema por cada caso del corpus de benchmarks y cada método que le aplica"""
+    corpus = []
+    for case in CASES:
+        for method in METHODS:
+            data = problem_for(method, case)
+            if data is not None:
+                corpus.append(data)
+    return corpus
+
+
+def load_corpus(path):
+    """Lee un corpus JSONL: un cuerpo de /api/solve por línea"""
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def history_corpus(path):
+    """Cuerpos de /api/solve registrados en un historial SQLite, del más antiguo al más reciente"""
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        rows = conn.execute("SELECT parameters FROM history ORDER BY id").fetchall()
+    finally:
+        conn.close()
+    return [body for body in (json.loads(row[0]) for row in rows if row[0]) if isinstance(body, dict)]
+
+
+def process_tree(pid):
+    """pid y todos sus descendientes (Linux: /proc)"""
+    children = defaultdict(list)
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # El nombre del proceso va entre paréntesis y puede contener espacios
+        children[int(stat[stat.rindex(")") + 2:].split()[1])].append(int(entry))
+
+    tree = [pid]
+    for current in tree:
+        tree.extend(children.get(current, ()))
+    return tree
+
+
+def tree_rss(pid):
+    """Memoria residente (bytes) de pid y sus descendientes, o None si no se puede leer"""
+    if not os.path.isdir("/proc"):
+        return None
+
+    total = None
+    for current in process_tree(pid):
+        try:
+            with open(f"/proc/{current}/statm") as f:
+                pages = int(f.read().split()[1])
+        except (OSError, ValueError, IndexError):
+            # El proceso terminó mientras se recorría el árbol
+            continue
+        total = (total or 0) + pages * PAGE_SIZE
+    return total
+
+
+class MemorySampler:
+    """Muestrea en segundo plano la memoria del árbol de procesos del servidor"""
+
+    def __init__(self, pid, interval=MEMORY_INTERVAL):
+        self.pid = pid
+        self.interval = interval
+        self.samples = []
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stopped.set()
+        self.thread.join()
+
+    def _run(self):
+        while not self.stopped.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        """Toma una muestra ahora y devuelve su índice (para summary)"""
+        rss = tree_rss(self.pid)
+        if rss is not None:
+            self.samples.append(rss)
+        return len(self.samples) - 1
+
+    def summary(self, start):
+        """Memoria al principio y al final, máximo y crecimiento desde la muestra `start`"""
+        samples = self.samples[max(start, 0):]
+        if not samples:
+            return None
+        return {"start_bytes": samples[0], "end_bytes": samples[-1], "peak_bytes": max(samples),
+                "growth_bytes": samples[-1] - samples[0]}
+
+
+class LoadStats:
+    """Resultados por (ruta, método): latencias, códigos de estado, errores y bytes recibidos.
+
+    Son errores los fallos de conexión, los plazos vencidos y las respuestas
+    5xx; son rechazos las respuestas 4xx y las que traen "error" (métodos que
+    divergen, funciones inválidas...).
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.groups = {}
+
+    def record(self, endpoint, method, latency, status=None, rejected=False, size=0):
+        with self.lock:
+            group = self.groups.get((endpoint, method))
+            if group is None:
+                group = self.groups[(endpoint, method)] = {"latencies": [], "statuses": defaultdict(int),
+                                                           "ok": 0, "rejected": 0, "errors": 0, "bytes": 0}
+            group["latencies"].append(latency)
+            group["statuses"][status or "none"] += 1
+            group["bytes"] += size
+            if status is None or status >= 500:
+                group["errors"] += 1
+            elif rejected or status >= 400:
+                group["rejected"] += 1
+            else:
+                group["ok"] += 1
+
+
+def summarize(groups, elapsed):
+    """Totales, rendimiento (peticiones/s) y percentiles de latencia de uno o varios grupos"""
+    latencies = np.array([latency for group in groups for latency in group["latencies"]]) * 1000
+    statuses = defaultdict(int)
+    for group in groups:
+        for status, count in group["statuses"].items():
+            statuses[str(status)] += count
+
+    count = len(latencies)
+    summary = {
+        "requests": count,
+        "ok": sum(group["ok"] for group in groups),
+        "rejected": sum(group["rejected"] for group in groups),
+        "errors": sum(group["errors"] for group in groups),
+        "bytes": sum(group["bytes"] for group in groups),
+        "statuses": dict(statuses),
+        "throughput": count / elapsed if elapsed else 0.0
+    }
+    summary["error_rate"] = summary["errors"] / count if count else 0.0
+    if count:
+        summary["latency_ms"] = dict(zip((f"p{p}" for p in PERCENTILES), np.percentile(latencies, PERCENTILES).tolist()),
+                                     mean=float(latencies.mean()), max=float(latencies.max()))
+    return summary
+
+
+class LoadRun:
+    """Una fase de carga contra url.
+
+    Sin rate es de lazo cerrado: cada uno de los `concurrency` clientes envía
+    la siguiente petición al recibir la respuesta. Con rate es de lazo
+    abierto: los solves llegan como un proceso de Poisson de `rate` por
+    segundo y la latencia se mide desde la llegada programada, así que la
+    espera por falta de clientes libres también cuenta. Las consultas de
+    explicación e historial se suman a los solves que las originan.
+    """
+
+    def __init__(self, url, corpus, stats, history_items=(), concurrency=DEFAULT_CONCURRENCY, rate=None,
+                 duration=DEFAULT_DURATION, max_requests=None, explain_ratio=EXPLAIN_RATIO,
+                 history_ratio=HISTORY_RATIO, cache_bust=False, rng=None):
+        self.url = url
+        self.corpus = corpus
+        self.stats = stats
+        self.history_items = list(history_items)
+        self.concurrency = concurrency
+        self.rate = rate
+        self.duration = duration
+        self.max_requests = max_requests
+        self.explain_ratio = explain_ratio
+        self.history_ratio = history_ratio
+        self.cache_bust = cache_bust
+        self.rng = rng or random.Random()
+
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.sent = 0
+        self.dispatched = False
+        self.deadline = None
+
+    def run(self):
+        """Ejecuta la fase y devuelve su duración real (segundos)"""
+        start = time.perf_counter()
+        self.deadline = start + self.duration
+
+        workers = [threading.Thread(target=self._worker, daemon=True) for _ in range(self.concurrency)]
+        for worker in workers:
+            worker.start()
+        if self.rate is not None:
+            self._dispatch(start)
+        for worker in workers:
+            worker.join()
+        return time.perf_counter() - start
+
+    def next_solve(self):
+        """Siguiente problema del corpus (se reproduce en orden, cíclicamente) o None si se acabó el presupuesto"""
+        with self.lock:
+            if self.max_requests is not None and self.sent >= self.max_requests:
+                return None
+            body = dict(self.corpus[self.sent % len(self.corpus)])
+            self.sent += 1
+            sent = self.sent
+
+        if self.cache_bust:
+            # Una tolerancia distinta (en 1e-12 relativo) en cada envío evita la caché de soluciones
+            body["tolerance"] = float(body.get("tolerance", 1e-6)) * (1 + sent * 1e-12)
+        return "solve", body
+
+    def _dispatch(self, start):
+        arrival = start
+        while True:
+            arrival += self.rng.expovariate(self.rate)
+            if arrival >= self.deadline:
+                break
+            job = self.next_solve()
+            if job is None:
+                break
+            delay = arrival - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            self.queue.put((arrival, job))
+        self.dispatched = True
+
+    def _worker(self):
+        session = requests.Session()
+        try:
+            while True:
+                try:
+                    if self.rate is None:
+                        scheduled, job = self.queue.get_nowait()
+                    else:
+                        scheduled, job = self.queue.get(timeout=0.05)
+                except queue.Empty:
+                    if self.rate is not None:
+                        if self.dispatched:
+                            return
+                        continue
+                    if time.perf_counter() >= self.deadline:
+                        return
+                    job = self.next_solve()
+                    if job is None:
+                        return
+                    scheduled = time.perf_counter()
+                self._execute(session, scheduled, job)
+        finally:
+            session.close()
+
+    def _execute(self, session, scheduled, job):
+        kind, payload = job
+        method = payload.get("method")
+        try:
+            if kind == "solve":
+                response = session.post(f"{self.url}/api/solve", json=payload, timeout=REQUEST_TIMEOUT)
+            elif kind == "explain":
+                response = session.post(f"{self.url}/api/explain", json={"calc_id": payload["calc_id"]},
+                                        timeout=REQUEST_TIMEOUT)
+            else:
+                response = session.get(f"{self.url}/api/history/{payload['id']}", timeout=REQUEST_TIMEOUT)
+            content = response.content
+        except requests.RequestException:
+            self.stats.record(ENDPOINTS[kind], method, time.perf_counter() - scheduled)
+            return
+
+        latency = time.perf_counter() - scheduled
+        try:
+            body = response.json()
+        except ValueError:
+            body = {}
+        rejected = isinstance(body, dict) and "error" in body
+        self.stats.record(ENDPOINTS[kind], method, latency, response.status_code, rejected, len(content))
+
+        if kind != "solve" or rejected or not response.ok or time.perf_counter() >= self.deadline:
+            return
+        now = time.perf_counter()
+        if "calc_id" in body and self.rng.random() < self.explain_ratio:
+            self.queue.put((now, ("explain", {"method": method, "calc_id": body["calc_id"]})))
+        if self.history_items and self.rng.random() < self.history_ratio:
+            self.queue.put((now, ("history", self.rng.choice(self.history_items))))
+
+
+class LocalServer:
+    """La aplicación en un proceso aparte, en un puerto libre y con la configuración pedida.
+
+    overrides reemplaza atributos de la configuración de desarrollo (p. ej.
+    SOLVE_WORKERS=4); THREADED=false la sirve con un solo hilo. Con el
+    historial en SQLite y sin HISTORY_DATABASE se usa una base temporal.
+    """
+
+    def __init__(self, overrides=None):
+        self.overrides = dict(overrides or {})
+        self.threaded = bool(self.overrides.pop("THREADED", True))
+        self.process = None
+        self.url = None
+        self.directory = None
+
+    @property
+    def pid(self):
+        return self.process.pid if self.process else None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def start(self, timeout=SERVER_START_TIMEOUT):
+        self.directory = tempfile.TemporaryDirectory(prefix="load-")
+        overrides = dict(self.overrides)
+        if overrides.get("HISTORY_BACKEND") == "sqlite":
+            overrides.setdefault("HISTORY_DATABASE", os.path.join(self.directory.name, "history.db"))
+
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+
+        # El registro de peticiones de werkzeug va a un archivo: una tubería sin leer bloquearía al servidor
+        self.log = open(os.path.join(self.directory.name, "server.log"), "w+")
+        self.process = subprocess.Popen(
+            [sys.executable, "-c", SERVER_SCRIPT, json.dumps(overrides), str(port), "1" if self.threaded else "0"],
+            cwd=ROOT, stdout=self.log, stderr=subprocess.STDOUT, start_new_session=True
+        )
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and self.process.poll() is None:
+            try:
+                requests.get(f"{self.url}/api/metrics", timeout=1)
+                return
+            except requests.RequestException:
+                time.sleep(0.2)
+
+        self.log.seek(0)
+        output = self.log.read()[-2000:]
+        self.stop()
+        raise RuntimeError(f"El servidor no arrancó en {timeout} s:\n{output}")
+
+    def _signal(self, signum):
+        try:
+            os.killpg(self.process.pid, signum)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def stop(self):
+        if self.process is not None:
+            # Se termina todo el grupo: los procesos supervisados y de dibujo no sobreviven al servidor
+            self._signal(signal.SIGTERM)
+            try:
+                self.process.wait(10)
+            except subprocess.TimeoutExpired:
+                self._signal(signal.SIGKILL)
+                self.process.wait()
+        self.process = None
+        if self.directory is not None:
+            self.log.close()
+            self.directory.cleanup()
+            self.directory = None
+
+
+def seed_server(url, corpus, count=SEED_REQUESTS):
+    """Envía sin medir `count` solves repartidos por el corpus y devuelve los elementos del historial ({id, method})"""
+    with requests.Session() as session:
+        for body in corpus[::max(1, len(corpus) // count)][:count]:
+            session.post(f"{url}/api/solve", json=body, timeout=REQUEST_TIMEOUT)
+        listing = session.get(f"{url}/api/history", params={"per_page": 100}, timeout=REQUEST_TIMEOUT).json()
+    return [{"id": item["id"], "method": item.get("method")} for item in listing.get("items", [])]
+
+
+def run_load(url, corpus, pid=None, isolate=False, seed=0, **options):
+    """Carga el servidor de url con el corpus y devuelve el informe (serializable a JSON).
+
+    Con isolate los métodos se cargan uno tras otro, en fases de `duration`
+    segundos, para atribuir a cada uno el crecimiento de la memoria; si no,
+    todo el corpus se mezcla en una sola fase. pid (el del servidor) habilita
+    la medición de memoria. options va a LoadRun.
+    """
+    if not corpus:
+        raise ValueError("El corpus está vacío")
+
+    rng = random.Random(seed)
+    history_items = seed_server(url, corpus)
+    stats = LoadStats()
+
+    if isolate:
+        methods = list(dict.fromkeys(body.get("method") for body in corpus))
+        phases = [(method, [body for body in corpus if body.get("method") == method]) for method in methods]
+    else:
+        phases = [(None, corpus)]
+
+    memory = {}
+    elapsed = {}
+    sampler = MemorySampler(pid) if pid else None
+    with sampler or nullcontext():
+        first = sampler.sample() if sampler else None
+        for method, bodies in phases:
+            start = sampler.sample() if sampler else None
+            items = [item for item in history_items if method is None or item["method"] == method]
+            elapsed[method] = LoadRun(url, bodies, stats, items, rng=rng, **options).run()
+            if sampler:
+                sampler.sample()
+                memory[method] = sampler.summary(start)
+
+    total_elapsed = sum(elapsed.values())
+    groups = []
+    for (endpoint, method), group in sorted(stats.groups.items(), key=lambda item: (str(item[0][1]), item[0][0])):
+        row = {"endpoint": endpoint, "method": method}
+        row.update(summarize([group], elapsed.get(method if isolate else None, total_elapsed)))
+        groups.append(row)
+
+    return {
+        "meta": {
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "url": url,
+            "corpus_size": len(corpus),
+            "isolate": isolate,
+            "seed": seed,
+            **{key: value for key, value in options.items() if key != "rng"}
+        },
+        "elapsed_s": total_elapsed,
+        "total": summarize(list(stats.groups.values()), total_elapsed),
+        "groups": groups,
+        "memory": {
+            "total": sampler.summary(first),
+            "phases": [dict(method=method, **summary) for method, summary in memory.items()
+                       if method is not None and summary]
+        } if sampler else None
+    }
+
+
+def parse_variant(text):
+    """"nombre:CLAVE=valor,CLAVE=valor" -> (nombre, {CLAVE: valor}); los valores se leen como JSON si se puede"""
+    name, _, assignments = text.partition(":")
+    overrides = {}
+    for assignment in filter(None, (part.strip() for part in assignments.split(","))):
+        key, sep, value = assignment.partition("=")
+        if not sep:
+            raise argparse.ArgumentTypeError(f"se esperaba CLAVE=valor: {assignment!r}")
+        try:
+            value = json.loads(value)
+        except ValueError:
+            pass
+        overrides[key.strip()] = value
+    return name or "default", overrides
+
+
+def _mib(value):
+    return f"{value / 2 ** 20:.1f}" if value is not None else "-"
+
+
+def _latency(summary, key):
+    return f"{summary['latency_ms'][key]:.1f}" if "latency_ms" in summary else "-"
+
+
+def format_report(report):
+    lines = [f"{'ruta':18} {'método':24} {'peticiones':>10} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} "
+             f"{'p99 ms':>9} {'errores':>8} {'rechazos':>9}"]
+    total = dict(report["total"], endpoint="total", method="")
+    for row in report["groups"] + [total]:
+        lines.append(
+            f"{row['endpoint']:18} {row['method'] or '-':24} {row['requests']:10} {row['throughput']:8.2f} "
+            f"{_latency(row, 'p50'):>9} {_latency(row, 'p95'):>9} {_latency(row, 'p99'):>9} "
+            f"{row['errors']:8} {row['rejected']:9}"
+        )
+
+    memory = report["memory"]
+    if memory and memory["total"]:
+        lines.append("")
+        lines.append(f"{'memoria (MiB)':43} {'inicio':>8} {'final':>8} {'máximo':>8} {'crecimiento':>12}")
+        for name, summary in [("total", memory["total"])] + [(phase["method"], phase) for phase in memory["phases"]]:
+            lines.append(f"{name:43} {_mib(summary['start_bytes']):>8} {_mib(summary['end_bytes']):>8} "
+                         f"{_mib(summary['peak_bytes']):>8} {_mib(summary['growth_bytes']):>12}")
+    return "\n".join(lines)
+
+
+def format_comparison(reports):
+    lines = [f"{'variante':24} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'error %':>8} "
+             f"{'memoria +MiB':>13}"]
+    for report in reports:
+        total = report["total"]
+        memory = report["memory"] and report["memory"]["total"]
+        lines.append(
+            f"{report['meta']['variant']:24} {total['throughput']:8.2f} {_latency(total, 'p50'):>9} "
+            f"{_latency(total, 'p95'):>9} {_latency(total, 'p99'):>9} {total['error_rate'] * 100:8.2f} "
+            f"{_mib(memory['growth_bytes'] if memory else None):>13}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load", description=__doc__.splitlines()[0])
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--corpus", help="corpus JSONL (un cuerpo de /api/solve por línea)")
+    source.add_argument("--from-history", metavar="DATABASE", help="reproducir los cálculos de un historial SQLite")
+    parser.add_argument("--method", action="append", choices=METHODS, help="limitar a estos métodos")
+    parser.add_argument("--save-corpus", metavar="PATH", help="guardar el corpus usado como JSONL")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="clientes concurrentes")
+    parser.add_argument("--rate", type=float, help="solves por segundo (lazo abierto); sin esto, lazo cerrado")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION, help="segundos de carga (por fase)")
+    parser.add_argument("--requests", type=int, dest="max_requests", help="máximo de solves (por fase)")
+    parser.add_argument("--explain-ratio", type=float, default=EXPLAIN_RATIO,
+                        help="fracción de solves seguidos de /api/explain")
+    parser.add_argument("--history-ratio", type=float, default=HISTORY_RATIO,
+                        help="fracción de solves seguidos de /api/history/<id>")
+    parser.add_argument("--cache-bust", action="store_true", help="evitar la caché de soluciones del servidor")
+    parser.add_argument("--isolate", action="store_true",
+                        help="una fase por método, para medir la memoria de cada uno")
+    parser.add_argument("--seed", type=int, default=0, help="semilla de las llegadas y las consultas")
+    parser.add_argument("--url", help="usar un servidor ya en marcha en lugar de arrancar uno")
+    parser.add_argument("--pid", type=int, help="pid del servidor de --url (para medir su memoria)")
+    parser.add_argument("--variant", action="append", type=parse_variant, metavar="NOMBRE[:CLAVE=valor,...]",
+                        help="configuración del servidor a comparar (se puede repetir)")
+    parser.add_argument("--json", action="store_true", help="imprimir los informes en JSON")
+    parser.add_argument("-o", "--output", help="guardar los informes JSON en este archivo")
+    args = parser.parse_args(argv)
+
+    if args.url and args.variant:
+        parser.error("--variant arranca sus propios servidores: no se combina con --url")
+
+    if args.corpus:
+        corpus = load_corpus(args.corpus)
+    elif args.from_history:
+        corpus = history_corpus(args.from_history)
+    else:
+        corpus = standard_corpus()
+    if args.method:
+        corpus = [body for body in corpus if body.get("method") in args.method]
+    if args.save_corpus:
+        with open(args.save_corpus, "w") as f:
+            f.writelines(json.dumps(body) + "\n" for body in corpus)
+
+    options = dict(concurrency=args.concurrency, rate=args.rate, duration=args.duration,
+                   max_requests=args.max_requests, explain_ratio=args.explain_ratio,
+                   history_ratio=args.history_ratio, cache_bust=args.cache_bust)
+
+    reports = []
+    if args.url:
+        report = run_load(args.url.rstrip("/"), corpus, pid=args.pid, isolate=args.isolate, seed=args.seed,
+                          **options)
+        report["meta"].update(variant="url", overrides={})
+        reports.append(report)
+    else:
+        for name, overrides in args.variant or [("default", {})]:
+            with LocalServer(overrides) as server:
+                report = run_load(server.url, corpus, pid=server.pid, isolate=args.isolate, seed=args.seed,
+                                  **options)
+            report["meta"].update(variant=name, overrides=overrides)
+            reports.append(report)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"reports": reports}, f, indent=2)
+
+    if args.json:
+        print(json.dumps({"reports": reports}, indent=2))
+        return 0
+
+    for report in reports:
+        print(f"== {report['meta']['variant']} ==")
+        print(format_report(report))
+        print()
+    if len(reports) > 1:
+        print(format_comparison(reports))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
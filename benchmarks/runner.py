@@ -0,0 +1,248 @@
+# benchmarks/runner.py
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import sympy as sp
+
+from app.numerical_methods.utils import compile_function, evaluate_function, clear_compile_cache
+from app.services.plotting import (generate_plot_data, generate_plot, sample_curves,
+                                   BRACKETING_METHODS, TANGENT_METHODS, FIXED_POINT_METHODS, SYSTEM_METHODS)
+from app.services.solver import solve_problem, solution_payload
+from app.services.transport import packb, compress
+from benchmarks.corpus import CASES, PIPELINE_FUNCTION
+
+# Todos los métodos del solver, en el orden del formulario
+METHODS = BRACKETING_METHODS + TANGENT_METHODS + ["secant"] + FIXED_POINT_METHODS + ["all_roots"] + SYSTEM_METHODS
+
+# Parámetros comunes de los problemas del corpus
+TOLERANCE = 1e-10
+MAX_ITERATIONS = 200
+
+# Variación (relativa) del tiempo a partir de la cual se marca una regresión
+DEFAULT_THRESHOLD = 0.10
+
+# Arranque en frío medido en un intérprete nuevo: importaciones de la aplicación y calentamiento
+STARTUP_SCRIPT = """
+import json, resource
+from app.services.startup import startup_report, warm_up_process
+import app.controllers.api_controller
+startup_report.mark("imports")
+heavy = startup_report.heavy_modules()
+with startup_report.phase("warmup"):
+    warm_up_process()
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+print(json.dumps(dict(startup_report.as_dict(), heavy_at_import=heavy, peak_bytes=peak)))
+"""
+
+# Duración mínima de cada ronda de medición: las llamadas rápidas se repiten hasta llenarla
+MIN_ROUND_TIME = 0.01
+
+
+def calibrate(func):
+    """Número de llamadas necesario para que una ronda dure al menos MIN_ROUND_TIME"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - start >= MIN_ROUND_TIME:
+            return number
+        number *= 2
+
+
+def time_call(func, repeat=5, number=None):
+    """Tiempo por llamada (segundos): mediana y mínimo de `repeat` rondas de `number` llamadas"""
+    if number is None:
+        number = calibrate(func)
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    return {"time_s": statistics.median(samples), "time_min_s": min(samples)}
+
+
+def peak_memory(func):
+    """Memoria máxima (bytes) reservada durante una llamada"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def problem_for(method, case):
+    """Datos del problema para un método, o None si el caso no aplica (punto fijo sin g, todas las raíces sin polinomio)"""
+    # Los sistemas solo se resuelven con los métodos para sistemas, y viceversa
+    if (method in SYSTEM_METHODS) != (case["category"] == "sistema"):
+        return None
+    if method in FIXED_POINT_METHODS and not case.get("g_function"):
+        return None
+    if method == "all_roots" and compile_function(case["function"]).coefficients is None:
+        return None
+    data = {"method": method, "tolerance": TOLERANCE, "max_iterations": MAX_ITERATIONS}
+    data.update({key: value for key, value in case.items() if key not in ("name", "category")})
+    return data
+
+
+def bench_method(method, case, repeat=5):
+    data = problem_for(method, case)
+    record = {"name": f"{method}/{case['name']}", "kind": "solver", "method": method,
+              "case": case["name"], "category": case["category"]}
+
+    # Primera llamada fuera de la medición: deja la función compilada en caché
+    solution = solve_problem(data, include_plot=False)
+    if "error" in solution:
+        record["error"] = solution["error"]
+        return record
+
+    trace = solution["results"]
+    record.update(time_call(lambda: solve_problem(data, include_plot=False), repeat))
+    record.update({
+        "iterations": len(trace),
+        "evaluations": trace.last("evaluations"),
+        "peak_bytes": peak_memory(lambda: solve_problem(data, include_plot=False)),
+        "root": solution["root"],
+        "final_error": trace.last("error")
+    })
+    return record
+
+
+def bench_pipeline(repeat=5):
+    """Mide las etapas compartidas: evaluación, muestreo, datos de gráfica, PNG y serialización"""
+    records = []
+
+    def add(name, func, number=None):
+        record = {"name": name, "kind": "pipeline"}
+        record.update(time_call(func, repeat, number))
+        record["peak_bytes"] = peak_memory(func)
+        records.append(record)
+
+    def cold_evaluate():
+        clear_compile_cache()
+        evaluate_function(PIPELINE_FUNCTION, 1.5)
+
+    evaluate_function(PIPELINE_FUNCTION, 1.5)
+    add("evaluate_function/warm", lambda: evaluate_function(PIPELINE_FUNCTION, 1.5))
+    add("evaluate_function/cold", cold_evaluate, number=1)
+
+    grid = np.linspace(-10, 10, 1000)
+    compiled = compile_function(PIPELINE_FUNCTION)
+    add("vectorized/1000", lambda: compiled.vectorized(grid))
+
+    add("sample_curves", lambda: sample_curves(PIPELINE_FUNCTION, "bisection", a=0, b=2))
+    add("generate_plot_data", lambda: generate_plot_data(PIPELINE_FUNCTION, "bisection", a=0, b=2, root=1.0))
+    add("generate_plot", lambda: generate_plot(PIPELINE_FUNCTION, "bisection", a=0, b=2, root=1.0), number=1)
+
+    data = {"method": "bisection", "function": PIPELINE_FUNCTION, "a": 0, "b": 2,
+            "tolerance": 1e-14, "max_iterations": 200}
+    solution = solve_problem(data)
+    add("serialize/full", lambda: json.dumps(solution_payload(solution)))
+    add("serialize/root_only", lambda: json.dumps(solution_payload(solution, include=())))
+    add("serialize/msgpack", lambda: packb(solution_payload(solution)))
+    add("serialize/json_gzip", lambda: compress(json.dumps(solution_payload(solution)).encode(), "gzip"))
+    return records
+
+
+def bench_startup(repeat=5):
+    """Mide el arranque en frío (importaciones y calentamiento) en `repeat` intérpretes nuevos"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    reports = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT], cwd=root, capture_output=True,
+                                text=True, check=True).stdout
+        reports.append(json.loads(output.splitlines()[-1]))
+
+    records = []
+    for phase in ("imports", "warmup"):
+        samples = [report["phases"][phase] for report in reports]
+        record = {"name": f"startup/{phase}", "kind": "startup",
+                  "time_s": statistics.median(samples), "time_min_s": min(samples),
+                  "peak_bytes": max(report["peak_bytes"] for report in reports)}
+        if phase == "imports":
+            # Módulos pesados cargados solo por importar: deberían diferirse hasta el calentamiento
+            record["heavy_modules"] = reports[-1]["heavy_at_import"]
+        records.append(record)
+    return records
+
+
+def run(repeat=5, methods=None, cases=None, pipeline=True, startup=True):
+    """Ejecuta la suite completa y devuelve el informe (serializable a JSON)"""
+    results = []
+    for case in CASES:
+        if cases and case["name"] not in cases:
+            continue
+        for method in METHODS:
+            if methods and method not in methods:
+                continue
+            if problem_for(method, case) is not None:
+                results.append(bench_method(method, case, repeat))
+
+    if pipeline:
+        results.extend(bench_pipeline(repeat))
+
+    if startup:
+        results.extend(bench_startup(repeat))
+
+    return {
+        "meta": {
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "sympy": sp.__version__,
+            "machine": platform.machine(),
+            "repeat": repeat
+        },
+        "results": results
+    }
+
+
+def compare(report, baseline, threshold=DEFAULT_THRESHOLD):
+    """Compara un informe con otro guardado.
+
+    Devuelve una fila por medición común con la razón de los tiempos mínimos
+    (los menos afectados por el ruido) y su estado:
+    "regression" (más lento que 1 + threshold), "improvement" (más rápido que
+    1 - threshold), "changed" (cambian iteraciones, evaluaciones o el error) u "ok".
+    """
+    previous = {record["name"]: record for record in baseline["results"]}
+    rows = []
+    for record in report["results"]:
+        before = previous.get(record["name"])
+        if before is None:
+            continue
+
+        row = {"name": record["name"]}
+        if "error" in record or "error" in before:
+            row["status"] = "ok" if record.get("error") == before.get("error") else "changed"
+            rows.append(row)
+            continue
+
+        ratio = record["time_min_s"] / before["time_min_s"] if before["time_min_s"] else float('inf')
+        row.update(ratio=ratio, time_s=record["time_min_s"], baseline_time_s=before["time_min_s"])
+
+        if ratio > 1 + threshold:
+            row["status"] = "regression"
+        elif ratio < 1 - threshold:
+            row["status"] = "improvement"
+        else:
+            row["status"] = "ok"
+
+        for key in ("iterations", "evaluations"):
+            if record.get(key) != before.get(key):
+                row[key] = [before.get(key), record.get(key)]
+                if row["status"] == "ok":
+                    row["status"] = "changed"
+        rows.append(row)
+    return rows
@@ -1,8 +1,66 @@
 # config.py
+import os
+
+BASE_DIR = os.path.abspath(os.path.dirname(__file__))
+
+
 class Config:
     DEBUG = True
     SECRET_KEY = 'metodos_numericos_key'
 
+    # Resolución por lotes (/api/solve/batch)
+    BATCH_WORKERS = None  # None = un proceso por núcleo
+    BATCH_MAX_PROBLEMS = 500
+    BATCH_TIMEOUT = 60  # segundos para todo el lote
+
+    # Historial: 'memory' (por proceso) o 'sqlite' (persistente y compartido)
+    HISTORY_BACKEND = 'memory'
+    HISTORY_DATABASE = os.path.join(BASE_DIR, 'instance', 'history.db')
+
+    # Límites del historial (None = sin límite); max_bytes solo aplica en memoria
+    HISTORY_MAX_ITEMS = 1000
+    HISTORY_MAX_BYTES = 256 * 1024 * 1024
+
+    # Caché de imágenes de /api/plot (PLOT_CACHE_DIR=None desactiva el nivel de disco)
+    PLOT_CACHE_MAX_BYTES = 32 * 1024 * 1024
+    PLOT_CACHE_DIR = None
+    PLOT_CACHE_DISK_MAX_BYTES = 256 * 1024 * 1024
+    PLOT_CACHE_MAX_AGE = 86400  # segundos
+
+    # Caché de soluciones de /api/solve (RESULT_CACHE_MAX_ITEMS=0 la desactiva)
+    RESULT_CACHE_MAX_ITEMS = 1024
+    RESULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+    RESULT_CACHE_TTL = 3600  # segundos
+
+    # Plazos y presupuestos (None = sin límite). Con SOLVE_TIMEOUT, /api/solve resuelve
+    # en procesos supervisados que se terminan al vencer el plazo; PLOT_TIMEOUT hace
+    # lo mismo con las imágenes de /api/plot
+    SOLVE_TIMEOUT = 10  # segundos
+    SOLVE_MAX_EVALUATIONS = 10000
+    SOLVE_WORKERS = 2
+    PLOT_TIMEOUT = 20  # segundos
+
+    # Etapas concurrentes de /api/solve: hilos para el historial y procesos que dibujan
+    # las imágenes por adelantado (PLOT_PRERENDER_WORKERS=0 o PLOT_PRERENDER=False lo desactiva)
+    PIPELINE_THREADS = 4
+    PLOT_PRERENDER = True
+    PLOT_PRERENDER_WORKERS = 1
+    PLOT_PRERENDER_MAX_PENDING = 16
+
+    # Compresión gzip/brotli de las respuestas de al menos COMPRESS_MIN_SIZE bytes (None la desactiva)
+    COMPRESS_MIN_SIZE = 1024
+    COMPRESS_LEVEL = 6
+
+    # Calentamiento antes de aceptar tráfico: sympy, lambdify y matplotlib en este proceso y,
+    # con WARMUP_WORKERS, en los procesos supervisados y de dibujo (WARMUP_TIMEOUT por etapa)
+    WARMUP = True
+    WARMUP_WORKERS = True
+    WARMUP_TIMEOUT = 30  # segundos
+
+    # Métricas: cabecera Server-Timing y muestras por serie para los percentiles de /api/metrics
+    SERVER_TIMING = True
+    METRICS_WINDOW = 1024
+
 
 class DevelopmentConfig(Config):
     pass
@@ -10,6 +68,9 @@ class DevelopmentConfig(Config):
 
 class ProductionConfig(Config):
     DEBUG = False
+    HISTORY_BACKEND = 'sqlite'
+    HISTORY_MAX_ITEMS = 100000
+    PLOT_CACHE_DIR = os.path.join(BASE_DIR, 'instance', 'plots')
 
 
 config = {
@@ -198,6 +198,9 @@ document.addEventListener('DOMContentLoaded', function() {
         switch(method) {
             case 'bisection':
             case 'false_position':
+            case 'illinois':
+            case 'anderson_bjorck':
+            case 'brent':
                 // Intervalo [a, b]
                 const colA = document.createElement('div');
                 colA.className = 'col-md-6';
@@ -213,11 +216,25 @@ document.addEventListener('DOMContentLoaded', function() {
                     <input type="number" class="form-control" id="b" required step="any">
                 `;
 
+                // Búsqueda automática de intervalos con cambio de signo
+                const colScan = document.createElement('div');
+                colScan.className = 'col-md-6 mt-2';
+                colScan.innerHTML = `
+                    <label for="scan" class="form-label">Búsqueda de intervalos:</label>
+                    <select class="form-select" id="scan">
+                        <option value="">Usar [a, b] tal cual</option>
+                        <option value="auto">Buscar un intervalo si [a, b] no cambia de signo</option>
+                        <option value="all">Todas las raíces del intervalo</option>
+                    </select>
+                `;
+
                 row.appendChild(colA);
                 row.appendChild(colB);
+                row.appendChild(colScan);
                 break;
 
             case 'fixed_point':
+            case 'steffensen':
                 // Punto inicial x0 y función g(x)
                 const colX0FP = document.createElement('div');
                 colX0FP.className = 'col-md-6';
@@ -239,6 +256,8 @@ document.addEventListener('DOMContentLoaded', function() {
                 break;
 
             case 'newton_raphson':
+            case 'halley':
+            case 'modified_newton':
                 // Punto inicial x0
                 const colX0NR = document.createElement('div');
                 colX0NR.className = 'col-md-6 mx-auto';
@@ -269,6 +288,39 @@ document.addEventListener('DOMContentLoaded', function() {
                 row.appendChild(colX0S);
                 row.appendChild(colX1);
                 break;
+
+            case 'newton_system':
+                // Las ecuaciones van en el campo de la función, separadas por ';'
+                const colX0Sys = document.createElement('div');
+                colX0Sys.className = 'col-md-4';
+                colX0Sys.innerHTML = `
+                    <label for="x0" class="form-label">Punto inicial (x0):</label>
+                    <input type="text" class="form-control" id="x0" required placeholder="Ejemplo: 1, 1">
+                    <small class="text-muted">Escriba las ecuaciones separadas por ';' (x**2 + y**2 - 4; x*y - 1)</small>
+                `;
+
+                const colVariables = document.createElement('div');
+                colVariables.className = 'col-md-4';
+                colVariables.innerHTML = `
+                    <label for="variables" class="form-label">Variables (opcional):</label>
+                    <input type="text" class="form-control" id="variables" placeholder="Ejemplo: x, y">
+                    <small class="text-muted">Orden de las componentes de x0</small>
+                `;
+
+                const colJacobian = document.createElement('div');
+                colJacobian.className = 'col-md-4';
+                colJacobian.innerHTML = `
+                    <label for="jacobian" class="form-label">Jacobiano:</label>
+                    <select class="form-select" id="jacobian">
+                        <option value="exact">Exacto en cada iteración</option>
+                        <option value="broyden">Actualizaciones de Broyden</option>
+                    </select>
+                `;
+
+                row.appendChild(colX0Sys);
+                row.appendChild(colVariables);
+                row.appendChild(colJacobian);
+                break;
         }
 
         paramsContainer.appendChild(row);
@@ -287,18 +339,25 @@ document.addEventListener('DOMContentLoaded', function() {
         switch(method) {
             case 'bisection':
             case 'false_position':
+            case 'illinois':
+            case 'anderson_bjorck':
+            case 'brent':
                 const a = document.getElementById('a');
                 const b = document.getElementById('b');
                 isValid = isValid && a && b && a.value !== '' && b.value !== '';
                 break;
 
             case 'fixed_point':
+            case 'steffensen':
                 const x0FP = document.getElementById('x0');
                 const g = document.getElementById('g_function');
                 isValid = isValid && x0FP && g && x0FP.value !== '' && g.value !== '';
                 break;
 
             case 'newton_raphson':
+            case 'halley':
+            case 'modified_newton':
+            case 'newton_system':
                 const x0NR = document.getElementById('x0');
                 isValid = isValid && x0NR && x0NR.value !== '';
                 break;
@@ -342,16 +401,25 @@ document.addEventListener('DOMContentLoaded', function() {
         switch(method) {
             case 'bisection':
             case 'false_position':
+            case 'illinois':
+            case 'anderson_bjorck':
+            case 'brent':
                 data.a = parseFloat(document.getElementById('a').value);
                 data.b = parseFloat(document.getElementById('b').value);
+                if (document.getElementById('scan').value) {
+                    data.scan = document.getElementById('scan').value;
+                }
                 break;
 
             case 'fixed_point':
+            case 'steffensen':
                 data.x0 = parseFloat(document.getElementById('x0').value);
                 data.g_function = document.getElementById('g_function').value;
                 break;
 
             case 'newton_raphson':
+            case 'halley':
+            case 'modified_newton':
                 data.x0 = parseFloat(document.getElementById('x0').value);
                 break;
 
@@ -359,6 +427,20 @@ document.addEventListener('DOMContentLoaded', function() {
                 data.x0 = parseFloat(document.getElementById('x0').value);
                 data.x1 = parseFloat(document.getElementById('x1').value);
                 break;
+
+            case 'newton_system':
+                data.x0 = document.getElementById('x0').value.split(',').map(parseFloat);
+                if (document.getElementById('variables').value.trim()) {
+                    data.variables = document.getElementById('variables').value;
+                }
+                data.jacobian = document.getElementById('jacobian').value;
+                break;
+        }
+
+        // Con el visualizador disponible, recibir las iteraciones en streaming (los sistemas no tienen gráfica que animar)
+        if (visualizer && method !== 'newton_system' && window.ReadableStream && window.TextDecoder) {
+            streamRoot(data);
+            return;
         }
 
         // Mostrar indicador de carga
@@ -371,11 +453,12 @@ document.addEventListener('DOMContentLoaded', function() {
         fetch('/api/solve', {
             method: 'POST',
             headers: {
-                'Content-Type': 'application/json'
+                'Content-Type': 'application/json',
+                'Accept': MSGPACK_ACCEPT
             },
             body: JSON.stringify(data)
         })
-        .then(response => response.json())
+        .then(response => MsgPack.fromResponse(response))
         .then(data => {
             // Eliminar indicador de carga
             loadingIndicator.remove();
@@ -399,12 +482,155 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     }
 
+    // Calcular la raíz recibiendo cada iteración en cuanto el servidor la calcula (NDJSON)
+    function streamRoot(data) {
+        const method = data.method;
+        let started = false;
+
+        const loadingIndicator = document.createElement('div');
+        loadingIndicator.className = 'loading-indicator';
+        loadingIndicator.innerHTML = '<div class="spinner-border text-primary" role="status"><span class="visually-hidden">Calculando...</span></div>';
+        form.appendChild(loadingIndicator);
+
+        function handleEvent(event) {
+            switch (event.type) {
+                case 'plot':
+                    // Mostrar la gráfica y empezar la animación sin esperar al final del cálculo
+                    loadingIndicator.remove();
+                    started = true;
+                    resultsTable.innerHTML = '';
+                    rootValue.textContent = '...';
+                    if (explainButton) explainButton.disabled = true;
+                    visualizer.startStream(event.plot_data, method);
+                    [playButton, stepForwardButton, stepBackButton, resetButton].forEach(button => {
+                        if (button) button.disabled = false;
+                    });
+                    showResultsSection();
+                    visualizer.playAnimation();
+                    if (playButton) playButton.innerHTML = '<i class="fas fa-pause"></i> Pausar';
+                    break;
+
+                case 'iteration':
+                    visualizer.appendIteration(event.result, event.animation);
+                    appendResultRow(event.result);
+                    break;
+
+                case 'done':
+                    visualizer.finishStream(event.root);
+                    currentCalculationId = event.calc_id;
+                    rootValue.textContent = formatRoot(event.root);
+                    if (explainButton) explainButton.disabled = false;
+                    break;
+
+                case 'error':
+                    loadingIndicator.remove();
+                    if (started) {
+                        visualizer.finishStream(null);
+                        resultsSection.style.display = 'none';
+                        form.parentElement.parentElement.style.display = 'block';
+                    }
+                    showError(event.error);
+                    break;
+            }
+        }
+
+        fetch('/api/solve/stream', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'Accept': 'application/x-ndjson'
+            },
+            body: JSON.stringify(data)
+        })
+        .then(response => {
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+
+            // Leer el cuerpo por fragmentos y procesar cada línea JSON completa
+            function read() {
+                return reader.read().then(({ done, value }) => {
+                    buffer += decoder.decode(value || new Uint8Array(), { stream: !done });
+                    const lines = buffer.split('\n');
+                    buffer = lines.pop();
+                    lines.filter(line => line.trim()).forEach(line => handleEvent(JSON.parse(line)));
+
+                    if (done) {
+                        if (buffer.trim()) handleEvent(JSON.parse(buffer));
+                        return;
+                    }
+                    return read();
+                });
+            }
+
+            return read();
+        })
+        .catch(error => {
+            loadingIndicator.remove();
+            showError('Error de conexión: ' + error.message);
+        });
+    }
+
+    // Agregar una fila a la tabla de resultados
+    function appendResultRow(row) {
+        const tr = document.createElement('tr');
+
+        // Iteración
+        const tdIteracion = document.createElement('td');
+        tdIteracion.textContent = row.iteration;
+        tr.appendChild(tdIteracion);
+
+        // a
+        const tdA = document.createElement('td');
+        tdA.textContent = row.a !== null ? row.a.toFixed(6) : '-';
+        tr.appendChild(tdA);
+
+        // b
+        const tdB = document.createElement('td');
+        tdB.textContent = row.b !== null ? row.b.toFixed(6) : '-';
+        tr.appendChild(tdB);
+
+        // xr
+        const tdXr = document.createElement('td');
+        tdXr.textContent = row.xr.toFixed(6);
+        tr.appendChild(tdXr);
+
+        // f(xr)
+        const tdFxr = document.createElement('td');
+        tdFxr.textContent = row['f(xr)'].toFixed(6);
+        tr.appendChild(tdFxr);
+
+        // Error
+        const tdError = document.createElement('td');
+        tdError.textContent = row.error.toFixed(6);
+        tr.appendChild(tdError);
+
+        // Evaluaciones acumuladas de la función
+        const tdEvaluations = document.createElement('td');
+        tdEvaluations.textContent = row.evaluations !== undefined ? row.evaluations : '-';
+        tr.appendChild(tdEvaluations);
+
+        resultsTable.appendChild(tr);
+    }
+
+    // Texto de la solución: un número o, en los sistemas, un vector
+    function formatRoot(root) {
+        if (root === null) return 'Sin raíces reales';
+        return Array.isArray(root) ? `(${root.map(value => value.toFixed(6)).join(', ')})` : root.toFixed(6);
+    }
+
     // Función para mostrar resultados
     function showResults(data) {
         // Mostrar la gráfica estática
-        if (plotContainer && !visualizer) {
+        if (plotContainer && !data.plot_data && methodSelect.value === 'newton_system') {
+            // Los sistemas de ecuaciones no tienen gráfica: solo la tabla de iteraciones
+            plotContainer.innerHTML = '<p class="text-muted">Los sistemas de ecuaciones no tienen gráfica. En la tabla, xr es ||x|| y f(xr) es ||F(x)||.</p>';
+            [playButton, stepForwardButton, stepBackButton, resetButton].forEach(button => {
+                if (button) button.disabled = true;
+            });
+        } else if (plotContainer && !visualizer) {
             // Si no tenemos visualizador, mostrar la imagen estática
-            plotContainer.innerHTML = `<img src="data:image/png;base64,${data.plot_img}" class="img-fluid" alt="Gráfica">`;
+            plotContainer.innerHTML = `<img src="${data.plot_url}" class="img-fluid" alt="Gráfica">`;
         } else if (visualizer) {
             // Si tenemos visualizador, cargar los datos para la animación
             visualizer.loadData(
@@ -428,50 +654,21 @@ document.addEventListener('DOMContentLoaded', function() {
 
         // Llenar la tabla de resultados
         resultsTable.innerHTML = '';
-        data.results.forEach(row => {
-            const tr = document.createElement('tr');
-
-            // Iteración
-            const tdIteracion = document.createElement('td');
-            tdIteracion.textContent = row.iteration;
-            tr.appendChild(tdIteracion);
-
-            // a
-            const tdA = document.createElement('td');
-            tdA.textContent = row.a !== null ? row.a.toFixed(6) : '-';
-            tr.appendChild(tdA);
-
-            // b
-            const tdB = document.createElement('td');
-            tdB.textContent = row.b !== null ? row.b.toFixed(6) : '-';
-            tr.appendChild(tdB);
-
-            // xr
-            const tdXr = document.createElement('td');
-            tdXr.textContent = row.xr.toFixed(6);
-            tr.appendChild(tdXr);
-
-            // f(xr)
-            const tdFxr = document.createElement('td');
-            tdFxr.textContent = row['f(xr)'].toFixed(6);
-            tr.appendChild(tdFxr);
-
-            // Error
-            const tdError = document.createElement('td');
-            tdError.textContent = row.error.toFixed(6);
-            tr.appendChild(tdError);
-
-            resultsTable.appendChild(tr);
-        });
+        data.results.forEach(appendResultRow);
 
         // Mostrar la raíz encontrada
-        rootValue.textContent = data.root.toFixed(6);
+        rootValue.textContent = formatRoot(data.root);
 
         // Habilitar el botón de explicación
         if (explainButton) {
             explainButton.disabled = false;
         }
 
+        showResultsSection();
+    }
+
+    // Ocultar el formulario y mostrar la sección de resultados
+    function showResultsSection() {
         // Limpiar contenedor de explicación
         if (explanationContainer) {
             explanationContainer.innerHTML = '<p class="text-muted">Haz clic en "Generar Explicación" para obtener una interpretación del resultado.</p>';
@@ -558,8 +755,8 @@ document.addEventListener('DOMContentLoaded', function() {
 
     // Cargar un elemento del historial
     function loadHistoryItem(id) {
-        fetch(`/api/history/${id}`)
-            .then(response => response.json())
+        fetch(`/api/history/${id}`, { headers: { 'Accept': MSGPACK_ACCEPT } })
+            .then(response => MsgPack.fromResponse(response))
             .then(data => {
                 if (data.error) {
                     showError(data.error);
@@ -580,16 +777,23 @@ document.addEventListener('DOMContentLoaded', function() {
                     switch(data.method) {
                         case 'bisection':
                         case 'false_position':
+                        case 'illinois':
+                        case 'anderson_bjorck':
+                        case 'brent':
                             document.getElementById('a').value = params.a;
                             document.getElementById('b').value = params.b;
+                            document.getElementById('scan').value = params.scan || '';
                             break;
 
                         case 'fixed_point':
+                        case 'steffensen':
                             document.getElementById('x0').value = params.x0;
                             document.getElementById('g_function').value = params.g_function;
                             break;
 
                         case 'newton_raphson':
+                        case 'halley':
+                        case 'modified_newton':
                             document.getElementById('x0').value = params.x0;
                             break;
 
@@ -597,6 +801,12 @@ document.addEventListener('DOMContentLoaded', function() {
                             document.getElementById('x0').value = params.x0;
                             document.getElementById('x1').value = params.x1;
                             break;
+
+                        case 'newton_system':
+                            document.getElementById('x0').value = [].concat(params.x0).join(', ');
+                            document.getElementById('variables').value = [].concat(params.variables || []).join(', ');
+                            document.getElementById('jacobian').value = params.jacobian || 'exact';
+                            break;
                     }
 
                     document.getElementById('tolerance').value = params.tolerance;
@@ -0,0 +1,134 @@
+/**
+ * Decodificador MessagePack para las respuestas binarias de la API
+ * Los arreglos numéricos empaquetados (extensiones 1 y 2) se entregan
+ * directamente como Float64Array / Float32Array, listos para Plotly
+ */
+
+const MsgPack = (() => {
+    // Tipos de extensión definidos en app/services/transport.py
+    const EXT_FLOAT64_ARRAY = 1;
+    const EXT_FLOAT32_ARRAY = 2;
+
+    const LITTLE_ENDIAN = new Uint8Array(new Uint16Array([1]).buffer)[0] === 1;
+    const textDecoder = new TextDecoder('utf-8');
+
+    function decode(buffer) {
+        const bytes = buffer instanceof Uint8Array ? buffer : new Uint8Array(buffer);
+        const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+        let offset = 0;
+
+        function str(length) {
+            const value = textDecoder.decode(bytes.subarray(offset, offset + length));
+            offset += length;
+            return value;
+        }
+
+        function bin(length) {
+            const value = bytes.slice(offset, offset + length);
+            offset += length;
+            return value;
+        }
+
+        function array(length) {
+            const value = new Array(length);
+            for (let i = 0; i < length; i++) value[i] = read();
+            return value;
+        }
+
+        function map(length) {
+            const value = {};
+            for (let i = 0; i < length; i++) {
+                const key = read();
+                value[key] = read();
+            }
+            return value;
+        }
+
+        function ext(length) {
+            const type = view.getInt8(offset);
+            offset += 1;
+            const start = bytes.byteOffset + offset;
+            offset += length;
+
+            if (type === EXT_FLOAT64_ARRAY || type === EXT_FLOAT32_ARRAY) {
+                const size = type === EXT_FLOAT64_ARRAY ? 8 : 4;
+                const count = length / size;
+                // Copia alineada del bloque; en equipos big-endian se lee valor por valor
+                if (LITTLE_ENDIAN) {
+                    const copy = bytes.buffer.slice(start, start + length);
+                    return size === 8 ? new Float64Array(copy) : new Float32Array(copy);
+                }
+                const values = size === 8 ? new Float64Array(count) : new Float32Array(count);
+                for (let i = 0; i < count; i++) {
+                    values[i] = size === 8 ? view.getFloat64(start - bytes.byteOffset + i * 8, true)
+                                           : view.getFloat32(start - bytes.byteOffset + i * 4, true);
+                }
+                return values;
+            }
+            return { type: type, data: bytes.slice(start - bytes.byteOffset, start - bytes.byteOffset + length) };
+        }
+
+        function read() {
+            const byte = bytes[offset++];
+
+            if (byte < 0x80) return byte;
+            if (byte < 0x90) return map(byte & 0x0f);
+            if (byte < 0xa0) return array(byte & 0x0f);
+            if (byte < 0xc0) return str(byte & 0x1f);
+            if (byte >= 0xe0) return byte - 0x100;
+
+            let value;
+            switch (byte) {
+                case 0xc0: return null;
+                case 0xc2: return false;
+                case 0xc3: return true;
+                case 0xc4: { const n = view.getUint8(offset); offset += 1; return bin(n); }
+                case 0xc5: { const n = view.getUint16(offset); offset += 2; return bin(n); }
+                case 0xc6: { const n = view.getUint32(offset); offset += 4; return bin(n); }
+                case 0xc7: { const n = view.getUint8(offset); offset += 1; return ext(n); }
+                case 0xc8: { const n = view.getUint16(offset); offset += 2; return ext(n); }
+                case 0xc9: { const n = view.getUint32(offset); offset += 4; return ext(n); }
+                case 0xca: value = view.getFloat32(offset); offset += 4; return value;
+                case 0xcb: value = view.getFloat64(offset); offset += 8; return value;
+                case 0xcc: value = view.getUint8(offset); offset += 1; return value;
+                case 0xcd: value = view.getUint16(offset); offset += 2; return value;
+                case 0xce: value = view.getUint32(offset); offset += 4; return value;
+                case 0xcf: value = Number(view.getBigUint64(offset)); offset += 8; return value;
+                case 0xd0: value = view.getInt8(offset); offset += 1; return value;
+                case 0xd1: value = view.getInt16(offset); offset += 2; return value;
+                case 0xd2: value = view.getInt32(offset); offset += 4; return value;
+                case 0xd3: value = Number(view.getBigInt64(offset)); offset += 8; return value;
+                case 0xd4: return ext(1);
+                case 0xd5: return ext(2);
+                case 0xd6: return ext(4);
+                case 0xd7: return ext(8);
+                case 0xd8: return ext(16);
+                case 0xd9: { const n = view.getUint8(offset); offset += 1; return str(n); }
+                case 0xda: { const n = view.getUint16(offset); offset += 2; return str(n); }
+                case 0xdb: { const n = view.getUint32(offset); offset += 4; return str(n); }
+                case 0xdc: { const n = view.getUint16(offset); offset += 2; return array(n); }
+                case 0xdd: { const n = view.getUint32(offset); offset += 4; return array(n); }
+                case 0xde: { const n = view.getUint16(offset); offset += 2; return map(n); }
+                case 0xdf: { const n = view.getUint32(offset); offset += 4; return map(n); }
+                default:
+                    throw new Error(`Byte MessagePack no válido: 0x${byte.toString(16)}`);
+            }
+        }
+
+        return read();
+    }
+
+    // Decodifica una respuesta de fetch según su tipo de contenido (MessagePack o JSON)
+    function fromResponse(response) {
+        const contentType = response.headers.get('Content-Type') || '';
+        if (contentType.includes('msgpack')) {
+            return response.arrayBuffer().then(decode);
+        }
+        return response.json();
+    }
+
+    return { decode, fromResponse };
+})();
+
+// Cabeceras para pedir respuestas en MessagePack (con JSON como alternativa)
+const MSGPACK_ACCEPT = 'application/msgpack, application/json;q=0.9';
@@ -27,6 +27,7 @@ class NumericalMethodsVisualizer {
         this.iterations = [];
         this.animationData = [];
         this.method = '';
+        this.streaming = false;
 
         // Inicializar la visualización vacía
         this.initPlot();
@@ -70,6 +71,7 @@ class NumericalMethodsVisualizer {
 
     // Cargar nuevos datos para visualizar
     loadData(plotData, iterations, animationData, method) {
+        this.streaming = false;
         this.plotData = plotData;
         this.iterations = iterations || [];
         this.animationData = animationData || [];
@@ -84,6 +86,28 @@ class NumericalMethodsVisualizer {
         this.drawInitialPlot();
     }
 
+    // Iniciar una visualización en streaming: las iteraciones llegan mientras el servidor calcula
+    startStream(plotData, method) {
+        this.loadData(plotData, [], [], method);
+        this.streaming = true;
+    }
+
+    // Agregar una iteración recibida del servidor
+    appendIteration(iteration, animPoint) {
+        this.iterations.push(iteration);
+        this.animationData.push(animPoint);
+        this.animationState.totalSteps = this.iterations.length;
+    }
+
+    // Terminar el streaming y marcar la raíz encontrada
+    finishStream(root) {
+        this.streaming = false;
+        if (this.plotData) {
+            this.plotData.root = root;
+            this.plotData.iterations = this.iterations;
+        }
+    }
+
     // Dibujar la gráfica inicial sin iteraciones
     drawInitialPlot() {
         if (!this.plotData) return;
@@ -101,7 +125,7 @@ class NumericalMethodsVisualizer {
         }];
 
         // Si es método de punto fijo, agregar g(x) y y=x
-        if (this.method === 'fixed_point' && this.plotData.g_values) {
+        if (['fixed_point', 'steffensen'].includes(this.method) && this.plotData.g_values) {
             // Gráfica de g(x)
             traces.push({
                 x: x,
@@ -186,7 +210,7 @@ class NumericalMethodsVisualizer {
         let updatedTraces = [...traces]; // Copia para trabajar
 
         // Eliminar los trazos de animación previos (posición 3 en adelante, dejando función, g(x) y y=x)
-        const baseTraces = this.method === 'fixed_point' ? 4 : 2;
+        const baseTraces = ['fixed_point', 'steffensen'].includes(this.method) ? 4 : 2;
         if (updatedTraces.length > baseTraces) {
             updatedTraces = updatedTraces.slice(0, baseTraces);
         }
@@ -215,6 +239,9 @@ class NumericalMethodsVisualizer {
         switch(this.method) {
             case 'bisection':
             case 'false_position':
+            case 'illinois':
+            case 'anderson_bjorck':
+            case 'brent':
                 // Marcar los extremos del intervalo
                 traces.push({
                     x: [iteration.a, iteration.b],
@@ -254,8 +281,8 @@ class NumericalMethodsVisualizer {
                     showlegend: false
                 });
 
-                // Si es falsa posición, mostrar la recta secante
-                if (this.method === 'false_position' && animPoint) {
+                // Si es falsa posición (o una de sus variantes), mostrar la recta secante
+                if (['false_position', 'illinois', 'anderson_bjorck'].includes(this.method) && animPoint) {
                     const xa = iteration.a;
                     const xb = iteration.b;
 
@@ -288,6 +315,7 @@ class NumericalMethodsVisualizer {
                 break;
 
             case 'fixed_point':
+            case 'steffensen':
                 if (iteration.x_prev === undefined) return traces;
 
                 const x_prev = iteration.x_prev;
@@ -330,6 +358,8 @@ class NumericalMethodsVisualizer {
                 break;
 
             case 'newton_raphson':
+            case 'halley':
+            case 'modified_newton':
                 if (iteration.f_prime_x === undefined) return traces;
 
                 // Calcular puntos para la tangente
@@ -475,6 +505,38 @@ class NumericalMethodsVisualizer {
                     showlegend: step === 0
                 });
                 break;
+
+            case 'all_roots': {
+                // Raíces reales encontradas hasta este paso (las complejas no se ven en el eje x)
+                const found = this.iterations.slice(0, step + 1).filter(row => row.imag === 0);
+                if (found.length > 0) {
+                    traces.push({
+                        x: found.map(row => row.xr),
+                        y: found.map(() => 0),
+                        type: 'scatter',
+                        mode: 'markers',
+                        name: 'Raíces reales',
+                        marker: { color: 'green', size: 9 },
+                        showlegend: step === 0
+                    });
+                }
+
+                // La raíz actual; si es compleja se marca su parte real
+                traces.push({
+                    x: [iteration.xr],
+                    y: [0],
+                    type: 'scatter',
+                    mode: 'markers',
+                    name: iteration.imag === 0 ? 'Raíz actual' : 'Parte real (raíz compleja)',
+                    marker: {
+                        color: 'red',
+                        size: 11,
+                        symbol: iteration.imag === 0 ? 'star' : 'x'
+                    },
+                    showlegend: step === 0
+                });
+                break;
+            }
         }
 
         return traces;
@@ -499,6 +561,9 @@ class NumericalMethodsVisualizer {
         switch(this.method) {
             case 'bisection':
             case 'false_position':
+            case 'illinois':
+            case 'anderson_bjorck':
+            case 'brent':
                 infoHTML += `
                     <tr>
                         <th>Intervalo [a, b]</th>
@@ -508,6 +573,8 @@ class NumericalMethodsVisualizer {
                 break;
 
             case 'newton_raphson':
+            case 'halley':
+            case 'modified_newton':
                 if (iteration.f_prime_x !== undefined) {
                     infoHTML += `
                         <tr>
@@ -516,6 +583,14 @@ class NumericalMethodsVisualizer {
                         </tr>
                     `;
                 }
+                if (iteration.f_second_x !== undefined) {
+                    infoHTML += `
+                        <tr>
+                            <th>f''(x)</th>
+                            <td>${iteration.f_second_x.toFixed(6)}</td>
+                        </tr>
+                    `;
+                }
                 break;
 
             case 'secant':
@@ -526,6 +601,19 @@ class NumericalMethodsVisualizer {
                     </tr>
                 `;
                 break;
+
+            case 'all_roots':
+                infoHTML += `
+                    <tr>
+                        <th>Parte imaginaria</th>
+                        <td>${iteration.imag.toFixed(6)}</td>
+                    </tr>
+                    <tr>
+                        <th>Multiplicidad</th>
+                        <td>${iteration.multiplicity}</td>
+                    </tr>
+                `;
+                break;
         }
 
         // Campos comunes a todos los métodos
@@ -557,6 +645,8 @@ class NumericalMethodsVisualizer {
                 break;
 
             case 'false_position':
+            case 'illinois':
+            case 'anderson_bjorck':
                 stepDescription = `
                     <p>Se calcula el punto de corte de la recta que une los extremos del intervalo con el eje x.</p>
                     <p>El nuevo punto xr = ${iteration.xr.toFixed(6)} tiene f(xr) = ${iteration['f(xr)'].toFixed(6)}.</p>
@@ -564,7 +654,16 @@ class NumericalMethodsVisualizer {
                 `;
                 break;
 
+            case 'brent':
+                stepDescription = `
+                    <p>Se estima la raíz por interpolación cuadrática inversa o secante, o por bisección si la estimación sale del intervalo.</p>
+                    <p>El nuevo punto xr = ${iteration.xr.toFixed(6)} tiene f(xr) = ${iteration['f(xr)'].toFixed(6)}.</p>
+                    <p>Para la siguiente iteración, se conserva el subintervalo donde la función cambia de signo.</p>
+                `;
+                break;
+
             case 'fixed_point':
+            case 'steffensen':
                 stepDescription = `
                     <p>Se calcula g(x) para el valor actual de x.</p>
                     <p>El nuevo valor de x es ${iteration.xr.toFixed(6)} con f(x) = ${iteration['f(xr)'].toFixed(6)}.</p>
@@ -573,6 +672,8 @@ class NumericalMethodsVisualizer {
                 break;
 
             case 'newton_raphson':
+            case 'halley':
+            case 'modified_newton':
                 let nextPointMsg = '';
                 if (iteration.x_next !== undefined) {
                     nextPointMsg = `<p>El próximo valor de x será ${iteration.x_next.toFixed(6)}.</p>`;
@@ -592,6 +693,16 @@ class NumericalMethodsVisualizer {
                     <p>El error relativo es ${iteration.error.toFixed(6)}%.</p>
                 `;
                 break;
+
+            case 'all_roots':
+                stepDescription = `
+                    <p>Las raíces se obtienen como valores propios de la matriz compañera del polinomio y se pulen con el método de Newton.</p>
+                    <p>${iteration.imag === 0
+                        ? `La raíz x = ${iteration.xr.toFixed(6)} es real`
+                        : `La raíz ${iteration.xr.toFixed(6)} ${iteration.imag < 0 ? '-' : '+'} ${Math.abs(iteration.imag).toFixed(6)}i es compleja`}
+                       y tiene multiplicidad ${iteration.multiplicity}; |f| en la raíz vale ${iteration['f(xr)'].toExponential(2)}.</p>
+                `;
+                break;
         }
 
         infoHTML += `
@@ -627,14 +738,20 @@ class NumericalMethodsVisualizer {
 
         // Configurar el intervalo para la animación
         this.animationState.intervalId = setInterval(() => {
+            // En streaming, esperar a que llegue la siguiente iteración
+            if (this.animationState.currentStep >= this.iterations.length) {
+                if (!this.streaming) this.pauseAnimation();
+                return;
+            }
+
             // Mostrar el paso actual
             this.updateVisualization(this.animationState.currentStep);
 
             // Avanzar al siguiente paso
             this.animationState.currentStep++;
 
-            // Si se alcanzó el final, detener
-            if (this.animationState.currentStep >= this.iterations.length) {
+            // Si se alcanzó el final, detener (en streaming se espera a la siguiente iteración)
+            if (this.animationState.currentStep >= this.iterations.length && !this.streaming) {
                 this.pauseAnimation();
             }
         }, this.animationState.speed);